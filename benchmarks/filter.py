@@ -0,0 +1,96 @@
+"""
+Compares evaluating filters on every host of a large inventory by parsing their
+rules on each host, like nornir used to, with evaluating the compiled filters::
+
+    PYTHONPATH=. python benchmarks/filter.py --hosts 100000
+"""
+
+import argparse
+import gc
+import time
+
+from nornir.core.filter import F, NOT_F, OR, AND
+from nornir.core.inventory import Defaults, Group, Groups, Host, Hosts, Inventory
+
+
+def build_inventory(hosts: int, groups: int) -> Inventory:
+    defaults = Defaults(data={"domain": "example.com"})
+    g = Groups()
+    for i in range(groups):
+        g[f"group_{i}"] = Group(
+            f"group_{i}", data={"site": f"site_{i % 10}"}, defaults=defaults
+        )
+    h = Hosts()
+    for i in range(hosts):
+        host = Host(
+            f"host_{i}",
+            platform=("ios", "eos", "junos", "nxos")[i % 4],
+            port=22 + i % 3,
+            data={
+                "role": ("core", "edge", "access")[i % 3],
+                "nested": {"rack": i % 40, "tags": ["a", "b", str(i % 7)]},
+            },
+            defaults=defaults,
+        )
+        host.groups.data.append(f"group_{i % groups}")
+        h[host.name] = host
+    return Inventory(hosts=h, groups=g, defaults=defaults)
+
+
+def interpreted(f):
+    """Evaluates the filter parsing its rules on each host"""
+    if isinstance(f, AND):
+        op1, op2 = interpreted(f.op1), interpreted(f.op2)
+        return lambda host: op1(host) and op2(host)
+    if isinstance(f, OR):
+        op1, op2 = interpreted(f.op1), interpreted(f.op2)
+        return lambda host: op1(host) or op2(host)
+    rules = f.filters.items()
+    if isinstance(f, NOT_F):
+        return lambda host: not any(
+            F._verify_rules(host, k.split("__"), v) for k, v in rules
+        )
+    return lambda host: all(F._verify_rules(host, k.split("__"), v) for k, v in rules)
+
+
+def measure(func, hosts, repeat: int = 3) -> float:
+    """Best time of ``repeat`` evaluations on all the hosts, like timeit"""
+    gc.collect()
+    gc.disable()
+    try:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for host in hosts:
+                func(host)
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hosts", type=int, default=100000)
+    parser.add_argument("--groups", type=int, default=300)
+    args = parser.parse_args()
+
+    inventory = build_inventory(args.hosts, args.groups)
+    hosts = list(inventory.hosts.values())
+    filters = {
+        "attribute": F(platform="ios"),
+        "data": F(role="edge", site="site_3"),
+        "nested": F(nested__rack__ge=20) & F(nested__tags__contains="3"),
+        "operators": F(platform__in=["ios", "eos"]) | ~F(port__eq=22),
+        "groups": F(has_parent_group="group_7") | F(groups__contains="group_8"),
+    }
+
+    print(f"{'filter':<12}{'interpreted':>14}{'compiled':>12}{'speedup':>10}")
+    for name, f in filters.items():
+        before = measure(interpreted(f), hosts)
+        after = measure(f, hosts)
+        print(f"{name:<12}{before:>13.3f}s{after:>11.3f}s{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,108 @@
+import asyncio
 import logging
 import logging.config
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional, TYPE_CHECKING, Dict, Any
+import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
+from nornir.core import worker
 from nornir.core.configuration import Config
+from nornir.core.distributed import Coordinator
+from nornir.core.exceptions import NornirSubTaskError
 from nornir.core.inventory import Inventory
-from nornir.core.processor import Processor, Processors
+from nornir.core.journal import RunJournal
+from nornir.core.pool import WorkerPool
+from nornir.core.processor import Processor, Processors, QueuedProcessors
+from nornir.core.result_store import ResultStore
+from nornir.core.scheduler import ConcurrencyLimits, Scheduler, batches
 from nornir.core.state import GlobalState
-from nornir.core.task import AggregatedResult, Task
+from nornir.core.task import AggregatedResult, MultiResult, Task
+from nornir.core.timing import TimingStore
 
 if TYPE_CHECKING:
     from nornir.core.inventory import Host  # noqa: W0611
+    from nornir.core.retry import RetryPolicy  # noqa: W0611
 
 logger = logging.getLogger(__name__)
 
 
+def _expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _host_deadline(task: Task) -> Optional[float]:
+    """Returns the earliest of the ``task_timeout`` of a host starting now and the run's deadline"""
+    deadline = task.deadline
+    if task.task_timeout is not None:
+        host_deadline = time.monotonic() + task.task_timeout
+        if deadline is None or host_deadline < deadline:
+            deadline = host_deadline
+    return deadline
+
+
+def _log_not_started(task: Task, count: int) -> None:
+    logger.warning(
+        "Run of task %r ran out of time, %d hosts haven't been run", task.name, count
+    )
+
+
+# hosts listed by each entry of the summary of errors
+_ERROR_SUMMARY_HOSTS = 10
+
+
+def _root_exception(results: MultiResult) -> Optional[BaseException]:
+    """Returns the exception that made a host fail, looking into failed subtasks"""
+    for r in results:
+        if isinstance(r, MultiResult):
+            e = _root_exception(r)
+        elif r.failed and not isinstance(r.exception, NornirSubTaskError):
+            e = r.exception
+        else:
+            continue
+        if e is not None:
+            return e
+    return results[0].exception if results else None
+
+
+def _log_errors(name: str, result: AggregatedResult) -> None:
+    """Logs the hosts that failed grouped by the error they failed with"""
+    groups: Dict[Tuple[str, str], List[str]] = {}
+    for host, r in result.failed_hosts.items():
+        e = _root_exception(r)
+        groups.setdefault((type(e).__name__, str(e)), []).append(host)
+    for (kind, message), hosts in groups.items():
+        listed = ", ".join(hosts[:_ERROR_SUMMARY_HOSTS])
+        if len(hosts) > _ERROR_SUMMARY_HOSTS:
+            listed += " and {} more".format(len(hosts) - _ERROR_SUMMARY_HOSTS)
+        logger.error(
+            "Task %r failed on %d hosts with %s: %s\nHosts: %s",
+            name,
+            len(hosts),
+            kind,
+            message,
+            listed,
+        )
+
+
 class Nornir(object):
     """
     This is the main object to work with. It contains the inventory and it serves
@@ -25,12 +113,29 @@ class Nornir(object):
         data(GlobalState): shared data amongst different iterations of nornir
         dry_run(``bool``): Whether if we are testing the changes or not
         config (:obj:`nornir.core.configuration.Config`): Configuration object
+        pool (:obj:`nornir.core.pool.WorkerPool`): Pool of threads to run tasks with,
+          a new one is created if not specified
+        timings (:obj:`nornir.core.timing.TimingStore`): Where to record how long
+          tasks take, a new one backed by ``core.timing_file`` is created if not specified
+        result_store (:obj:`nornir.core.result_store.ResultStore`): Where to move large
+          results to, one is created if not specified and ``core.result_store_threshold``
+          is set
 
     Attributes:
         inventory (:obj:`nornir.core.inventory.Inventory`): Inventory to work with
         data(:obj:`nornir.core.GlobalState`): shared data amongst different iterations of nornir
         dry_run(``bool``): Whether if we are testing the changes or not
         config (:obj:`nornir.core.configuration.Config`): Configuration parameters
+        pool (:obj:`nornir.core.pool.WorkerPool`): Pool of threads used by the ``threaded``
+          runner when running with ``core.num_workers`` workers. It is shared with
+          the objects returned by :meth:`filter` and :meth:`with_processors` and
+          shut down when leaving the context manager
+        timings (:obj:`nornir.core.timing.TimingStore`): How long tasks took on each
+          host in previous runs. Shared with the objects returned by :meth:`filter`
+          and :meth:`with_processors`
+        result_store (:obj:`nornir.core.result_store.ResultStore`): Where large results
+          are moved to as hosts complete, if any. Shared with the objects returned by
+          :meth:`filter` and :meth:`with_processors`
     """
 
     def __init__(
@@ -39,24 +144,53 @@ class Nornir(object):
         config: Config = None,
         data: GlobalState = None,
         processors: Optional[Processors] = None,
+        pool: Optional[WorkerPool] = None,
+        timings: Optional[TimingStore] = None,
+        result_store: Optional[ResultStore] = None,
     ) -> None:
         self.data = data if data is not None else GlobalState()
         self.inventory = inventory
         self.config = config or Config()
         self.processors = processors or Processors()
+        self.pool = pool or WorkerPool(
+            self.config.core.num_workers, affinity=self.config.core.worker_affinity
+        )
+        self.timings = (
+            timings
+            if timings is not None
+            else TimingStore(self.config.core.timing_file or None)
+        )
+        if result_store is None and self.config.core.result_store_threshold:
+            result_store = ResultStore(
+                self.config.core.result_store_file or None,
+                self.config.core.result_store_threshold,
+            )
+        self.result_store = result_store
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close_connections(on_good=True, on_failed=True)
+        self.pool.shutdown()
+        if isinstance(self.processors, QueuedProcessors):
+            self.processors.close()
+        if self.result_store is not None:
+            self.result_store.close()
 
-    def with_processors(self, processors: List[Processor]) -> "Nornir":
+    def with_processors(
+        self, processors: List[Processor], background: bool = False
+    ) -> "Nornir":
         """
         Given a list of Processor objects return a copy of the nornir object with the processors
         assigned to the copy. The orinal object is left unmodified.
+
+        If ``background`` is ``True`` processors are called from a background thread instead
+        of from the threads running the tasks, see
+        :obj:`nornir.core.processor.QueuedProcessors`.
         """
-        return Nornir(**{**self.__dict__, **{"processors": Processors(processors)}})
+        cls = QueuedProcessors if background else Processors
+        return Nornir(**{**self.__dict__, **{"processors": cls(processors)}})
 
     def filter(self, *args, **kwargs):
         """
@@ -69,31 +203,440 @@ class Nornir(object):
         b.inventory = self.inventory.filter(*args, **kwargs)
         return b
 
-    def _run_serial(self, task: Task, hosts, **kwargs):
-        result = AggregatedResult(kwargs.get("name") or task.name)
-        for host in hosts:
-            result[host.name] = task.copy().start(host, self)
+    def _aggregated_result(self, task: Task, **kwargs: Any) -> AggregatedResult:
+        return AggregatedResult(
+            kwargs.get("name") or task.name, store=self.result_store
+        )
+
+    def _host_completed(
+        self,
+        task: Task,
+        host: "Host",
+        result: MultiResult,
+        journal: Optional[RunJournal] = None,
+    ) -> MultiResult:
+        """
+        Records the result of a host in the ``journal``, if any, and moves its large
+        payloads to disk before it's kept until the end of the run
+        """
+        if journal is not None and not result.failed:
+            journal.record(task.name, host.name, result)
+        if self.result_store is not None:
+            self.result_store.spill(result)
+        return result
+
+    def _run_serial(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        journal: Optional[RunJournal] = None,
+        **kwargs: Dict[str, Any],
+    ) -> AggregatedResult:
+        result = self._aggregated_result(task, **kwargs)
+        for host, r in self._iter_serial(task, hosts):
+            result[host.name] = self._host_completed(task, host, r, journal)
         return result
 
+    def _iter_serial(
+        self, task: Task, hosts: List["Host"]
+    ) -> Iterator[Tuple["Host", MultiResult]]:
+        for i, host in enumerate(hosts):
+            if _expired(task.deadline):
+                _log_not_started(task, len(hosts) - i)
+                return
+            yield host, task.copy().start(host, self)
+
+    def _iter_parallel(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        num_workers: int,
+        limits: Optional[ConcurrencyLimits] = None,
+        key: Optional[Callable[["Host"], Any]] = None,
+    ) -> Iterator[Tuple["Host", MultiResult]]:
+        """
+        Runs the task over ``hosts`` and yields the results as they complete,
+        see :meth:`_iter_pipeline`.
+        """
+        for _, host, r in self._iter_pipeline([task], hosts, num_workers, limits, key):
+            yield host, r
+
+    def _iter_pipeline(
+        self,
+        stages: List[Task],
+        hosts: List["Host"],
+        num_workers: int,
+        limits: Optional[ConcurrencyLimits] = None,
+        key: Optional[Callable[["Host"], Any]] = None,
+    ) -> Iterator[Tuple[int, "Host", MultiResult]]:
+        """
+        Runs each host through ``stages`` and yields ``(stage, host, result)`` tuples as
+        each stage completes on each host. A host moves to the next stage as soon as it's
+        done with the previous one, regardless of the other hosts, unless it failed.
+        Hosts are submitted as workers become available so no more than ``num_workers``
+        of them are queued or running at any given time. Hosts that are already
+        in the pipeline go before new ones, which are sorted by ``key`` if given.
+        Hosts that would exceed their ``limits`` wait until a host sharing the limit
+        is done with all the stages.
+
+        Hosts still running when the ``task_timeout`` or the ``deadline`` of their
+        stage expire are given up on and yielded as failed with a
+        :obj:`nornir.core.exceptions.NornirTimeoutError`, their worker is replaced so
+        other hosts don't wait for them. Stages aren't started once their
+        ``deadline`` is due.
+        """
+        # runs started from within a worker can't wait on the shared pool
+        # as they could be waiting for their own thread
+        if num_workers == self.pool.num_workers and not WorkerPool.in_worker():
+            pool = self.pool
+        else:
+            pool = WorkerPool(num_workers)
+
+        scheduler = Scheduler(sorted(hosts, key=key) if key else hosts, limits)
+        # hosts waiting to start their next stage
+        ready: Deque[Tuple[int, "Host"]] = deque()
+        futures: Dict[Any, Tuple[int, "Host"]] = {}
+        instances: Dict[Any, Task] = {}
+        deadlines: Dict[Any, float] = {}
+        not_started = 0
+
+        def submit() -> None:
+            nonlocal not_started
+            while len(futures) < num_workers:
+                if ready:
+                    stage, host = ready.popleft()
+                    if _expired(stages[stage].deadline):
+                        not_started += 1
+                        scheduler.done(host)
+                        continue
+                elif not _expired(stages[0].deadline):
+                    stage, host = 0, scheduler.next()
+                    if host is None:
+                        return
+                else:
+                    return
+                task = stages[stage]
+                instance = task.copy()
+                future = pool.submit_for(host.name, instance.start, host, self)
+                futures[future] = (stage, host)
+                instances[future] = instance
+                deadline = _host_deadline(task)
+                if deadline is not None:
+                    deadlines[future] = deadline
+
+        try:
+            submit()
+            while futures:
+                timeout = None
+                if deadlines:
+                    timeout = max(0.0, min(deadlines.values()) - time.monotonic())
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                expired = [
+                    future
+                    for future, deadline in deadlines.items()
+                    if future not in done and deadline <= now
+                ]
+                finished = [(futures.pop(f), f.result()) for f in done]
+                for future in expired:
+                    stage, host = futures.pop(future)
+                    pool.abandon(future)
+                    r = instances[future]._timed_out(host, self)
+                    finished.append(((stage, host), r))
+                for future in list(done) + expired:
+                    deadlines.pop(future, None)
+                    del instances[future]
+                for (stage, host), r in finished:
+                    if r.failed or stage + 1 == len(stages):
+                        scheduler.done(host)
+                    else:
+                        ready.append((stage + 1, host))
+                submit()
+                for (stage, host), r in finished:
+                    yield stage, host, r
+            not_started += len(scheduler)
+            if not_started:
+                _log_not_started(stages[0], not_started)
+        finally:
+            if futures:
+                # hosts that are queued aren't started
+                for future in futures:
+                    future.cancel()
+                if deadlines:
+                    # hosts are waited for until their deadline at most
+                    latest = max(deadlines.values()) - time.monotonic()
+                    done, _ = wait(
+                        [f for f in futures if f in deadlines], timeout=max(0, latest)
+                    )
+                    for future in deadlines:
+                        if future not in done:
+                            pool.abandon(future)
+                            instances[future]._abandon()
+                wait([f for f in futures if f not in deadlines])
+            if pool is not self.pool:
+                pool.shutdown()
+
     def _run_parallel(
         self,
         task: Task,
         hosts: List["Host"],
         num_workers: int,
+        limits: Optional[ConcurrencyLimits] = None,
+        key: Optional[Callable[["Host"], Any]] = None,
+        journal: Optional[RunJournal] = None,
+        **kwargs: Dict[str, Any],
+    ) -> AggregatedResult:
+        agg_result = self._aggregated_result(task, **kwargs)
+        results = {
+            host.name: self._host_completed(task, host, r, journal)
+            for host, r in self._iter_parallel(task, hosts, num_workers, limits, key)
+        }
+        for host in hosts:
+            if host.name in results:
+                agg_result[host.name] = results[host.name]
+        return agg_result
+
+    async def _run_coroutines(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        num_workers: int,
+        limits: Optional[ConcurrencyLimits] = None,
+        key: Optional[Callable[["Host"], Any]] = None,
+        journal: Optional[RunJournal] = None,
+        **kwargs: Dict[str, Any],
+    ) -> AggregatedResult:
+        agg_result = self._aggregated_result(task, **kwargs)
+        semaphore = asyncio.Semaphore(num_workers)
+        limit_semaphores: Dict[Any, asyncio.Semaphore] = {}
+
+        async def start(host: "Host") -> Any:
+            keys = limits.keys(host) if limits else ()
+            for k in keys:
+                if k not in limit_semaphores:
+                    limit_semaphores[k] = asyncio.Semaphore(limits.limit(k))
+                await limit_semaphores[k].acquire()
+            try:
+                async with semaphore:
+                    if _expired(task.deadline):
+                        return None
+                    deadline = _host_deadline(task)
+                    instance = task.copy()
+                    coro = instance.start_async(host, self)
+                    if deadline is None:
+                        r = await coro
+                    else:
+                        try:
+                            r = await asyncio.wait_for(
+                                coro, max(0.0, deadline - time.monotonic())
+                            )
+                        except asyncio.TimeoutError:
+                            r = instance._timed_out(host, self)
+                    return self._host_completed(task, host, r, journal)
+            finally:
+                for k in keys:
+                    limit_semaphores[k].release()
+
+        # coroutines acquire the semaphore in the order they are started
+        ordered = sorted(hosts, key=key) if key else hosts
+        results = dict(
+            zip(
+                [host.name for host in ordered],
+                await asyncio.gather(*[start(host) for host in ordered]),
+            )
+        )
+        not_started = 0
+        for host in hosts:
+            worker_result = results[host.name]
+            if worker_result is None:
+                not_started += 1
+            else:
+                agg_result[host.name] = worker_result
+        if not_started:
+            _log_not_started(task, not_started)
+        return agg_result
+
+    def _run_asyncio(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        num_workers: int,
+        limits: Optional[ConcurrencyLimits] = None,
+        key: Optional[Callable[["Host"], Any]] = None,
+        journal: Optional[RunJournal] = None,
+        **kwargs: Dict[str, Any],
+    ) -> AggregatedResult:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(
+                self._run_coroutines(
+                    task, hosts, num_workers, limits, key, journal, **kwargs
+                )
+            )
+        finally:
+            loop.close()
+
+    def _run_process(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        num_workers: int,
+        journal: Optional[RunJournal] = None,
         **kwargs: Dict[str, Any],
     ) -> AggregatedResult:
-        agg_result = AggregatedResult(kwargs.get("name") or task.name)
-        futures = []
-        with ThreadPoolExecutor(num_workers) as pool:
-            for host in hosts:
-                future = pool.submit(task.copy().start, host, self)
-                futures.append(future)
-
-        for future in futures:
-            worker_result = future.result()
-            agg_result[worker_result.host.name] = worker_result
+        with worker.mp_context().Pool(num_workers) as pool:
+            return self._run_chunks(
+                task,
+                hosts,
+                worker.chunks(hosts, num_workers),
+                lambda payloads: pool.imap_unordered(worker.run_chunk, payloads),
+                journal,
+                **kwargs,
+            )
+
+    def _run_distributed(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        num_workers: int,
+        journal: Optional[RunJournal] = None,
+        **kwargs: Dict[str, Any],
+    ) -> AggregatedResult:
+        addresses = self.config.core.distributed_workers
+        coordinator = Coordinator(addresses, self.config.core.distributed_authkey)
+        # the deadline is sent as a timeout as clocks differ between machines
+        timeout = task.remaining_time()
+        remote_task = task.copy()
+        remote_task.deadline = None
+        return self._run_chunks(
+            remote_task,
+            hosts,
+            worker.chunks(hosts, len(addresses)),
+            lambda payloads: coordinator.imap_unordered(payloads, num_workers, timeout),
+            journal,
+            **kwargs,
+        )
+
+    def _run_chunks(
+        self,
+        task: Task,
+        hosts: List["Host"],
+        chunks: Iterable[List["Host"]],
+        run: Callable[[Iterable[bytes]], Iterator[Any]],
+        journal: Optional[RunJournal] = None,
+        **kwargs: Dict[str, Any],
+    ) -> AggregatedResult:
+        """
+        Ships ``chunks`` of host snapshots to be run with ``run`` and merges the results.
+        ``run`` takes the pickled payloads and returns an iterator over the pickled
+        results of each chunk, see :func:`nornir.core.worker.run_chunk`.
+        """
+        agg_result = self._aggregated_result(task, **kwargs)
+        by_name = {host.name: host for host in hosts}
+        results: Dict[str, Any] = {}
+
+        def payloads():
+            for chunk in chunks:
+                try:
+                    snapshots = [worker.host_snapshot(host) for host in chunk]
+                    yield pickle.dumps((task, snapshots, self.config, self.data))
+                except Exception as e:
+                    for host in chunk:
+                        results[host.name] = e
+
+        chunk_error: Optional[Exception] = None
+        it = run(payloads())
+        while True:
+            try:
+                chunk_results = next(it)
+                if isinstance(chunk_results, Exception):
+                    raise chunk_results
+                chunk_results = pickle.loads(chunk_results)
+            except StopIteration:
+                break
+            except Exception as e:
+                # the hosts of this chunk will be missing from results
+                chunk_error = e
+                continue
+            for name, r in chunk_results:
+                host = by_name[name]
+                self.processors.task_instance_started(task, host)
+                if isinstance(r, Exception):
+                    r = worker.failed_result(task, host, r)
+                else:
+                    worker.attach_host(r, host)
+                results[name] = self._host_completed(task, host, r, journal)
+                self.processors.task_instance_completed(task, host, r)
+
+        for host in hosts:
+            r = results.get(host.name, chunk_error)
+            if isinstance(r, Exception):
+                self.processors.task_instance_started(task, host)
+                r = worker.failed_result(task, host, r)
+                self.processors.task_instance_completed(task, host, r)
+            agg_result[host.name] = r
         return agg_result
 
+    def _concurrency_limits(
+        self, concurrency_limits: Optional[Dict[str, Any]]
+    ) -> ConcurrencyLimits:
+        if concurrency_limits is None:
+            concurrency_limits = self.config.core.concurrency_limits
+        return ConcurrencyLimits(concurrency_limits)
+
+    def _schedule_key(
+        self, task: Task, longest_first: Optional[bool]
+    ) -> Optional[Callable[["Host"], Any]]:
+        if longest_first is None:
+            longest_first = self.config.core.longest_first
+        return self.timings.longest_first(task.name) if longest_first else None
+
+    def _hosts_to_run_on(self, on_good: bool, on_failed: bool) -> List["Host"]:
+        run_on = []
+        if on_good:
+            for name, host in self.inventory.hosts.items():
+                if name not in self.data.failed_hosts:
+                    run_on.append(host)
+        if on_failed:
+            for name, host in self.inventory.hosts.items():
+                if name in self.data.failed_hosts:
+                    run_on.append(host)
+        return run_on
+
+    def _log_run(self, task: Task, **kwargs: Any) -> None:
+        num_hosts = len(self.inventory.hosts)
+        task_name = kwargs.get("name") or task.name
+        if num_hosts:
+            logger.info(
+                "Running task %r with args %s on %d hosts",
+                task_name,
+                kwargs,
+                num_hosts,
+            )
+        else:
+            logger.warning("Task %r has not been run – 0 hosts selected", task_name)
+
+    def _process_result(
+        self, task: Task, result: AggregatedResult, raise_on_error: Optional[bool]
+    ) -> AggregatedResult:
+        raise_on_error = (
+            raise_on_error
+            if raise_on_error is not None
+            else self.config.core.raise_on_error
+        )  # noqa
+        if self.config.core.aggregate_errors:
+            _log_errors(task.name, result)
+        try:
+            if raise_on_error:
+                result.raise_on_error()
+            else:
+                self.data.failed_hosts.update(result.failed_hosts.keys())
+        finally:
+            self.timings.save()
+            self.processors.task_completed(task, result)
+
+        return result
+
     def run(
         self,
         task,
@@ -101,6 +644,16 @@ class Nornir(object):
         raise_on_error=None,
         on_good=True,
         on_failed=False,
+        runner=None,
+        concurrency_limits=None,
+        task_timeout=None,
+        run_timeout=None,
+        retry=None,
+        cache=None,
+        longest_first=None,
+        batch_size=None,
+        max_fail_percentage=None,
+        resume=None,
         **kwargs,
     ):
         """
@@ -113,6 +666,39 @@ class Nornir(object):
             raise_on_error (``bool``): Override raise_on_error behavior
             on_good(``bool``): Whether to run or not this task on hosts marked as good
             on_failed(``bool``): Whether to run or not this task on hosts marked as failed
+            runner(``str``): How to run the task; ``serial``, ``threaded``, ``asyncio``,
+              ``process`` or ``distributed``. Defaults to ``asyncio`` for coroutine
+              functions, to ``serial`` if ``num_workers == 1`` and to ``threaded``
+              otherwise. With ``distributed``, ``num_workers`` is the number of hosts
+              each node runs at the same time
+            concurrency_limits(``dict``): Override ``core.concurrency_limits``, see
+              :obj:`nornir.core.scheduler.ConcurrencyLimits`. Only honoured by the
+              ``threaded`` and ``asyncio`` runners
+            task_timeout(``float``): Maximum number of seconds the task can run for
+              each host, hosts going over it fail with a
+              :obj:`nornir.core.exceptions.NornirTimeoutError`
+            run_timeout(``float``): Maximum number of seconds the whole run can take.
+              Once it expires running hosts fail as with ``task_timeout`` and hosts
+              that haven't been started are left out of the result
+            retry(:obj:`nornir.core.retry.RetryPolicy`): How to retry the task on hosts
+              where it fails
+            cache(:obj:`nornir.core.cache.ResultCache`): Where to cache the results of
+              the task so hosts whose data didn't change aren't run again, see
+              :mod:`nornir.core.cache`
+            longest_first(``bool``): Override ``core.longest_first``
+            batch_size(``int``, ``str`` or ``list``): Run the task in batches of
+              ``batch_size`` hosts, waiting for a batch to complete before starting
+              the next one. Can be a number of hosts, a percentage of the hosts,
+              i.e. ``"25%"``, or a list of those for batches of growing size, the
+              last one being used for the remaining batches. See
+              :func:`nornir.core.scheduler.batches`
+            max_fail_percentage(``float``): Stop running batches if the task fails on
+              more than this percentage of the hosts of a batch
+            resume(:obj:`nornir.core.journal.RunJournal` or ``str``): Journal, or path
+              of the journal, where the results of the hosts are recorded as they
+              complete. Hosts that already completed the task in a previous run
+              recorded in the same journal aren't run again and their recorded
+              results are returned instead
             **kwargs: additional argument to pass to ``task`` when calling it
 
         Raises:
@@ -122,51 +708,391 @@ class Nornir(object):
         Returns:
             :obj:`nornir.core.task.AggregatedResult`: results of each execution
         """
-        task = Task(task, **kwargs)
+        if runner is None:
+            if asyncio.iscoroutinefunction(task):
+                runner = "asyncio"
+            elif (num_workers or self.config.core.num_workers) == 1:
+                runner = "serial"
+            else:
+                runner = "threaded"
+        if runner not in ("serial", "threaded", "asyncio", "process", "distributed"):
+            raise ValueError(f"unknown runner {runner!r}")
+
+        task = Task(
+            task,
+            task_timeout=task_timeout,
+            deadline=_deadline(run_timeout),
+            retry=retry,
+            cache=cache,
+            **kwargs,
+        )
         self.processors.task_started(task)
 
-        num_workers = num_workers or self.config.core.num_workers
+        if runner == "process":
+            num_workers = num_workers or os.cpu_count() or 1
+        else:
+            num_workers = num_workers or self.config.core.num_workers
 
-        run_on = []
-        if on_good:
-            for name, host in self.inventory.hosts.items():
-                if name not in self.data.failed_hosts:
-                    run_on.append(host)
-        if on_failed:
-            for name, host in self.inventory.hosts.items():
-                if name in self.data.failed_hosts:
-                    run_on.append(host)
+        limits = self._concurrency_limits(concurrency_limits)
+        key = self._schedule_key(task, longest_first)
+        run_on = self._hosts_to_run_on(on_good, on_failed)
+        self._log_run(task, **kwargs)
 
-        num_hosts = len(self.inventory.hosts)
-        task_name = kwargs.get("name") or task.name
-        if num_hosts:
-            logger.info(
-                "Running task %r with args %s on %d hosts",
-                task_name,
-                kwargs,
-                num_hosts,
+        journal = RunJournal(resume) if isinstance(resume, str) else resume
+        completed: Dict[str, MultiResult] = {}
+        if journal is not None:
+            completed = journal.load(task.name, {host.name: host for host in run_on})
+            if completed:
+                logger.info(
+                    "Resuming task %r, %d hosts completed it already",
+                    task.name,
+                    len(completed),
+                )
+            run_on = [host for host in run_on if host.name not in completed]
+
+        try:
+            if batch_size is None:
+                result = self._run_hosts(
+                    runner, task, run_on, num_workers, limits, key, journal, **kwargs
+                )
+            else:
+                result = self._aggregated_result(task, **kwargs)
+                for i, batch in enumerate(batches(run_on, batch_size)):
+                    if i and _expired(task.deadline):
+                        _log_not_started(task, len(run_on) - len(result))
+                        break
+                    r = self._run_hosts(
+                        runner, task, batch, num_workers, limits, key, journal, **kwargs
+                    )
+                    result.update(r)
+                    failed = 100 * len(r.failed_hosts) / len(batch)
+                    if max_fail_percentage is not None and failed > max_fail_percentage:
+                        logger.error(
+                            "Task %r failed on %.1f%% of the hosts of batch %d, "
+                            "aborting before running on the remaining %d hosts",
+                            task.name,
+                            failed,
+                            i + 1,
+                            len(run_on) - len(result),
+                        )
+                        break
+        finally:
+            if isinstance(resume, str):
+                journal.close()
+
+        if completed:
+            # results of the hosts that weren't run are returned in inventory order too
+            resumed = self._aggregated_result(task, **kwargs)
+            for name in self.inventory.hosts:
+                if name in completed:
+                    resumed[name] = completed[name]
+                elif name in result:
+                    resumed[name] = result[name]
+            result = resumed
+        return self._process_result(task, result, raise_on_error)
+
+    def _run_hosts(
+        self,
+        runner: str,
+        task: Task,
+        hosts: List["Host"],
+        num_workers: int,
+        limits: ConcurrencyLimits,
+        key: Optional[Callable[["Host"], Any]],
+        journal: Optional[RunJournal] = None,
+        **kwargs: Any,
+    ) -> AggregatedResult:
+        if runner == "serial":
+            return self._run_serial(task, hosts, journal, **kwargs)
+        elif runner == "asyncio":
+            return self._run_asyncio(
+                task, hosts, num_workers, limits, key, journal, **kwargs
             )
+        elif runner == "process":
+            return self._run_process(task, hosts, num_workers, journal, **kwargs)
+        elif runner == "distributed":
+            return self._run_distributed(task, hosts, num_workers, journal, **kwargs)
         else:
-            logger.warning("Task %r has not been run – 0 hosts selected", task_name)
+            return self._run_parallel(
+                task, hosts, num_workers, limits, key, journal, **kwargs
+            )
+
+    def run_iter(
+        self,
+        task,
+        num_workers=None,
+        on_good=True,
+        on_failed=False,
+        concurrency_limits=None,
+        task_timeout=None,
+        run_timeout=None,
+        retry=None,
+        cache=None,
+        longest_first=None,
+        **kwargs,
+    ) -> Iterator[Tuple["Host", MultiResult]]:
+        """
+        Run task over all the hosts in the inventory and yield the result of each host
+        as soon as it completes, in completion order. For instance::
+
+            for host, result in nr.run_iter(backup_config):
+                save_to_db(host, result)
+
+        Hosts are submitted to the workers as they become available so a slow host
+        only delays its own result. Results aren't kept once they have been yielded,
+        except the ones of failed hosts which are handed to the processors in
+        ``task_completed``. Failed hosts are marked as such in ``self.data``.
+        If you stop iterating, hosts that haven't been started yet are not run and
+        the ones that are running are waited for before the task is completed.
+
+        Arguments:
+            task (``callable``): function or callable that will be run against each device in
+              the inventory
+            num_workers(``int``): Override for how many hosts to run in parallel for this task
+            on_good(``bool``): Whether to run or not this task on hosts marked as good
+            on_failed(``bool``): Whether to run or not this task on hosts marked as failed
+            concurrency_limits(``dict``): Override ``core.concurrency_limits``, see
+              :obj:`nornir.core.scheduler.ConcurrencyLimits`
+            task_timeout(``float``): Maximum number of seconds the task can run for
+              each host, see :meth:`run`
+            run_timeout(``float``): Maximum number of seconds the whole run can take,
+              see :meth:`run`
+            retry(:obj:`nornir.core.retry.RetryPolicy`): How to retry the task on hosts
+              where it fails
+            cache(:obj:`nornir.core.cache.ResultCache`): Where to cache the results of
+              the task so hosts whose data didn't change aren't run again, see
+              :mod:`nornir.core.cache`
+            longest_first(``bool``): Override ``core.longest_first``
+            **kwargs: additional argument to pass to ``task`` when calling it
+
+        Returns:
+            iterator of tuples (:obj:`nornir.core.inventory.Host`,
+              :obj:`nornir.core.task.MultiResult`)
+        """
+        task = Task(
+            task,
+            task_timeout=task_timeout,
+            deadline=_deadline(run_timeout),
+            retry=retry,
+            cache=cache,
+            **kwargs,
+        )
+        self.processors.task_started(task)
+
+        num_workers = num_workers or self.config.core.num_workers
+
+        limits = self._concurrency_limits(concurrency_limits)
+        key = self._schedule_key(task, longest_first)
+        run_on = self._hosts_to_run_on(on_good, on_failed)
+        self._log_run(task, **kwargs)
 
         if num_workers == 1:
-            result = self._run_serial(task, run_on, **kwargs)
+            results = self._iter_serial(task, run_on)
         else:
-            result = self._run_parallel(task, run_on, num_workers, **kwargs)
+            results = self._iter_parallel(task, run_on, num_workers, limits, key)
+
+        failed = self._aggregated_result(task, **kwargs)
+        try:
+            for host, r in results:
+                if r.failed:
+                    failed[host.name] = r
+                    self.data.failed_hosts.add(host.name)
+                yield host, r
+        finally:
+            # waits for the hosts that are running if the caller stopped early
+            results.close()
+            if self.config.core.aggregate_errors:
+                _log_errors(task.name, failed)
+            self.timings.save()
+            self.processors.task_completed(task, failed)
+
+    def run_pipeline(
+        self,
+        tasks: List[
+            Union[Callable[..., Any], Tuple[Callable[..., Any], Dict[str, Any]]]
+        ],
+        num_workers: Optional[int] = None,
+        raise_on_error: Optional[bool] = None,
+        on_good: bool = True,
+        on_failed: bool = False,
+        concurrency_limits: Optional[Dict[str, Any]] = None,
+        task_timeout: Optional[float] = None,
+        run_timeout: Optional[float] = None,
+        retry: Optional["RetryPolicy"] = None,
+        longest_first: Optional[bool] = None,
+    ) -> List[AggregatedResult]:
+        """
+        Run a sequence of tasks over all the hosts in the inventory. Unlike calling
+        :meth:`run` once per task, each host moves to the next task as soon as it's done
+        with the previous one so hosts don't wait for the slowest host at every step.
+        For instance::
+
+            render, push, verify = nr.run_pipeline(
+                [render_config, (push_config, {"dry_run": False}), verify_config]
+            )
+
+        A host that fails a task doesn't run the tasks that follow. Processors see the
+        same events as if each task had been run with :meth:`run`, with
+        ``task_completed`` fired for each task once all the hosts are done with it.
+        Tasks are run with the ``threaded`` runner so they can't be coroutine functions.
+
+        Arguments:
+            tasks: functions or callables to run, optionally with the arguments to pass
+              to each one as a ``(task, kwargs)`` tuple. ``kwargs`` can include
+              the arguments of :obj:`nornir.core.task.Task`, like ``name``
+            num_workers(``int``): Override for how many hosts to run in parallel
+            raise_on_error (``bool``): Override raise_on_error behavior. Hosts that
+              failed are still marked as such in ``self.data`` before raising
+            on_good(``bool``): Whether to run or not the tasks on hosts marked as good
+            on_failed(``bool``): Whether to run or not the tasks on hosts marked as failed
+            concurrency_limits(``dict``): Override ``core.concurrency_limits``, see
+              :obj:`nornir.core.scheduler.ConcurrencyLimits`. Limits are held by
+              a host until it's done with all the tasks
+            task_timeout(``float``): Maximum number of seconds each task can run for
+              each host, see :meth:`run`
+            run_timeout(``float``): Maximum number of seconds the whole pipeline can
+              take, see :meth:`run`
+            retry(:obj:`nornir.core.retry.RetryPolicy`): How to retry the tasks on
+              hosts where they fail
+            longest_first(``bool``): Override ``core.longest_first``, based on
+              the timings of the first task
+
+        Raises:
+            :obj:`nornir.core.exceptions.NornirExecutionError`: for the first task
+              that failed on at least a host if ``raise_on_error`` is ``True``
+
+        Returns:
+            ``list`` of :obj:`nornir.core.task.AggregatedResult`: results of each task
+        """
+        deadline = _deadline(run_timeout)
+        stages = []
+        for t in tasks:
+            func, kwargs = t if isinstance(t, tuple) else (t, {})
+            params = {"task_timeout": task_timeout, "retry": retry, **kwargs}
+            stages.append(Task(func, deadline=deadline, **params))
+        if not stages:
+            return []
+        for stage in stages:
+            self.processors.task_started(stage)
+
+        num_workers = num_workers or self.config.core.num_workers
+        limits = self._concurrency_limits(concurrency_limits)
+        key = self._schedule_key(stages[0], longest_first)
+        run_on = self._hosts_to_run_on(on_good, on_failed)
+        for stage in stages:
+            self._log_run(stage, **stage.params)
 
         raise_on_error = (
             raise_on_error
             if raise_on_error is not None
             else self.config.core.raise_on_error
-        )  # noqa
+        )
+        collected: List[Dict[str, MultiResult]] = [{} for _ in stages]
+        # number of hosts that may still run each stage
+        pending = [len(run_on)] * len(stages)
+        results: List[AggregatedResult] = []
+
+        def complete_stages() -> None:
+            while len(results) < len(stages) and not pending[len(results)]:
+                i = len(results)
+                result = AggregatedResult(stages[i].name, store=self.result_store)
+                for host in run_on:
+                    if host.name in collected[i]:
+                        result[host.name] = collected[i][host.name]
+                self.data.failed_hosts.update(result.failed_hosts.keys())
+                if self.config.core.aggregate_errors:
+                    _log_errors(stages[i].name, result)
+                self.processors.task_completed(stages[i], result)
+                results.append(result)
+
+        pipeline = self._iter_pipeline(stages, run_on, num_workers, limits, key)
+        for i, host, r in pipeline:
+            collected[i][host.name] = self._host_completed(stages[i], host, r)
+            pending[i] -= 1
+            if r.failed:
+                for j in range(i + 1, len(stages)):
+                    pending[j] -= 1
+            complete_stages()
+        # hosts that weren't run because the run ran out of time
+        pending = [0] * len(stages)
+        complete_stages()
+
+        self.timings.save()
         if raise_on_error:
-            result.raise_on_error()
-        else:
-            self.data.failed_hosts.update(result.failed_hosts.keys())
+            for result in results:
+                result.raise_on_error()
+        return results
 
-        self.processors.task_completed(task, result)
+    async def run_async(
+        self,
+        task,
+        num_workers=None,
+        raise_on_error=None,
+        on_good=True,
+        on_failed=False,
+        concurrency_limits=None,
+        task_timeout=None,
+        run_timeout=None,
+        retry=None,
+        cache=None,
+        longest_first=None,
+        **kwargs,
+    ):
+        """
+        Same as :meth:`run` with ``runner="asyncio"`` but meant to be awaited from code
+        that is already running an event loop. All the hosts are driven from the
+        calling thread and at most ``num_workers`` of them are in flight at once.
 
-        return result
+        Arguments:
+            task (``callable``): coroutine function or callable that will be run against
+              each device in the inventory
+            num_workers(``int``): Override for how many hosts to run concurrently for this task
+            raise_on_error (``bool``): Override raise_on_error behavior
+            on_good(``bool``): Whether to run or not this task on hosts marked as good
+            on_failed(``bool``): Whether to run or not this task on hosts marked as failed
+            concurrency_limits(``dict``): Override ``core.concurrency_limits``, see
+              :obj:`nornir.core.scheduler.ConcurrencyLimits`
+            task_timeout(``float``): Maximum number of seconds the task can run for
+              each host, see :meth:`run`
+            run_timeout(``float``): Maximum number of seconds the whole run can take,
+              see :meth:`run`
+            retry(:obj:`nornir.core.retry.RetryPolicy`): How to retry the task on hosts
+              where it fails
+            cache(:obj:`nornir.core.cache.ResultCache`): Where to cache the results of
+              the task so hosts whose data didn't change aren't run again, see
+              :mod:`nornir.core.cache`
+            longest_first(``bool``): Override ``core.longest_first``
+            **kwargs: additional argument to pass to ``task`` when calling it
+
+        Raises:
+            :obj:`nornir.core.exceptions.NornirExecutionError`: if at least a task fails
+              and self.config.core.raise_on_error is set to ``True``
+
+        Returns:
+            :obj:`nornir.core.task.AggregatedResult`: results of each execution
+        """
+        task = Task(
+            task,
+            task_timeout=task_timeout,
+            deadline=_deadline(run_timeout),
+            retry=retry,
+            cache=cache,
+            **kwargs,
+        )
+        self.processors.task_started(task)
+
+        num_workers = num_workers or self.config.core.num_workers
+
+        limits = self._concurrency_limits(concurrency_limits)
+        key = self._schedule_key(task, longest_first)
+        run_on = self._hosts_to_run_on(on_good, on_failed)
+        self._log_run(task, **kwargs)
+
+        result = await self._run_coroutines(
+            task, run_on, num_workers, limits, key, **kwargs
+        )
+
+        return self._process_result(task, result, raise_on_error)
 
     def dict(self):
         """ Return a dictionary representing the object. """
@@ -0,0 +1,237 @@
+"""
+Caches the results of tasks that only depend on the data of the host and their
+parameters, like rendering configurations, so hosts whose data didn't change since
+the last run get the results they got then without running the task again::
+
+    cache = DiskCache("~/.cache/nornir")
+    nr.run(render_config, template="base.j2", cache=cache)
+
+Results are cached under a hash of the code of the task, its parameters and the
+attributes and data of the host, including the ones inherited from groups and
+defaults. Only results that didn't fail or change the system are cached. When a
+cached result is used, its subtasks aren't run so processors don't get their events.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import types
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from nornir.core import worker
+from nornir.core.inventory import Host
+from nornir.core.task import MultiResult, Task
+
+logger = logging.getLogger(__name__)
+
+
+def _task_identity(task: Task) -> Dict[str, Any]:
+    func = task.task
+    code = getattr(func, "__code__", None)
+    identity = {
+        "module": getattr(func, "__module__", None),
+        "name": getattr(func, "__qualname__", task.name),
+    }
+    if code is not None:
+        identity["code"] = code.co_code.hex()
+        # nested code objects have their address in their repr
+        identity["consts"] = repr(
+            [c for c in code.co_consts if not isinstance(c, types.CodeType)]
+        )
+    return identity
+
+
+def _host_identity(host: Host) -> Dict[str, Any]:
+    return {
+        "name": host.name,
+        "hostname": host.hostname,
+        "port": host.port,
+        "username": host.username,
+        "platform": host.platform,
+        "groups": list(host.groups),
+        "data": dict(host.items()),
+    }
+
+
+class ResultCache(object):
+    """
+    Base class of the cache backends. Backends implement :meth:`get` and :meth:`set`
+    to keep the pickled results by key and evict them as they see fit.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the value stored under ``key`` or ``None``"""
+        raise NotImplementedError("needs to be implemented by the backend")
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stores ``value`` under ``key``"""
+        raise NotImplementedError("needs to be implemented by the backend")
+
+    def clear(self) -> None:
+        """Removes all the cached results"""
+        raise NotImplementedError("needs to be implemented by the backend")
+
+    def key(self, task: Task) -> str:
+        """Returns the key the result of ``task`` on its host is cached under"""
+        identity = [
+            _task_identity(task),
+            task.params,
+            task.nornir.data.dry_run,
+            _host_identity(task.host),
+        ]
+        try:
+            serialized = json.dumps(identity, sort_keys=True, default=repr)
+        except TypeError:
+            # i.e. dictionaries with keys that can't be sorted
+            serialized = repr(identity)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def load(self, key: str, host: Host) -> Optional[MultiResult]:
+        """Returns the result cached under ``key`` with ``host`` as its host, if any"""
+        data = self.get(key)
+        if data is None:
+            return None
+        try:
+            return worker.loads_result(data, {host.name: host})
+        except Exception:
+            logger.warning("Failed to load cached result %s", key, exc_info=True)
+            return None
+
+    def store(self, key: str, result: MultiResult) -> None:
+        """Caches ``result`` under ``key`` unless it failed or changed the system"""
+        if result.failed or result.changed:
+            return
+        try:
+            data = worker.dumps_result(result)
+        except Exception as e:
+            logger.debug("Result of task %r can't be cached: %s", result.name, e)
+            return
+        self.set(key, data)
+
+
+class MemoryCache(ResultCache):
+    """
+    Keeps up to ``maxsize`` results in memory, evicting the least recently used.
+
+    The cache isn't shared with the worker processes of the ``process`` runner,
+    which get an empty cache of their own.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def __reduce__(self) -> Any:
+        return (self.__class__, (self.maxsize,))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class DiskCache(ResultCache):
+    """
+    Keeps up to ``maxsize`` results as files in the directory ``path``, evicting the
+    least recently used. Results are kept between runs and can be shared by
+    processes, including the worker processes of the ``process`` runner.
+    """
+
+    suffix = ".result"
+
+    def __init__(self, path: str, maxsize: int = 100000) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.path = os.path.expanduser(path)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+        self._count = len(self._files())
+
+    def __reduce__(self) -> Any:
+        return (self.__class__, (self.path, self.maxsize))
+
+    def __len__(self) -> int:
+        return len(self._files())
+
+    def _files(self) -> Dict[str, float]:
+        files = {}
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(self.suffix):
+                try:
+                    files[entry.path] = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+        return files
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key + self.suffix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            # the modification time tells which results were used last
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        path = self._file(key)
+        exists = os.path.exists(path)
+        fd, tmp = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        with self._lock:
+            if not exists:
+                self._count += 1
+            if self._count > self.maxsize:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = self._files()
+        for path in sorted(files, key=files.__getitem__)[: len(files) - self.maxsize]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self._count = min(len(files), self.maxsize)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._files():
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            self._count = 0
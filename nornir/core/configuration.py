@@ -114,11 +114,54 @@ class Jinja2Config(object):
 
 
 class CoreConfig(object):
-    __slots__ = ("num_workers", "raise_on_error")
+    __slots__ = (
+        "num_workers",
+        "raise_on_error",
+        "worker_affinity",
+        "concurrency_limits",
+        "connection_rate",
+        "connection_burst",
+        "connection_rate_by_plugin",
+        "timing_file",
+        "longest_first",
+        "distributed_workers",
+        "distributed_authkey",
+        "result_store_threshold",
+        "result_store_file",
+        "aggregate_errors",
+    )
 
-    def __init__(self, num_workers: int, raise_on_error: bool) -> None:
+    def __init__(
+        self,
+        num_workers: int,
+        raise_on_error: bool,
+        worker_affinity: bool = False,
+        concurrency_limits: Optional[Dict[str, Any]] = None,
+        connection_rate: float = 0,
+        connection_burst: int = 1,
+        connection_rate_by_plugin: Optional[Dict[str, Dict[str, Any]]] = None,
+        timing_file: str = "",
+        longest_first: bool = False,
+        distributed_workers: Optional[List[str]] = None,
+        distributed_authkey: str = "",
+        result_store_threshold: int = 0,
+        result_store_file: str = "",
+        aggregate_errors: bool = False,
+    ) -> None:
         self.num_workers = num_workers
         self.raise_on_error = raise_on_error
+        self.worker_affinity = worker_affinity
+        self.concurrency_limits = concurrency_limits or {}
+        self.connection_rate = connection_rate
+        self.connection_burst = connection_burst
+        self.connection_rate_by_plugin = connection_rate_by_plugin or {}
+        self.timing_file = timing_file
+        self.longest_first = longest_first
+        self.distributed_workers = distributed_workers or []
+        self.distributed_authkey = distributed_authkey
+        self.result_store_threshold = result_store_threshold
+        self.result_store_file = result_store_file
+        self.aggregate_errors = aggregate_errors
 
 
 class Config(object):
@@ -1,5 +1,7 @@
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 
 from nornir.core.configuration import Config
@@ -110,3 +112,84 @@ class Connections(Dict[str, ConnectionPlugin]):
                 f"Connection {name!r} is not registered"
             )
         return cls.available[name]
+
+
+class TokenBucket(object):
+    """
+    Token bucket to limit how often something can happen. The bucket starts full
+    with ``burst`` tokens and is refilled at ``rate`` tokens per second.
+    Each call to :meth:`acquire` takes a token, waiting for one if the bucket is empty.
+
+    Arguments:
+        rate: tokens added to the bucket per second
+        burst: maximum number of tokens the bucket can hold
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_last", "_lock")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate has to be > 0 and burst >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "{}(rate={}, burst={})".format(
+            self.__class__.__name__, self.rate, self.burst
+        )
+
+    def acquire(self) -> None:
+        """Takes a token from the bucket, waiting for it if necessary"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiters: Dict[Tuple[str, float, int], TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _rate_limiter(name: str, rate: float, burst: int) -> TokenBucket:
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get((name, rate, burst))
+        if bucket is None:
+            bucket = TokenBucket(rate, burst)
+            _rate_limiters[(name, rate, burst)] = bucket
+        return bucket
+
+
+def rate_limiters(
+    connection: str, configuration: Optional[Config]
+) -> List[TokenBucket]:
+    """
+    Returns the token buckets that need to be acquired before opening a connection
+    of type ``connection`` according to ``configuration.core``. Buckets are
+    shared by all the hosts.
+    """
+    if configuration is None:
+        return []
+
+    buckets = []
+    core = configuration.core
+    if core.connection_rate:
+        buckets.append(_rate_limiter("", core.connection_rate, core.connection_burst))
+    plugin_limit = core.connection_rate_by_plugin.get(connection)
+    if plugin_limit:
+        buckets.append(
+            _rate_limiter(
+                connection, plugin_limit["rate"], plugin_limit.get("burst", 1)
+            )
+        )
+    return buckets
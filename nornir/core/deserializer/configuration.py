@@ -6,7 +6,7 @@ from typing import Any, Callable, Dict, Optional, Type, Union, List, cast
 from nornir.core import configuration
 from nornir.core.deserializer.inventory import Inventory
 
-from nornir._vendor.pydantic import BaseSettings, Field
+from nornir._vendor.pydantic import BaseModel, BaseSettings, Field
 
 import ruamel.yaml
 
@@ -119,6 +119,23 @@ class Jinja2Config(BaseNornirSettings):
         return configuration.Jinja2Config(filters=jinja_filters)
 
 
+class ConnectionRateConfig(BaseModel):
+    rate: float = Field(
+        ..., gt=0, description="Maximum number of connections per second opened"
+    )
+    burst: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of connections that can be opened at once before ``rate`` "
+            "kicks in"
+        ),
+    )
+
+    class Config:
+        extra = "forbid"
+
+
 class CoreConfig(BaseNornirSettings):
     num_workers: int = Field(
         default=20,
@@ -132,6 +149,92 @@ class CoreConfig(BaseNornirSettings):
             "if at least a host failed"
         ),
     )
+    worker_affinity: bool = Field(
+        default=False,
+        description=(
+            "If set to ``True``, each host is always run by the same worker thread "
+            "across calls to (:obj:`nornir.core.Nornir.run`)"
+        ),
+    )
+    concurrency_limits: Dict[str, Any] = Field(
+        default={},
+        description=(
+            "Maximum number of hosts that can run at the same time for each value of "
+            "the given attributes, i.e. ``{platform: 10}``. "
+            "See :obj:`nornir.core.scheduler.ConcurrencyLimits`"
+        ),
+    )
+    connection_rate: float = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Maximum number of connections per second opened across all hosts, "
+            "``0`` means no limit"
+        ),
+    )
+    connection_burst: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of connections that can be opened at once before "
+            "``connection_rate`` kicks in"
+        ),
+    )
+    connection_rate_by_plugin: Dict[str, ConnectionRateConfig] = Field(
+        default={},
+        description=(
+            "Per connection plugin ``rate`` and ``burst``, i.e. "
+            "``{netmiko: {rate: 5, burst: 10}}``. Applied on top of ``connection_rate``"
+        ),
+    )
+    timing_file: str = Field(
+        default="",
+        description=(
+            "File where the time each task takes on each host is kept between runs. "
+            "If empty, times are only kept in memory"
+        ),
+    )
+    longest_first: bool = Field(
+        default=False,
+        description=(
+            "If set to ``True``, hosts expected to take longer, based on the times "
+            "of previous runs, are started first"
+        ),
+    )
+    distributed_workers: List[str] = Field(
+        default=[],
+        description=(
+            "Worker nodes used by the ``distributed`` runner, either as ``host:port`` "
+            "or as the path of a unix socket"
+        ),
+    )
+    distributed_authkey: str = Field(
+        default="",
+        description="Secret shared with the worker nodes of the ``distributed`` runner",
+    )
+    result_store_threshold: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Results of at least this many characters are moved to disk as hosts "
+            "complete and loaded back when accessed. If ``0``, results are kept in memory"
+        ),
+    )
+    result_store_file: str = Field(
+        default="",
+        description=(
+            "File where results moved to disk are kept. If empty, a temporary file "
+            "is used"
+        ),
+    )
+    aggregate_errors: bool = Field(
+        default=False,
+        description=(
+            "If set to ``True``, instead of logging the traceback of each host that "
+            "fails, a summary grouping the hosts that failed with the same error is "
+            "logged once the task is done. Tracebacks are still logged with DEBUG level"
+        ),
+    )
 
     class Config:
         env_prefix = "NORNIR_CORE_"
@@ -86,7 +86,11 @@ class InventoryElement(BaseAttributes):
     def serialize(cls, e: Union[inventory.Host, inventory.Group]) -> "InventoryElement":
         d = {}
         for f in cls.__fields__:
-            d[f] = object.__getattribute__(e, f)
+            if f in inventory.BaseAttributes.__slots__:
+                # hosts inherit these from their groups, only serialize their own
+                d[f] = getattr(inventory.BaseAttributes, f).__get__(e)
+            else:
+                d[f] = getattr(e, f)
         d["groups"] = list(d["groups"])
         d["connection_options"] = {
             k: ConnectionOptions.serialize(v)
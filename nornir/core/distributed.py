@@ -0,0 +1,247 @@
+"""
+Runs tasks on worker nodes, possibly on other machines.
+
+Nodes are started with::
+
+    NORNIR_DISTRIBUTED_AUTHKEY=secret python -m nornir.core.distributed 0.0.0.0:6000
+
+and listed in ``core.distributed_workers`` so ``Nornir.run(..., runner="distributed")``
+can split the hosts in chunks and send them to the nodes, which run them and send
+the results back. Hosts and results travel the same way they do with the
+``process`` runner, see :mod:`nornir.core.worker`.
+
+Messages are pickled so nodes must only be reachable from trusted machines. Both
+ends authenticate each other with ``authkey`` before exchanging any message.
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import queue
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, cast, Iterable, Iterator, List, Optional, Tuple, Union
+
+from nornir.core import worker
+
+logger = logging.getLogger(__name__)
+
+Address = Union[str, Tuple[str, int]]
+
+AUTHKEY_ENV = "NORNIR_DISTRIBUTED_AUTHKEY"
+
+
+def parse_address(address: Address) -> Address:
+    """
+    Converts ``"host:port"`` to a TCP address and ``"unix:/path"`` or
+    ``"/path"`` to the path of a unix socket.
+    """
+    if not isinstance(address, str):
+        return address
+    if address.startswith("unix:"):
+        return address.partition(":")[2]
+    if address.startswith("/"):
+        return address
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"invalid address {address!r}, expected 'host:port' or a path")
+    return (host, int(port))
+
+
+def _authkey(authkey: Union[str, bytes]) -> bytes:
+    if not authkey:
+        raise ValueError("an authkey is required to talk to worker nodes")
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+
+class Worker(object):
+    """
+    Worker node. Listens on ``address`` and runs the chunks of hosts sent by
+    coordinators, running up to ``num_workers`` hosts of each chunk at the same time.
+
+    Arguments:
+        address: address to listen on, see :func:`parse_address`
+        authkey: secret shared with the coordinators
+        num_workers: default number of hosts of a chunk to run at the same time
+          if the coordinator doesn't specify it
+    """
+
+    def __init__(
+        self, address: Address, authkey: Union[str, bytes], num_workers: int = 20
+    ) -> None:
+        self.num_workers = num_workers
+        self.listener = Listener(parse_address(address), authkey=_authkey(authkey))
+
+    @property
+    def address(self) -> Address:
+        """Address the worker is listening on"""
+        return cast(Address, self.listener.address)
+
+    def serve_forever(self) -> None:
+        """Accepts connections from coordinators until :meth:`close` is called"""
+        while True:
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                return
+            except Exception:
+                logger.warning("Rejected connection", exc_info=True)
+                continue
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    return
+                if message[0] == "close":
+                    return
+                _, payload, num_workers, remaining = message
+                response: Tuple[str, Union[bytes, Exception]]
+                try:
+                    response = ("ok", self._run(payload, num_workers, remaining))
+                except Exception as e:
+                    logger.error("Failed to run chunk", exc_info=True)
+                    response = ("error", Exception(repr(e)))
+                conn.send(response)
+
+    def _run(
+        self, payload: bytes, num_workers: Optional[int], remaining: Optional[float]
+    ) -> bytes:
+        task, hosts, config, data = pickle.loads(payload)
+        # deadlines are relative to the clock of each machine
+        if remaining is not None:
+            task.deadline = time.monotonic() + remaining
+        return worker.run_hosts(
+            task, hosts, config, data, num_workers or self.num_workers
+        )
+
+    def close(self) -> None:
+        """Stops listening for new connections"""
+        self.listener.close()
+
+
+class Coordinator(object):
+    """
+    Sends chunks of hosts to worker nodes and collects their results. Each node
+    gets a chunk at a time and asks for more as it completes them, so faster nodes
+    run more chunks. Chunks sent to nodes that can't be reached or that fail are
+    sent to other nodes.
+
+    Arguments:
+        addresses: addresses of the nodes, see :func:`parse_address`
+        authkey: secret shared with the nodes
+    """
+
+    def __init__(self, addresses: List[Address], authkey: Union[str, bytes]) -> None:
+        if not addresses:
+            raise ValueError("at least a worker node is required")
+        self.addresses = [parse_address(a) for a in addresses]
+        self.authkey = _authkey(authkey)
+
+    def imap_unordered(
+        self,
+        payloads: Iterable[bytes],
+        num_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Union[bytes, Exception]]:
+        """
+        Runs each of the pickled ``(task, hosts, config, data)`` ``payloads`` in a
+        node and yields the pickled results as they arrive, or the exception that
+        prevented running a payload.
+
+        Arguments:
+            payloads: chunks to run, see :func:`nornir.core.worker.run_chunk`
+            num_workers: number of hosts each node runs at the same time
+            timeout: seconds left until the deadline of the task
+        """
+        pending: "queue.Queue[bytes]" = queue.Queue()
+        for payload in payloads:
+            pending.put(payload)
+        results: "queue.Queue[Any]" = queue.Queue()
+        errors: List[Exception] = []
+        done = object()
+
+        def serve(address: Address) -> None:
+            try:
+                conn = Client(address, authkey=self.authkey)
+            except Exception as e:
+                logger.error("Failed to connect to worker node %r: %s", address, e)
+                errors.append(e)
+                results.put(done)
+                return
+            try:
+                while True:
+                    try:
+                        payload = pending.get_nowait()
+                    except queue.Empty:
+                        conn.send(("close",))
+                        return
+                    try:
+                        conn.send(("run", payload, num_workers, timeout))
+                        status, value = conn.recv()
+                    except Exception as e:
+                        logger.error("Lost worker node %r: %s", address, e)
+                        errors.append(e)
+                        # another node will pick it up
+                        pending.put(payload)
+                        return
+                    if status == "error":
+                        # the node couldn't run the chunk, i.e. it failed to load it
+                        logger.error(
+                            "Worker node %r failed to run a chunk: %s", address, value
+                        )
+                        if not isinstance(value, Exception):
+                            value = Exception(value)
+                        errors.append(value)
+                    results.put(value)
+            finally:
+                conn.close()
+                results.put(done)
+
+        threads = [
+            threading.Thread(target=serve, args=(address,), daemon=True)
+            for address in self.addresses
+        ]
+        for t in threads:
+            t.start()
+
+        running = len(threads)
+        while running:
+            value = results.get()
+            if value is done:
+                running -= 1
+            else:
+                yield value
+
+        # chunks left behind by nodes that failed once no node was left to run them
+        while not pending.empty():
+            pending.get_nowait()
+            yield errors[-1]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs a nornir worker node. The authkey shared with the "
+        f"coordinators is read from the {AUTHKEY_ENV} environment variable"
+    )
+    parser.add_argument("address", help="'host:port' or path of a unix socket")
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=20,
+        help="number of hosts of each chunk to run at the same time",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    w = Worker(args.address, os.environ.get(AUTHKEY_ENV, ""), args.num_workers)
+    logger.info("Listening on %r", w.address)
+    w.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Dict, TYPE_CHECKING
+from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from nornir.core.connection import Connection
@@ -102,10 +102,22 @@ class NornirSubTaskError(Exception):
         self.task = task
         self.result = result
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.task, self.result)
+
     def __str__(self) -> str:
         return "Subtask: {} (failed)\n".format(self.task)
 
 
+class NornirTimeoutError(Exception):
+    """
+    Raised by nornir when a task doesn't complete before its deadline, either because
+    it went over its ``task_timeout`` or because the run went over its ``run_timeout``
+    """
+
+    pass
+
+
 class NornirNoValidInventoryError(Exception):
     """
     Raised by nornir when :meth:`nornir.plugins.inventory.parse` fails to load any valid inventory
@@ -1,17 +1,182 @@
-from typing import Any, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from nornir.core.inventory import Host
+from nornir.core.inventory import Host, Inventory
+
+Predicate = Callable[[Any], bool]
+
+# names of the hosts a filter may match and whether all of them match
+Plan = Optional[Tuple[Set[str], bool]]
+
+
+def _intersection(plans: Iterable[Plan]) -> Plan:
+    names: Optional[Set[str]] = None
+    exact = True
+    for plan in plans:
+        if plan is None:
+            exact = False
+            continue
+        names = plan[0] if names is None else names & plan[0]
+        exact = exact and plan[1]
+    if names is None:
+        return None
+    return names, exact
+
+
+def _union(plans: Iterable[Plan]) -> Plan:
+    names: Set[str] = set()
+    exact = True
+    for plan in plans:
+        if plan is None:
+            return None
+        names = names | plan[0]
+        exact = exact and plan[1]
+    return names, exact
+
+
+def _has(t: type, name: str) -> bool:
+    """Whether the instances of ``t`` get the attribute ``name`` from their class"""
+    return any(name in vars(c) for c in t.__mro__)
+
+
+def _static(t: type) -> bool:
+    """
+    Whether all the instances of ``t`` have the attributes of ``t`` and nothing else,
+    so what a rule does with them can be resolved once per type
+    """
+    return (
+        t.__dictoffset__ == 0
+        and not _has(t, "__getattr__")
+        and (
+            t.__module__ == "builtins" or t.__getattribute__ is object.__getattribute__
+        )
+    )
+
+
+def _by_type(resolve: Callable[[type], Predicate]) -> Predicate:
+    """
+    Returns a function that calls the function ``resolve`` returns for the type of
+    its argument, resolving it the first time it sees the type
+    """
+    resolved: Dict[type, Predicate] = {}
+
+    def call(data: Any) -> Any:
+        t = type(data)
+        f = resolved.get(t)
+        if f is None:
+            f = resolved[t] = resolve(t)
+        return f(data)
+
+    return call
+
+
+def _host_getter(key: str) -> Callable[[Any], Any]:
+    """Returns a function equivalent to ``host.get(key, {})``"""
+
+    def resolve(t: type) -> Callable[[Any], Any]:
+        if not _static(t) or getattr(t, "get", None) is not Host.get:
+            return lambda data: data.get(key, {})
+        if _has(t, key):
+            return lambda host: getattr(host, key)
+
+        def item(host: Host) -> Any:
+            try:
+                return host[key]
+            except KeyError:
+                return {}
+
+        return item
+
+    return _by_type(resolve)
+
+
+def _item_getter(key: str) -> Callable[[Any], Any]:
+    """Returns a function equivalent to ``data.get(key, {})``"""
+
+    def get(data: Any) -> Any:
+        return data.get(key, {})
+
+    return get
+
+
+def _check(op: str, value: Any) -> Predicate:
+    """Returns a function equivalent to ``F._verify_rules(data, [op], value)``"""
+    operator = "__{}__".format(op)
+
+    def resolve(t: type) -> Predicate:
+        if not _static(t):
+            return lambda data: F._verify_rules(data, [op], value)
+        if _has(t, operator):
+            return lambda data: bool(getattr(data, operator)(value))
+        if _has(t, op):
+
+            def attribute(data: Any) -> bool:
+                a = getattr(data, op)
+                return bool(a(value)) if callable(a) else bool(a == value)
+
+            return attribute
+        if op == "in":
+            return lambda data: bool(data in value)
+        if op == "any":
+            return lambda data: any([x in data for x in value])
+        if op == "all":
+            return lambda data: all([x in data for x in value])
+        return lambda data: bool(data.get(op) == value)
+
+    return _by_type(resolve)
+
+
+def _compile_rule(key: str, value: Any) -> Predicate:
+    """Returns a function equivalent to ``F._verify_rules(host, rule, value)``"""
+    *path, op = key.split("__")
+    check = _check(op, value)
+    if not path:
+        return check
+    getters = [_host_getter(path[0])]
+    getters.extend(_item_getter(k) for k in path[1:])
+
+    def rule(host: Host) -> bool:
+        data = host
+        try:
+            for get in getters:
+                data = get(data)
+            return check(data)
+        except AttributeError:
+            return False
+
+    return rule
 
 
 class F_BASE(object):
     def __call__(self, host: Host) -> bool:
         raise NotImplementedError()
 
+    def _compile(self) -> Predicate:
+        """
+        Returns a function equivalent to calling the filter, with the parsing of
+        its rules done once
+        """
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # compiled filters are closures, compile them again once unpickled
+        state = dict(self.__dict__)
+        state["_compiled"] = None
+        return state
+
+    def _candidates(self, inventory: Inventory) -> Plan:
+        """
+        Returns the names of the hosts of ``inventory`` the filter may match and
+        whether all of them match, answered from the indexes of the inventory, or
+        ``None`` if it may match any host
+        """
+        return None
+
 
 class F_OP_BASE(F_BASE):
     def __init__(self, op1: F_BASE, op2: F_BASE) -> None:
         self.op1 = op1
         self.op2 = op2
+        self._compiled: Optional[Predicate] = None
 
     def __and__(self, other: F_BASE) -> "AND":
         return AND(self, other)
@@ -25,22 +190,60 @@ class F_OP_BASE(F_BASE):
 
 class AND(F_OP_BASE):
     def __call__(self, host: Host) -> bool:
-        return self.op1(host) and self.op2(host)
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled(host)
+
+    def _compile(self) -> Predicate:
+        op1 = self.op1._compile()
+        op2 = self.op2._compile()
+        return lambda host: op1(host) and op2(host)
+
+    def _candidates(self, inventory: Inventory) -> Plan:
+        return _intersection(
+            (self.op1._candidates(inventory), self.op2._candidates(inventory))
+        )
 
 
 class OR(F_OP_BASE):
     def __call__(self, host: Host) -> bool:
-        return self.op1(host) or self.op2(host)
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled(host)
+
+    def _compile(self) -> Predicate:
+        op1 = self.op1._compile()
+        op2 = self.op2._compile()
+        return lambda host: op1(host) or op2(host)
+
+    def _candidates(self, inventory: Inventory) -> Plan:
+        return _union(
+            (self.op1._candidates(inventory), self.op2._candidates(inventory))
+        )
 
 
 class F(F_BASE):
     def __init__(self, **kwargs: Any) -> None:
         self.filters = kwargs
+        self._compiled: Optional[Predicate] = None
 
     def __call__(self, host: Host) -> bool:
-        return all(
-            F._verify_rules(host, k.split("__"), v) for k, v in self.filters.items()
-        )
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled(host)
+
+    def _compile(self) -> Predicate:
+        rules = tuple(_compile_rule(k, v) for k, v in self.filters.items())
+        if len(rules) == 1:
+            return rules[0]
+
+        def all_rules(host: Host) -> bool:
+            for rule in rules:
+                if not rule(host):
+                    return False
+            return True
+
+        return all_rules
 
     def __and__(self, other: "F") -> AND:
         return AND(self, other)
@@ -54,6 +257,24 @@ class F(F_BASE):
     def __repr__(self) -> str:
         return "<Filter ({})>".format(self.filters)
 
+    def _candidates(self, inventory: Inventory) -> Plan:
+        return _intersection(
+            F._plan_rule(inventory, k, v) for k, v in self.filters.items()
+        )
+
+    @staticmethod
+    def _plan_rule(inventory: Inventory, key: str, value: Any) -> Plan:
+        if key in ("has_parent_group", "groups__contains") and isinstance(value, str):
+            members = inventory._group_members(value)
+            if members is None:
+                return None
+            # members of the group through other groups don't contain it
+            return members, key == "has_parent_group"
+        rule = key.split("__")
+        if len(rule) > 2:
+            return None
+        return inventory._lookup(rule[0], rule[1] if len(rule) == 2 else "", value)
+
     @staticmethod
     def _verify_rules(data: Any, rule: List[str], value: Any) -> bool:
         if len(rule) > 1:
@@ -90,13 +311,25 @@ class F(F_BASE):
 
 
 class NOT_F(F):
-    def __call__(self, host: Host) -> bool:
-        return not any(
-            F._verify_rules(host, k.split("__"), v) for k, v in self.filters.items()
-        )
+    def _compile(self) -> Predicate:
+        rules = tuple(_compile_rule(k, v) for k, v in self.filters.items())
+
+        def no_rule(host: Host) -> bool:
+            for rule in rules:
+                if rule(host):
+                    return False
+            return True
+
+        return no_rule
 
     def __invert__(self) -> F:
         return F(**self.filters)
 
     def __repr__(self) -> str:
         return "<Filter NOT ({})>".format(self.filters)
+
+    def _candidates(self, inventory: Inventory) -> Plan:
+        plan = _union(F._plan_rule(inventory, k, v) for k, v in self.filters.items())
+        if plan is None or not plan[1]:
+            return None
+        return set(inventory.hosts) - plan[0], True
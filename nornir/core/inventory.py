@@ -1,16 +1,172 @@
+import bisect
+import math
 import warnings
 from collections import UserList
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import (
+    Any,
+    Dict,
+    ItemsView,
+    KeysView,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    ValuesView,
+)
 
 from nornir.core import deserializer
 from nornir.core.configuration import Config
 from nornir.core.connections import (
     ConnectionPlugin,
     Connections,
+    rate_limiters,
 )
 from nornir.core.exceptions import ConnectionAlreadyOpen, ConnectionNotOpen
 
 
+class _Generation(object):
+    """
+    Token replaced every time something hosts cache views of changes, the views are
+    valid while it stays the same. Tokens aren't integers so views cached by hosts
+    that are pickled and loaded in other processes never look valid there.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = object()
+
+    def bump(self) -> None:
+        self.value = object()
+
+
+# changes to the data or attributes of any host, group or defaults
+_generation = _Generation()
+# changes to the groups or defaults of any host or group
+_structure = _Generation()
+
+
+class ElementData(Dict[str, Any]):
+    """
+    Dictionary holding the ``data`` of hosts, groups and defaults. It's a regular
+    dictionary that invalidates the data hosts have cached when it changes.
+    """
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        _generation.bump()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        _generation.bump()
+
+    def __ior__(self, other: Any) -> "ElementData":  # type: ignore
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        super().update(*args, **kwargs)
+        _generation.bump()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        _generation.bump()
+        return value
+
+    def pop(self, key: str, *args: Any) -> Any:
+        value = super().pop(key, *args)
+        _generation.bump()
+        return value
+
+    def popitem(self) -> Any:
+        item = super().popitem()
+        _generation.bump()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        _generation.bump()
+
+
+class _TrackedList(List[Any]):
+    """
+    List holding the parent groups of hosts and groups, or their names. It's a
+    regular list that invalidates the views hosts have cached when it changes.
+    """
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        _changed_groups()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        _changed_groups()
+
+    def __iadd__(self, other: Any) -> "_TrackedList":  # type: ignore
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: Any) -> "_TrackedList":
+        super().__imul__(n)
+        _changed_groups()
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        _changed_groups()
+
+    def extend(self, values: Any) -> None:
+        super().extend(values)
+        _changed_groups()
+
+    def insert(self, index: Any, value: Any) -> None:
+        super().insert(index, value)
+        _changed_groups()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        _changed_groups()
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        _changed_groups()
+
+    def clear(self) -> None:
+        super().clear()
+        _changed_groups()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        _changed_groups()
+
+    def reverse(self) -> None:
+        super().reverse()
+        _changed_groups()
+
+
+def _changed_groups() -> None:
+    _structure.bump()
+    _generation.bump()
+
+
+def _get_data(self: Any) -> ElementData:
+    return self._data
+
+
+def _set_data(self: Any, data: Optional[Dict[str, Any]]) -> None:
+    self._data = data if isinstance(data, ElementData) else ElementData(data or {})
+    _generation.bump()
+
+
+_DATA_DOC = """
+Data of the element. Dictionaries assigned to it are copied into an
+:obj:`ElementData` so changes made through the attribute are tracked, later
+changes to the original dictionary aren't seen by the element.
+"""
+
+
 class BaseAttributes(object):
     __slots__ = ("hostname", "port", "username", "password", "platform")
 
@@ -47,18 +203,45 @@ class ConnectionOptions(BaseAttributes):
 
 
 class ParentGroups(UserList):
-    __slots__ = "refs"
+    __slots__ = ("_data", "_refs")
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.refs: List["Group"] = kwargs.get("refs", [])
 
+    @property
+    def data(self) -> List[str]:
+        """Names of the parent groups"""
+        return self._data
+
+    @data.setter
+    def data(self, data: List[str]) -> None:
+        self._data = _TrackedList(data)
+        _changed_groups()
+
+    @property
+    def refs(self) -> List["Group"]:
+        """Parent groups, the list is copied when assigned"""
+        return self._refs
+
+    @refs.setter
+    def refs(self, refs: List["Group"]) -> None:
+        old = getattr(self, "_refs", None)
+        self._refs = _TrackedList(refs)
+        # filtering an inventory assigns again the same groups to all the hosts
+        if (
+            old is None
+            or len(old) != len(refs)
+            or any(a is not b for a, b in zip(old, refs))
+        ):
+            _changed_groups()
+
     def __contains__(self, value) -> bool:
         return value in self.data or value in self.refs
 
 
 class InventoryElement(BaseAttributes):
-    __slots__ = ("groups", "data", "connection_options")
+    __slots__ = ("groups", "_data", "connection_options")
 
     def __init__(
         self,
@@ -68,13 +251,32 @@ class InventoryElement(BaseAttributes):
         **kwargs,
     ) -> None:
         self.groups = groups or ParentGroups()
-        self.data = data or {}
+        self.data = data
         self.connection_options = connection_options or {}
         super().__init__(**kwargs)
 
+    data = property(_get_data, _set_data, doc=_DATA_DOC)
+
+
+def _tracked(name: str) -> property:
+    """Returns a property for the attribute ``name`` that tracks its changes"""
+    slot = getattr(BaseAttributes, name)
+
+    def fset(self: BaseAttributes, value: Any) -> None:
+        slot.__set__(self, value)
+        _generation.bump()
+
+    return property(slot.__get__, fset)
+
 
 class Defaults(BaseAttributes):
-    __slots__ = ("data", "connection_options")
+    __slots__ = ("_data", "connection_options")
+
+    hostname = _tracked("hostname")
+    port = _tracked("port")
+    username = _tracked("username")
+    password = _tracked("password")
+    platform = _tracked("platform")
 
     def __init__(
         self,
@@ -82,13 +284,45 @@ class Defaults(BaseAttributes):
         connection_options: Optional[Dict[str, ConnectionOptions]] = None,
         **kwargs,
     ) -> None:
-        self.data = data or {}
+        self.data = data
         self.connection_options = connection_options or {}
         super().__init__(**kwargs)
 
+    data = property(_get_data, _set_data, doc=_DATA_DOC)
+
+
+def _inherited(name: str) -> property:
+    """
+    Returns a property for the attribute ``name`` that falls back to the value of
+    the first ancestor that has it set
+    """
+    slot = getattr(BaseAttributes, name)
+
+    def fget(self: "Host") -> Any:
+        v = slot.__get__(self)
+        if v is not None:
+            return v
+        for e in self._ancestors():
+            v = slot.__get__(e)
+            if v is not None:
+                return v
+        return None
+
+    def fset(self: "Host", value: Any) -> None:
+        slot.__set__(self, value)
+        _generation.bump()
+
+    return property(fget, fset)
+
 
 class Host(InventoryElement):
-    __slots__ = ("name", "connections", "defaults")
+    __slots__ = ("name", "connections", "_defaults", "_resolved", "_chain")
+
+    hostname = _inherited("hostname")
+    port = _inherited("port")
+    username = _inherited("username")
+    password = _inherited("password")
+    platform = _inherited("platform")
 
     def __init__(
         self, name: str, defaults: Optional[Defaults] = None, **kwargs
@@ -96,34 +330,77 @@ class Host(InventoryElement):
         self.name = name
         self.defaults = defaults or Defaults()
         self.connections: Connections = Connections()
+        self._resolved: Optional[Tuple[object, Dict[str, Any]]] = None
+        self._chain: Optional[Tuple[object, Tuple[BaseAttributes, ...]]] = None
         super().__init__(**kwargs)
 
-    def _resolve_data(self):
-        processed = []
-        result = {}
-        for k, v in self.data.items():
-            processed.append(k)
-            result[k] = v
-        for g in self.groups.refs:
-            for k, v in g.items():
-                if k not in processed:
-                    processed.append(k)
+    @property
+    def defaults(self) -> Defaults:
+        return self._defaults
+
+    @defaults.setter
+    def defaults(self, defaults: Defaults) -> None:
+        self._defaults = defaults
+        _structure.bump()
+        _generation.bump()
+
+    def _ancestors(self) -> Tuple[BaseAttributes, ...]:
+        """
+        Returns the groups and defaults the host inherits from, in the order they are
+        looked up: each group is followed by its own ancestors and the first group
+        by the defaults. Groups reached through more than a path only appear the first
+        time. It's cached until the groups or defaults of any host or group change.
+        """
+        structure = _structure.value
+        chain = self._chain
+        if chain is not None and chain[0] is structure:
+            return chain[1]
+
+        ancestors: List[BaseAttributes] = []
+        seen = {id(self)}
+
+        def visit(element: "Host") -> None:
+            for e in (*element.groups.refs, element.defaults):
+                if id(e) in seen:
+                    continue
+                seen.add(id(e))
+                ancestors.append(e)
+                if isinstance(e, Host):
+                    visit(e)
+
+        visit(self)
+        result = tuple(ancestors)
+        self._chain = (structure, result)
+        return result
+
+    def _resolve_data(self) -> Dict[str, Any]:
+        """
+        Returns the data of the host merged with the data of its groups and defaults.
+        It's cached until the data of any host, group or defaults changes, so it
+        must not be modified.
+        """
+        generation = _generation.value
+        resolved = self._resolved
+        if resolved is not None and resolved[0] is generation:
+            return resolved[1]
+
+        result = dict(self.data)
+        for e in self._ancestors():
+            for k, v in e.data.items():
+                if k not in result:
                     result[k] = v
-        for k, v in self.defaults.data.items():
-            if k not in processed:
-                processed.append(k)
-                result[k] = v
+        self._resolved = (generation, result)
         return result
 
-    def keys(self):
+    def keys(self) -> KeysView[str]:
         """Returns the keys of the attribute ``data`` and of the parent(s) groups."""
         return self._resolve_data().keys()
 
-    def values(self):
+    def values(self) -> ValuesView[Any]:
         """Returns the values of the attribute ``data`` and of the parent(s) groups."""
         return self._resolve_data().values()
 
-    def items(self):
+    def items(self) -> ItemsView[str, Any]:
         """
         Returns all the data accessible from a device, including
         the one inherited from parent groups
@@ -139,46 +416,30 @@ class Host(InventoryElement):
             return self._has_parent_group_by_object(group)
 
     def _has_parent_group_by_name(self, group):
-        for g in self.groups.refs:
-            if g.name == group or g.has_parent_group(group):
+        for e in self._ancestors():
+            if isinstance(e, Host) and e.name == group:
                 return True
+        return False
 
     def _has_parent_group_by_object(self, group):
-        for g in self.groups.refs:
-            if g is group or g.has_parent_group(group):
+        for e in self._ancestors():
+            if isinstance(e, Host) and e is group:
                 return True
+        return False
 
     def __getitem__(self, item):
-        try:
-            return self.data[item]
-
-        except KeyError:
-            for g in self.groups.refs:
-                try:
-                    r = g[item]
-                    return r
-                except KeyError:
-                    continue
-
-            r = self.defaults.data.get(item)
-            if r is not None:
-                return r
-
-            raise
-
-    def __getattribute__(self, name):
-        if name not in ("hostname", "port", "username", "password", "platform"):
-            return object.__getattribute__(self, name)
-        v = object.__getattribute__(self, name)
-        if v is None:
-            for g in self.groups.refs:
-                r = getattr(g, name)
-                if r is not None:
-                    return r
-
-            return object.__getattribute__(self.defaults, name)
-        else:
-            return v
+        data = self.data
+        if item in data:
+            return data[item]
+        for e in self._ancestors():
+            data = e.data
+            if isinstance(e, Defaults):
+                # values set to None in the defaults are the same as not set
+                if data.get(item) is not None:
+                    return data[item]
+            elif item in data:
+                return data[item]
+        raise KeyError(item)
 
     def __bool__(self):
         return bool(self.name)
@@ -198,7 +459,7 @@ class Host(InventoryElement):
     def __repr__(self):
         return "{}: {}".format(self.__class__.__name__, self.name or "")
 
-    def get(self, item, default=None):
+    def get(self, item: str, default: Any = None) -> Any:
         """
         Returns the value ``item`` from the host or hosts group variables.
 
@@ -333,6 +594,9 @@ class Host(InventoryElement):
         If ``default_to_host_attributes`` is set to ``True`` arguments will default to host
         attributes if not specified.
 
+        If ``core.connection_rate`` or ``core.connection_rate_by_plugin`` are set, this
+        method waits as needed so connections are opened at the configured rate.
+
         Raises:
             AttributeError: if it's unknown how to establish a connection for the given type
 
@@ -355,6 +619,9 @@ class Host(InventoryElement):
             platform = platform if platform is not None else conn_params.platform
             extras = extras if extras is not None else conn_params.extras
 
+        for bucket in rate_limiters(conn_name, configuration):
+            bucket.acquire()
+
         conn_obj.open(
             hostname=hostname,
             username=username,
@@ -388,6 +655,150 @@ class Group(Host):
     pass
 
 
+# types whose values are kept sorted by the sorted indexes
+_SORTABLE = (int, float, str)
+_RANGES = ("gt", "ge", "lt", "le")
+
+
+class _HostIndex(object):
+    """
+    Index of the names of the hosts of an inventory by the value of an attribute or
+    data key, as returned by ``host.get(key)``. Sorted indexes also keep the values of
+    each type in :data:`_SORTABLE` sorted to answer ranges.
+
+    Lookups return the names of the hosts that may match and whether all of them
+    match. Hosts whose values can't be hashed or sorted are always returned as hosts
+    that may match, so filters can be evaluated on them. The index is built again
+    on the next lookup after the data, attributes or groups of any element change.
+    """
+
+    __slots__ = (
+        "key",
+        "sorted",
+        "hosts",
+        "_token",
+        "_values",
+        "_missing",
+        "_unhashable",
+        "_ranges",
+        "_unsorted",
+    )
+
+    def __init__(self, key: str, hosts: Dict[str, Host], sorted: bool = False):
+        self.key = key
+        self.sorted = sorted
+        self.hosts = hosts
+        self._token: Optional[Tuple[object, object, int]] = None
+
+    def _refresh(self) -> None:
+        token = self._token
+        if (
+            token is not None
+            and token[0] is _generation.value
+            and token[1] is _structure.value
+            and token[2] == len(self.hosts)
+        ):
+            return
+
+        values: Dict[Any, Set[str]] = {}
+        missing: Set[str] = set()
+        unhashable: Set[str] = set()
+        sortable: Dict[type, List[Tuple[Any, str]]] = {}
+        unsorted: Set[str] = set()
+        key = self.key
+        for name, host in self.hosts.items():
+            if hasattr(host, key):
+                value = getattr(host, key)
+            else:
+                try:
+                    value = host[key]
+                except KeyError:
+                    # filters see missing keys as None but nested rules as {}
+                    value = None
+                    missing.add(name)
+            try:
+                values.setdefault(value, set()).add(name)
+            except TypeError:
+                unhashable.add(name)
+            if not self.sorted:
+                continue
+            if (
+                type(value) in _SORTABLE
+                and name not in missing
+                and not (isinstance(value, float) and math.isnan(value))
+            ):
+                sortable.setdefault(type(value), []).append((value, name))
+            else:
+                unsorted.add(name)
+
+        ranges = {}
+        for t, pairs in sortable.items():
+            pairs.sort(key=lambda p: p[0])
+            ranges[t] = ([p[0] for p in pairs], [p[1] for p in pairs])
+
+        self._values = values
+        self._missing = missing
+        self._unhashable = unhashable
+        self._ranges = ranges
+        self._unsorted = unsorted
+        self._token = (_generation.value, _structure.value, len(self.hosts))
+
+    def equal(self, value: Any) -> Optional[Tuple[Set[str], bool]]:
+        """Hosts where ``host.get(key) == value``"""
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        self._refresh()
+        names = self._values.get(value, set())
+        if self._unhashable:
+            return names | self._unhashable, False
+        return names, True
+
+    def within(self, values: Any) -> Optional[Tuple[Set[str], bool]]:
+        """Hosts where the value of ``key`` is in ``values``"""
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            return None
+        try:
+            for v in values:
+                hash(v)
+        except TypeError:
+            return None
+        self._refresh()
+        names: Set[str] = set()
+        for v in values:
+            names |= self._values.get(v, set())
+        names -= self._missing
+        if self._unhashable:
+            return names | self._unhashable, False
+        return names, True
+
+    def range(self, op: str, value: Any) -> Optional[Tuple[Set[str], bool]]:
+        """Hosts where the value of ``key`` is greater or lower than ``value``"""
+        if not self.sorted or type(value) not in _SORTABLE:
+            return None
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        self._refresh()
+        # values of other types are compared by the filters themselves
+        others = set(self._unsorted)
+        for t, (_, names) in self._ranges.items():
+            if t is not type(value):
+                others.update(names)
+        keys, names = self._ranges.get(type(value), ([], []))
+        if op == "gt":
+            matches = names[bisect.bisect_right(keys, value) :]
+        elif op == "ge":
+            matches = names[bisect.bisect_left(keys, value) :]
+        elif op == "lt":
+            matches = names[: bisect.bisect_left(keys, value)]
+        else:
+            matches = names[: bisect.bisect_right(keys, value)]
+        if others:
+            return others.union(matches), False
+        return set(matches), True
+
+
 class Hosts(Dict[str, Host]):
     pass
 
@@ -397,7 +808,7 @@ class Groups(Dict[str, Group]):
 
 
 class Inventory(object):
-    __slots__ = ("hosts", "groups", "defaults")
+    __slots__ = ("hosts", "groups", "defaults", "_members", "_indexes", "_root")
 
     def __init__(
         self,
@@ -420,9 +831,145 @@ class Inventory(object):
             for h in self.hosts.values():
                 transform_function(h, **transform_function_options)
 
+        self._members: Optional[Tuple[object, Dict[str, Set[str]]]] = None
+        self._index_members()
+        self._indexes: Dict[str, _HostIndex] = {}
+        self._root = self
+
+    def _view(self, hosts: Dict[str, Host]) -> "Inventory":
+        """
+        Returns an inventory with ``hosts``, some of the hosts of this one, that shares
+        its groups, defaults and indexes, without setting up the hosts again
+        """
+        inv = Inventory.__new__(Inventory)
+        inv.hosts = hosts
+        inv.groups = self.groups
+        inv.defaults = self.defaults
+        inv._members = None
+        inv._indexes = dict(self._indexes)
+        inv._root = self._root
+        return inv
+
+    def _same_root(self, other: Any) -> bool:
+        if not isinstance(other, Inventory):
+            return False
+        if other._root is not self._root:
+            raise ValueError(
+                "only inventories filtered from the same one can be combined"
+            )
+        return True
+
+    def __or__(self, other: "Inventory") -> "Inventory":
+        """Hosts of either inventory, both filtered from the same one"""
+        if not self._same_root(other):
+            return NotImplemented
+        hosts = dict(self.hosts)
+        for n, h in other.hosts.items():
+            hosts.setdefault(n, h)
+        return self._view(hosts)
+
+    def __and__(self, other: "Inventory") -> "Inventory":
+        """Hosts of both inventories, both filtered from the same one"""
+        if not self._same_root(other):
+            return NotImplemented
+        return self._view({n: h for n, h in self.hosts.items() if n in other.hosts})
+
+    def __sub__(self, other: "Inventory") -> "Inventory":
+        """Hosts of this inventory but not of ``other``, both filtered from the same one"""
+        if not self._same_root(other):
+            return NotImplemented
+        return self._view({n: h for n, h in self.hosts.items() if n not in other.hosts})
+
+    def create_index(self, key: str, sorted: bool = False) -> None:
+        """
+        Indexes the hosts by the value of ``key``, an attribute like ``platform`` or a
+        data key, so filters comparing it are answered without evaluating them on
+        every host. Hash indexes answer ``F(key=value)``, ``F(key__in=[...])`` and
+        ``filter(key=value)``, and sorted indexes ``F(key__gt=value)``, ``ge``, ``lt``
+        and ``le`` too. Inventories filtered from this one share its indexes.
+
+        Arguments:
+            key: attribute or data key to index
+            sorted: whether to keep the values sorted to answer ranges
+        """
+        if "__" in key:
+            raise ValueError(f"can't index nested key {key!r}")
+        if callable(getattr(Host, key, None)):
+            raise ValueError(f"can't index method {key!r}")
+        self._indexes[key] = _HostIndex(key, self.hosts, sorted=sorted)
+
+    def drop_index(self, key: str) -> None:
+        """Removes the index of ``key``"""
+        del self._indexes[key]
+
+    def _lookup(self, key: str, op: str, value: Any) -> Optional[Tuple[Set[str], bool]]:
+        """
+        Returns the names of the hosts the rule ``key__op=value`` may match and
+        whether all of them match, or ``None`` if it can't be answered from the
+        indexes. ``op`` is empty for equality.
+        """
+        index = self._indexes.get(key)
+        if index is None:
+            return None
+        if not op:
+            return index.equal(value)
+        if op == "in":
+            return index.within(value)
+        if op in _RANGES:
+            return index.range(op, value)
+        return None
+
+    def _index_members(self) -> Dict[str, Set[str]]:
+        """
+        Builds the index of the names of the hosts that belong to each group, directly
+        or through other groups
+        """
+        members: Dict[str, Set[str]] = {}
+        for name, host in self.hosts.items():
+            for e in host._ancestors():
+                if isinstance(e, Host):
+                    members.setdefault(e.name, set()).add(name)
+        self._members = (_structure.value, members)
+        return members
+
+    def _group_members(self, group: Union[str, Group]) -> Optional[Set[str]]:
+        """
+        Returns the names of the hosts that belong to ``group``, directly or through
+        other groups, or ``None`` if ``group`` isn't a group of the inventory. The
+        index is built again if the groups of any host or group changed since it was
+        last updated.
+        """
+        if not isinstance(group, str):
+            if self.groups.get(group.name) is not group:
+                return None
+            group = group.name
+        # filtered inventories use the index of the inventory they were filtered
+        # from, their hosts are a subset of its hosts
+        root = self._root
+        index = root._valid_members()
+        if index is None:
+            index = root._index_members()
+        return index.get(group, set())
+
     def filter(self, filter_obj=None, filter_func=None, *args, **kwargs):
         filter_func = filter_obj or filter_func
         if filter_func:
+            candidates = getattr(filter_func, "_candidates", None)
+            plan = candidates(self) if candidates and not kwargs else None
+        else:
+            plan = self._plan_kwargs(kwargs)
+
+        if plan is not None and plan[1]:
+            # answered by the indexes
+            names = plan[0]
+            filtered = {n: h for n, h in self.hosts.items() if n in names}
+        elif plan is not None:
+            names = plan[0]
+            check = filter_func or (
+                lambda h: all(h.get(k) == v for k, v in kwargs.items())
+            )
+            filtered = {n: h for n, h in self.hosts.items() if n in names and check(h)}
+        elif filter_func:
             filtered = {n: h for n, h in self.hosts.items() if filter_func(h, **kwargs)}
         else:
             filtered = {
@@ -430,7 +977,21 @@ class Inventory(object):
                 for n, h in self.hosts.items()
                 if all(h.get(k) == v for k, v in kwargs.items())
             }
-        return Inventory(hosts=filtered, groups=self.groups, defaults=self.defaults)
+        return self._view(filtered)
+
+    def _plan_kwargs(self, kwargs: Dict[str, Any]) -> Optional[Tuple[Set[str], bool]]:
+        names: Optional[Set[str]] = None
+        exact = True
+        for k, v in kwargs.items():
+            plan = self._lookup(k, "", v)
+            if plan is None:
+                exact = False
+                continue
+            names = plan[0] if names is None else names & plan[0]
+            exact = exact and plan[1]
+        if names is None:
+            return None
+        return names, exact
 
     def __len__(self):
         return self.hosts.__len__()
@@ -451,31 +1012,61 @@ class Inventory(object):
         Returns set of hosts that belongs to a group including those that belong
         indirectly via inheritance
         """
-        hosts: List[Host] = set()
+        names = self._group_members(group)
+        if names is not None:
+            return {self.hosts[n] for n in names if n in self.hosts}
+
+        hosts: Set[Host] = set()
         for host in self.hosts.values():
             if host.has_parent_group(group):
                 hosts.add(host)
         return hosts
 
+    def _valid_members(self) -> Optional[Dict[str, Set[str]]]:
+        members = self._members
+        if members is None or members[0] is not _structure.value:
+            return None
+        return members[1]
+
     def add_host(self, name: str, **kwargs) -> None:
         """
         Add a host to the inventory after initialization
         """
+        if self._root is not self:
+            # filtered inventories share the hosts of the inventory they come from
+            self._root.add_host(name, **kwargs)
+            self.hosts[name] = self._root.hosts[name]
+            return
+        index = self._valid_members() if name not in self.hosts else None
         host_element = deserializer.inventory.InventoryElement.deserialize_host(
             name=name, defaults=self.defaults, **kwargs
         )
-        host = {name: self._update_group_refs(host_element)}
-        self.hosts.update(host)
+        self._update_group_refs(host_element)
+        self.hosts[name] = host_element
+
+        if index is not None:
+            for e in host_element._ancestors():
+                if isinstance(e, Host):
+                    index.setdefault(e.name, set()).add(name)
+            self._members = (_structure.value, index)
 
     def add_group(self, name: str, **kwargs) -> None:
         """
         Add a group to the inventory after initialization
         """
+        if self._root is not self:
+            self._root.add_group(name, **kwargs)
+            return
+        index = self._valid_members() if name not in self.groups else None
         group_element = deserializer.inventory.InventoryElement.deserialize_group(
             name=name, defaults=self.defaults, **kwargs
         )
-        group = {name: self._update_group_refs(group_element)}
-        self.groups.update(group)
+        self._update_group_refs(group_element)
+        self.groups[name] = group_element
+
+        if index is not None:
+            # no host belongs to a new group yet
+            self._members = (_structure.value, index)
 
     def dict(self) -> Dict:
         """
@@ -0,0 +1,85 @@
+import logging
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from nornir.core import worker
+from nornir.core.inventory import Host
+from nornir.core.task import MultiResult
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal(object):
+    """
+    Keeps the results of the hosts that complete a task successfully in a SQLite
+    database as they complete, so a run interrupted halfway can be resumed with
+    ``nr.run(task, resume=journal)`` without running again the hosts that completed.
+    Hosts that failed aren't recorded so they are run again when resuming.
+
+    Results are recorded by task name, use a different journal, or :meth:`clear` it,
+    to run the same task again from scratch.
+
+    Arguments:
+        path: file of the database, created if it doesn't exist
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "task TEXT NOT NULL, host TEXT NOT NULL, result BLOB NOT NULL, "
+            "PRIMARY KEY (task, host))"
+        )
+
+    def record(self, task: str, host: str, result: MultiResult) -> None:
+        """Records the ``result`` of ``host`` for ``task``"""
+        try:
+            data = worker.dumps_result(result)
+        except Exception as e:
+            logger.warning(
+                "Host %r: result of task %r can't be recorded in the journal: %s",
+                host,
+                task,
+                e,
+            )
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (task, host, result) VALUES (?, ?, ?)",
+                (task, host, data),
+            )
+
+    def load(self, task: str, hosts: Dict[str, Host]) -> Dict[str, MultiResult]:
+        """
+        Returns the recorded results of ``task`` for ``hosts``, a dictionary of hosts
+        by name
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT host, result FROM results WHERE task = ?", (task,)
+            ).fetchall()
+        return {
+            host: worker.loads_result(data, hosts)
+            for host, data in rows
+            if host in hosts
+        }
+
+    def clear(self, task: Optional[str] = None) -> None:
+        """Removes the results of ``task`` or of all the tasks if ``None``"""
+        with self._lock:
+            if task is None:
+                self._conn.execute("DELETE FROM results")
+            else:
+                self._conn.execute("DELETE FROM results WHERE task = ?", (task,))
+
+    def close(self) -> None:
+        """Closes the database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,170 @@
+import itertools
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional, Set
+
+_local = threading.local()
+
+
+class WorkerPool(Executor):
+    """
+    Pool of worker threads that outlives a single :meth:`nornir.core.Nornir.run` so
+    runs that follow each other don't pay for starting and stopping threads.
+    Threads are started the first time work is submitted and stopped with
+    :meth:`shutdown`. A pool that has been shut down is started again if more work
+    is submitted to it.
+
+    Arguments:
+        num_workers: number of threads in the pool
+        affinity: If ``True``, work submitted with :meth:`submit_for` for the same
+          key always runs in the same thread, so resources tied to a thread stay
+          warm between runs. The downside is that work waits for its thread
+          even if other threads are idle
+    """
+
+    def __init__(self, num_workers: int, affinity: bool = False) -> None:
+        self.num_workers = num_workers
+        self.affinity = affinity
+        self._lock = threading.Lock()
+        self._queues: List["queue.Queue[Any]"] = []
+        self._threads: List[threading.Thread] = []
+        self._assignments: Dict[str, int] = {}
+        self._next_worker = itertools.count()
+        self._next_name = itertools.count()
+        self._running: Dict["Future[Any]", threading.Thread] = {}
+        self._retired: Set[threading.Thread] = set()
+
+    def __repr__(self) -> str:
+        return "{}(num_workers={}, affinity={})".format(
+            self.__class__.__name__, self.num_workers, self.affinity
+        )
+
+    @staticmethod
+    def in_worker() -> bool:
+        """Returns ``True`` if called from a thread that belongs to any ``WorkerPool``"""
+        return getattr(_local, "pool", None) is not None
+
+    @property
+    def running(self) -> bool:
+        """``True`` if the threads of the pool have been started"""
+        return bool(self._threads)
+
+    def _work(self, q: "queue.Queue[Any]") -> None:
+        _local.pool = self
+        current = threading.current_thread()
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            with self._lock:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running[future] = current
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            with self._lock:
+                del self._running[future]
+                if current in self._retired:
+                    self._retired.discard(current)
+                    return
+
+    def _spawn(self, q: "queue.Queue[Any]") -> threading.Thread:
+        t = threading.Thread(
+            target=self._work,
+            args=(q,),
+            name="nornir-worker-{}".format(next(self._next_name)),
+            daemon=True,
+        )
+        t.start()
+        return t
+
+    def _start(self) -> None:
+        num_queues = self.num_workers if self.affinity else 1
+        self._queues = [queue.Queue() for _ in range(num_queues)]
+        for i in range(self.num_workers):
+            self._threads.append(self._spawn(self._queues[i % num_queues]))
+
+    def _put(
+        self, index: int, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        with self._lock:
+            if not self._threads:
+                self._start()
+            self._queues[index].put((future, fn, args, kwargs))
+        return future
+
+    def submit(
+        self, __fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "Future[Any]":
+        """Runs ``fn(*args, **kwargs)`` in the first thread available"""
+        if self.affinity:
+            index = next(self._next_worker) % self.num_workers
+        else:
+            index = 0
+        return self._put(index, __fn, *args, **kwargs)
+
+    def submit_for(
+        self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "Future[Any]":
+        """
+        Same as :meth:`submit` but if the pool was created with ``affinity=True``
+        ``fn`` runs in the thread assigned to ``key``, normally a host name.
+        Keys are assigned to threads in a round robin fashion the first time they
+        are seen.
+        """
+        if not self.affinity:
+            return self._put(0, fn, *args, **kwargs)
+
+        with self._lock:
+            index: Optional[int] = self._assignments.get(key)
+            if index is None:
+                index = next(self._next_worker) % self.num_workers
+                self._assignments[key] = index
+        return self._put(index, fn, *args, **kwargs)
+
+    def abandon(self, future: "Future[Any]") -> None:
+        """
+        Gives up on ``future``. If it hasn't started it is cancelled, if it's running
+        its thread is replaced by a new one so the pool doesn't lose a worker.
+        As threads can't be interrupted, the old thread exits once ``future`` is done.
+        """
+        with self._lock:
+            if future.cancel():
+                return
+            thread = self._running.get(future)
+            if thread is None or thread not in self._threads:
+                return
+            i = self._threads.index(thread)
+            self._retired.add(thread)
+            self._threads[i] = self._spawn(self._queues[i % len(self._queues)])
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stops the threads of the pool once they are done with the pending work, or
+        with the work that is running if ``cancel_futures`` is ``True``, in which case
+        the work that didn't start is cancelled
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+            if cancel_futures:
+                for q in self._queues:
+                    while True:
+                        try:
+                            item = q.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is not None:
+                            item[0].cancel()
+            for i in range(len(threads)):
+                self._queues[i % len(self._queues)].put(None)
+        if wait:
+            for t in threads:
+                if t is not threading.current_thread():
+                    t.join()
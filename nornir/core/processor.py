@@ -1,10 +1,15 @@
-from typing import List
+import logging
+import queue
+import threading
+from typing import Any, Iterable, List, Optional, Tuple
 
 from nornir.core.inventory import Host
 from nornir.core.task import AggregatedResult, MultiResult, Task
 
 from typing_extensions import Protocol
 
+logger = logging.getLogger(__name__)
+
 
 class Processor(Protocol):
     """
@@ -93,3 +98,105 @@ class Processors(List[Processor]):
     ) -> None:
         for p in self:
             p.subtask_instance_completed(task, host, result)
+
+
+class QueuedProcessors(Processors):
+    """
+    Same as :obj:`Processors` but events are put in a queue and the processors are
+    called from a background thread, so slow processors, i.e. processors writing to
+    a database, don't slow down the tasks. Events are processed in the order they
+    happen and ``task_completed`` waits until all the events before it have been
+    processed, so processors are done with a task by the time :meth:`nornir.core.Nornir.run`
+    returns. The thread is started on the first event and stopped once a task is
+    completed, see :meth:`close`.
+
+    Exceptions raised by processors are logged instead of propagated.
+
+    Arguments:
+        processors: processors to call
+        maxsize: maximum number of events waiting to be processed, threads producing
+          events block once the queue is full
+    """
+
+    def __init__(self, processors: Iterable[Processor] = (), maxsize: int = 10000):
+        super().__init__(processors)
+        self.maxsize = maxsize
+        self._queue: "queue.Queue[Optional[Tuple[str, Tuple[Any, ...]]]]" = queue.Queue(
+            maxsize
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _consume(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                if event is None:
+                    return
+                self._call(*event)
+            finally:
+                self._queue.task_done()
+
+    def _call(self, method: str, args: Tuple[Any, ...]) -> None:
+        for p in self:
+            try:
+                getattr(p, method)(*args)
+            except Exception:
+                logger.exception("Processor %r failed processing %s", p, method)
+
+    def _dispatch(self, method: str, *args: Any) -> None:
+        if not self:
+            return
+        if threading.current_thread() is self._thread:
+            # events triggered by the processors themselves
+            self._call(method, args)
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._consume, name="nornir-processors", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((method, args))
+
+    def flush(self) -> None:
+        """Waits until all the queued events have been processed"""
+        if threading.current_thread() is not self._thread:
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Waits until all the queued events have been processed and stops the
+        background thread. It's started again if more events come.
+        """
+        if threading.current_thread() is self._thread:
+            return
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def task_started(self, task: Task) -> None:
+        self._dispatch("task_started", task)
+
+    def task_completed(self, task: Task, result: AggregatedResult) -> None:
+        self._dispatch("task_completed", task, result)
+        self.close()
+
+    def task_instance_started(self, task: Task, host: Host) -> None:
+        self._dispatch("task_instance_started", task, host)
+
+    def task_instance_completed(
+        self, task: Task, host: Host, result: MultiResult
+    ) -> None:
+        self._dispatch("task_instance_completed", task, host, result)
+
+    def subtask_instance_started(self, task: Task, host: Host) -> None:
+        self._dispatch("subtask_instance_started", task, host)
+
+    def subtask_instance_completed(
+        self, task: Task, host: Host, result: MultiResult
+    ) -> None:
+        self._dispatch("subtask_instance_completed", task, host, result)
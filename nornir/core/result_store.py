@@ -0,0 +1,193 @@
+import collections
+import os
+import tempfile
+import threading
+import weakref
+import zlib
+from typing import Any, Deque, IO, Iterable, List, Optional, Tuple, Union
+
+
+def _loaded(value: Any) -> Any:
+    return value
+
+
+class SpilledPayload(object):
+    """
+    Handle to a payload kept in a :obj:`ResultStore`. :obj:`nornir.core.task.Result`
+    loads it when its ``result`` or ``diff`` is accessed.
+    """
+
+    __slots__ = ("store", "file", "offset", "length", "text", "__weakref__")
+
+    def __init__(
+        self,
+        store: "ResultStore",
+        offset: int,
+        length: int,
+        text: bool,
+        file: Optional[IO[bytes]] = None,
+    ):
+        self.store = store
+        self.file = file
+        self.offset = offset
+        self.length = length
+        self.text = text
+
+    def load(self) -> Union[str, bytes]:
+        """Reads the payload back from the store"""
+        return self.store.get(self)
+
+    def __reduce__(self) -> Any:
+        # the store isn't available once pickled, i.e. in other processes
+        return (_loaded, (self.load(),))
+
+    def __repr__(self) -> str:
+        return "{}(offset={}, length={})".format(
+            self.__class__.__name__, self.offset, self.length
+        )
+
+
+class ResultStore(object):
+    """
+    Moves the ``result`` and ``diff`` of the results added to an
+    :obj:`nornir.core.task.AggregatedResult` to a file when they are strings or bytes
+    of at least ``threshold`` characters, like the configuration of a device. They
+    are compressed and appended to the file and the results keep a handle to load
+    them when they are accessed, so a run only keeps in memory the results of the
+    hosts that are running.
+
+    The space of a payload is reused once nothing references its handle, i.e. once
+    the results of a run are dropped, so the file doesn't grow with each run.
+
+    Arguments:
+        path: file to keep the payloads in, it's truncated when the first payload is
+          put and removed when the store is closed. If ``None``, an anonymous
+          temporary file is used
+        threshold: size from which payloads are moved to the file
+        compression: zlib compression level
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, threshold: int = 65536, compression: int = 1
+    ) -> None:
+        if threshold < 1:
+            raise ValueError("threshold must be positive")
+        self.path = path
+        self.threshold = threshold
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._size = 0
+        # extents that can be reused, sorted by offset
+        self._free: List[Tuple[int, int]] = []
+        # extents of the payloads whose handles were collected, they are freed by
+        # put as the garbage collector may run while the lock is held
+        self._released: Deque[Tuple[int, int]] = collections.deque()
+
+    def _open(self) -> IO[bytes]:
+        if self._file is None:
+            self._file = (
+                open(self.path, "w+b") if self.path else tempfile.TemporaryFile()
+            )
+            self._size = 0
+            self._free = []
+            self._released.clear()
+        return self._file
+
+    def _release(self, f: IO[bytes], offset: int, length: int) -> None:
+        # payloads of a file that has been closed since don't take any space
+        if f is self._file:
+            self._released.append((offset, length))
+
+    def _allocate(self, f: IO[bytes], length: int) -> int:
+        while self._released:
+            self._free.append(self._released.popleft())
+        if self._free:
+            self._free.sort()
+            merged = [self._free[0]]
+            for offset, n in self._free[1:]:
+                last_offset, last_n = merged[-1]
+                if last_offset + last_n == offset:
+                    merged[-1] = (last_offset, last_n + n)
+                else:
+                    merged.append((offset, n))
+            if merged[-1][0] + merged[-1][1] == self._size:
+                self._size = merged.pop()[0]
+                f.truncate(self._size)
+            self._free = merged
+        for i, (offset, n) in enumerate(self._free):
+            if n >= length:
+                if n == length:
+                    del self._free[i]
+                else:
+                    self._free[i] = (offset + length, n - length)
+                return offset
+        offset = self._size
+        self._size += length
+        return offset
+
+    def put(self, value: Union[str, bytes]) -> SpilledPayload:
+        """Writes ``value`` to the file and returns a handle to it"""
+        text = isinstance(value, str)
+        data = zlib.compress(
+            value.encode() if isinstance(value, str) else value, self.compression
+        )
+        with self._lock:
+            f = self._open()
+            offset = self._allocate(f, len(data))
+            f.seek(offset)
+            f.write(data)
+        payload = SpilledPayload(self, offset, len(data), text, f)
+        finalizer = weakref.finalize(payload, self._release, f, offset, len(data))
+        finalizer.atexit = False
+        return payload
+
+    def get(self, payload: SpilledPayload) -> Union[str, bytes]:
+        """Reads back the value of ``payload``"""
+        with self._lock:
+            if self._file is None or payload.file is not self._file:
+                raise ValueError("the store was closed, its payloads are gone")
+            self._file.flush()
+            self._file.seek(payload.offset)
+            data = self._file.read(payload.length)
+        value = zlib.decompress(data)
+        return value.decode() if payload.text else value
+
+    def _spill(self, value: Any) -> Any:
+        if isinstance(value, (str, bytes)) and len(value) >= self.threshold:
+            return self.put(value)
+        return value
+
+    def spill(self, results: Iterable[Any]) -> None:
+        """
+        Replaces the large payloads of a :obj:`nornir.core.task.MultiResult`, and of its
+        nested results, with handles to the file
+        """
+        for r in results:
+            if isinstance(r, list):
+                self.spill(r)
+            else:
+                r._result = self._spill(r._result)
+                r._diff = self._spill(r._diff)
+
+    @property
+    def size(self) -> int:
+        """Size of the file"""
+        return self._size
+
+    def close(self) -> None:
+        """
+        Closes and removes the file, payloads can't be loaded afterwards. A new file
+        is opened if more payloads are put in the store.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            self._size = 0
+            if self.path:
+                try:
+                    os.unlink(self.path)
+                except FileNotFoundError:
+                    pass
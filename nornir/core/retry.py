@@ -0,0 +1,97 @@
+import random
+from typing import Optional, Tuple, Type
+
+from nornir.core.exceptions import NornirSubTaskError, NornirTimeoutError
+
+
+class RetryPolicy(object):
+    """
+    Describes how to retry a task that fails with a transient error. For instance::
+
+        retry = RetryPolicy(
+            max_attempts=3,
+            retry_on=(NetMikoTimeoutException, SSHException),
+            reset_connections=True,
+        )
+        nr.run(backup_config, retry=retry)
+
+    runs ``backup_config`` up to three times on each host, waiting ~1s and ~2s
+    between attempts and closing the connections of the host before retrying.
+
+    Arguments:
+        max_attempts: maximum number of times the task is run, including the first one
+        backoff: seconds to wait before the second attempt
+        multiplier: factor applied to the wait after each attempt
+        max_backoff: maximum number of seconds to wait between attempts
+        jitter: If ``True``, waits a random time between half and the whole backoff
+          so hosts that failed at the same time don't retry at the same time
+        retry_on: exception classes that trigger a retry. If the task failed because
+          one of its subtasks did, the exceptions of the subtasks are checked
+        reset_connections: If ``True``, the connections of the host are closed before
+          retrying so they are opened again
+    """
+
+    __slots__ = (
+        "max_attempts",
+        "backoff",
+        "multiplier",
+        "max_backoff",
+        "jitter",
+        "retry_on",
+        "reset_connections",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        multiplier: float = 2.0,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        reset_connections: bool = False,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts has to be >= 1")
+        if backoff < 0 or max_backoff < 0 or multiplier < 1:
+            raise ValueError("backoff can't be negative or decrease between attempts")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.reset_connections = reset_connections
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join("{}={!r}".format(k, getattr(self, k)) for k in self.__slots__),
+        )
+
+    def _matches(self, exception: BaseException) -> bool:
+        if isinstance(exception, NornirTimeoutError):
+            return False
+        if isinstance(exception, NornirSubTaskError):
+            return any(
+                r.exception is not None and self._matches(r.exception)
+                for r in exception.result
+                if r.failed
+            )
+        return isinstance(exception, self.retry_on)
+
+    def should_retry(self, exception: Optional[BaseException], attempt: int) -> bool:
+        """
+        Returns whether a task that failed with ``exception`` on its ``attempt``-th
+        attempt has to be retried. Tasks that ran out of time are never retried.
+        """
+        if exception is None or attempt >= self.max_attempts:
+            return False
+        return self._matches(exception)
+
+    def delay(self, attempt: int) -> float:
+        """Returns how many seconds to wait after the ``attempt``-th attempt failed"""
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
@@ -0,0 +1,170 @@
+import math
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from nornir.core.inventory import Host
+
+Key = Tuple[str, Any]
+Limits = Dict[str, Union[int, Dict[Any, int]]]
+BatchSize = Union[int, str]
+
+
+def _groups(host: Host) -> List[str]:
+    """Names of the groups ``host`` belongs to, including those inherited"""
+    return [e.name for e in host._ancestors() if isinstance(e, Host)]
+
+
+class ConcurrencyLimits(object):
+    """
+    Caps on how many hosts sharing the same value for an attribute can run at the
+    same time. For instance::
+
+        ConcurrencyLimits({"platform": 10, "site": {"lon1": 2}, "groups": 20})
+
+    allows up to 10 hosts per platform, up to 2 hosts with ``site == "lon1"`` (any
+    number for other sites) and up to 20 hosts per group at the same time.
+
+    Arguments:
+        limits: mapping of attribute to either the maximum number of hosts that can run
+          at the same time for each of its values or to a mapping of value to the
+          maximum number of hosts for that value. Attributes are looked up with
+          :meth:`nornir.core.inventory.Host.get` except ``groups``, which matches all
+          the groups the host belongs to, including those inherited. Hosts with
+          ``None`` as value are not limited and if the value is a list each
+          element counts as a value
+    """
+
+    __slots__ = ("limits",)
+
+    def __init__(self, limits: Limits) -> None:
+        for attr, limit in limits.items():
+            caps = limit.values() if isinstance(limit, dict) else [limit]
+            if any(cap < 1 for cap in caps):
+                raise ValueError(f"concurrency limit for {attr!r} has to be >= 1")
+        self.limits = limits
+
+    def __bool__(self) -> bool:
+        return bool(self.limits)
+
+    def __repr__(self) -> str:
+        return "{}({})".format(self.__class__.__name__, self.limits)
+
+    def keys(self, host: Host) -> Tuple[Key, ...]:
+        """Returns the ``(attribute, value)`` pairs that limit ``host``"""
+        keys: List[Key] = []
+        for attr, limit in self.limits.items():
+            if attr == "groups":
+                values: Iterable[Any] = _groups(host)
+            else:
+                value = host.get(attr)
+                if value is None:
+                    continue
+                values = value if isinstance(value, (list, set, tuple)) else [value]
+            for value in values:
+                if not isinstance(limit, dict) or value in limit:
+                    keys.append((attr, value))
+        # sorted so limits are always acquired in the same order
+        return tuple(sorted(set(keys), key=repr))
+
+    def limit(self, key: Key) -> int:
+        """Returns how many hosts with the given ``(attribute, value)`` can run at once"""
+        attr, value = key
+        limit = self.limits[attr]
+        return limit[value] if isinstance(limit, dict) else limit
+
+
+class Scheduler(object):
+    """
+    Hands out hosts to run in order while honouring the given concurrency limits.
+    Hosts that can't be started because one of their limits has been reached are
+    skipped until a host sharing that limit is :meth:`done`.
+
+    Arguments:
+        hosts: hosts to run
+        limits: concurrency limits to honour
+    """
+
+    def __init__(
+        self, hosts: Iterable[Host], limits: Optional[ConcurrencyLimits] = None
+    ) -> None:
+        self.limits = limits or ConcurrencyLimits({})
+        self.running: Dict[Key, int] = {}
+        # hosts are bucketed by the limits they are subject to so we only need to
+        # check each combination of limits once to find the next host to run
+        self.pending: Dict[Tuple[Key, ...], Deque[Tuple[int, Host]]] = OrderedDict()
+        self.keys: Dict[str, Tuple[Key, ...]] = {}
+        for i, host in enumerate(hosts):
+            keys = self.limits.keys(host) if self.limits else ()
+            self.keys[host.name] = keys
+            self.pending.setdefault(keys, deque()).append((i, host))
+
+    def __len__(self) -> int:
+        return sum(len(hosts) for hosts in self.pending.values())
+
+    def _can_run(self, keys: Tuple[Key, ...]) -> bool:
+        return all(self.running.get(k, 0) < self.limits.limit(k) for k in keys)
+
+    def next(self) -> Optional[Host]:
+        """
+        Returns the next host that can be run or ``None`` if there are no hosts left
+        or all of them are blocked by their limits
+        """
+        candidate: Optional[Tuple[Key, ...]] = None
+        for keys, hosts in self.pending.items():
+            if candidate is not None and hosts[0][0] > self.pending[candidate][0][0]:
+                continue
+            if self._can_run(keys):
+                candidate = keys
+        if candidate is None:
+            return None
+
+        _, host = self.pending[candidate].popleft()
+        if not self.pending[candidate]:
+            del self.pending[candidate]
+        for k in candidate:
+            self.running[k] = self.running.get(k, 0) + 1
+        return host
+
+    def done(self, host: Host) -> None:
+        """Releases the limits held by ``host``"""
+        for k in self.keys[host.name]:
+            self.running[k] -= 1
+
+
+def _batch_size(size: BatchSize, num_hosts: int) -> int:
+    if isinstance(size, str) and size.endswith("%"):
+        n = math.ceil(float(size[:-1]) * num_hosts / 100)
+    else:
+        n = int(size)
+    if n < 1:
+        raise ValueError(f"batch size {size!r} has to be at least 1 host")
+    return n
+
+
+def batches(
+    hosts: List[Host], batch_size: Union[BatchSize, List[BatchSize]]
+) -> Iterator[List[Host]]:
+    """
+    Splits ``hosts`` in consecutive batches. For instance, with 100 hosts::
+
+        batches(hosts, 10)  # 10 batches of 10 hosts
+        batches(hosts, "25%")  # 4 batches of 25 hosts
+        batches(hosts, [1, "10%", "50%"])  # batches of 1, 10, 50 and 39 hosts
+
+    Arguments:
+        hosts: hosts to split
+        batch_size: number of hosts or percentage of ``hosts`` in each batch. If
+          it's a list, each element is used for a batch and the last one is used
+          for the remaining batches. Percentages are rounded up
+    """
+    requested = batch_size if isinstance(batch_size, list) else [batch_size]
+    if not requested:
+        raise ValueError("batch_size can't be empty")
+    if not hosts:
+        return
+    sizes: List[int] = [_batch_size(size, len(hosts)) for size in requested]
+    i = 0
+    while i < len(hosts):
+        end = i + (sizes.pop(0) if len(sizes) > 1 else sizes[0])
+        yield hosts[i:end]
+        i = end
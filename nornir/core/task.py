@@ -1,13 +1,33 @@
+import asyncio
+import inspect
 import logging
+import sys
+import threading
+import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 from nornir.core.exceptions import NornirExecutionError
 from nornir.core.exceptions import NornirSubTaskError
+from nornir.core.exceptions import NornirTimeoutError
+from nornir.core.result_store import ResultStore, SpilledPayload
 
 if TYPE_CHECKING:
+    from typing import SupportsIndex
     from nornir.core.inventory import Host
     from nornir.core import Nornir
+    from nornir.core.cache import ResultCache
+    from nornir.core.retry import RetryPolicy
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +43,12 @@ class Task(object):
         task (callable): function or callable we will be calling
         name (``string``): name of task, defaults to ``task.__name__``
         severity_level (logging.LEVEL): Severity level associated to the task
+        task_timeout (``float``): Maximum number of seconds the task can run for a host
+        deadline (``float``): Time, as returned by :func:`time.monotonic`, by which the
+          task has to be done
+        retry (:obj:`nornir.core.retry.RetryPolicy`): How to retry the task if it fails
+        cache (:obj:`nornir.core.cache.ResultCache`): Where to cache the results of the
+          task, see :mod:`nornir.core.cache`
         **kwargs: Parameters that will be passed to the ``task``
 
     Attributes:
@@ -35,6 +61,14 @@ class Task(object):
         nornir(:obj:`nornir.core.Nornir`): Populated right before calling
           the ``task``
         severity_level (logging.LEVEL): Severity level associated to the task
+        task_timeout (``float``): Maximum number of seconds the task can run for a host
+        deadline (``float``): Time, as returned by :func:`time.monotonic`, by which the
+          task has to be done. Set when the task starts to the earliest of its
+          ``task_timeout``, the deadline of its parent task and the ``run_timeout``
+          of the run. Subtasks can't be started once it's due
+        retry (:obj:`nornir.core.retry.RetryPolicy`): How to retry the task if it fails
+        cache (:obj:`nornir.core.cache.ResultCache`): Where to cache the results of the
+          task
     """
 
     def __init__(
@@ -43,6 +77,10 @@ class Task(object):
         name: str = None,
         severity_level: int = logging.INFO,
         parent_task: Optional["Task"] = None,
+        task_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        retry: Optional["RetryPolicy"] = None,
+        cache: Optional["ResultCache"] = None,
         **kwargs: str
     ):
         self.name = name or task.__name__
@@ -51,15 +89,48 @@ class Task(object):
         self.params = kwargs
         self.results = MultiResult(self.name)
         self.severity_level = severity_level
+        self.task_timeout = task_timeout
+        self.deadline = deadline
+        self.retry = retry
+        self.cache = cache
+        self._cache_key: Optional[str] = None
+        # whether the start and the completion of the instance were reported
+        self._running = False
+        self._done = False
+        self._abandoned = False
+        # shared with the subtasks so reporting the task and giving up on it
+        # don't interleave
+        self._lock: threading.Lock = (
+            parent_task._lock if parent_task is not None else threading.Lock()
+        )
 
     def copy(self) -> "Task":
         return Task(
-            self.task, self.name, self.severity_level, self.parent_task, **self.params
+            self.task,
+            self.name,
+            self.severity_level,
+            self.parent_task,
+            task_timeout=self.task_timeout,
+            deadline=self.deadline,
+            retry=self.retry,
+            cache=self.cache,
+            **self.params
         )
 
     def __repr__(self) -> str:
         return self.name
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, i.e. to run the task in other processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        parent = self.parent_task
+        self._lock = getattr(parent, "_lock", None) or threading.Lock()
+
     def start(self, host: "Host", nornir: "Nornir") -> "MultiResult":
         """
         Run the task for the given host.
@@ -73,50 +144,246 @@ class Task(object):
         Returns:
             host (:obj:`nornir.core.task.MultiResult`): Results of the task and its subtasks
         """
+        self._started(host, nornir)
+        cached = self._from_cache()
+        if cached is not None:
+            return cached
+
+        attempt = 1
+        while True:
+            try:
+                logger.debug("Host %r: running task %r", self.host.name, self.name)
+                r = self.task(self, **self.params)
+                if not isinstance(r, Result):
+                    r = Result(host=host, result=r)
+
+            except NornirSubTaskError as e:
+                r = self._failed(e, str(e))
+
+            except Exception as e:
+                r = self._failed(e)
+
+            delay = self._retry_delay(r, attempt)
+            if delay is None:
+                break
+            time.sleep(delay)
+            attempt += 1
+
+        return self._completed(r, attempt)
+
+    async def start_async(self, host: "Host", nornir: "Nornir") -> "MultiResult":
+        """
+        Same as :meth:`start` but awaits the ``task`` if it is a coroutine function. This
+        is what :meth:`nornir.core.Nornir.run` uses when running on the ``asyncio`` runner.
+
+        Arguments:
+            host (:obj:`nornir.core.inventory.Host`): Host we are operating with. Populated right
+              before calling the ``task``
+            nornir(:obj:`nornir.core.Nornir`): Populated right before calling
+              the ``task``
+
+        Returns:
+            host (:obj:`nornir.core.task.MultiResult`): Results of the task and its subtasks
+        """
+        self._started(host, nornir)
+        cached = self._from_cache()
+        if cached is not None:
+            return cached
+
+        attempt = 1
+        while True:
+            try:
+                logger.debug("Host %r: running task %r", self.host.name, self.name)
+                r = self.task(self, **self.params)
+                if inspect.isawaitable(r):
+                    r = await r
+                if not isinstance(r, Result):
+                    r = Result(host=host, result=r)
+
+            except NornirSubTaskError as e:
+                r = self._failed(e, str(e))
+
+            except Exception as e:
+                r = self._failed(e)
+
+            delay = self._retry_delay(r, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        return self._completed(r, attempt)
+
+    def _started(self, host: "Host", nornir: "Nornir") -> None:
         self.host = host
         self.nornir = nornir
+        self._start_time = time.monotonic()
+        if self.task_timeout is not None:
+            deadline = time.monotonic() + self.task_timeout
+            if self.deadline is None or deadline < self.deadline:
+                self.deadline = deadline
+
+        with self._lock:
+            if self._given_up():
+                return
+            self._running = True
+            if self.parent_task is not None:
+                self.nornir.processors.subtask_instance_started(self, host)
+            else:
+                self.nornir.processors.task_instance_started(self, host)
+
+    def _from_cache(self) -> Optional["MultiResult"]:
+        """Completes the task with its cached result, if any"""
+        if self.cache is None:
+            return None
+        key = self.cache.key(self)
+        cached = self.cache.load(key, self.host)
+        if cached is None:
+            # the result is cached under this key once the task completes
+            self._cache_key = key
+            return None
+        logger.debug(
+            "Host %r: using cached result of task %r", self.host.name, self.name
+        )
+        self.results.extend(cached[1:])
+        return self._completed(cached[0], cached[0].attempts, cached=True)
+
+    def _failed(self, exception: BaseException, result: Any = None) -> "Result":
+        tb = LazyTraceback(exception)
+        # with aggregated errors nornir logs a summary once the task is done
+        aggregated = self.nornir.config.core.aggregate_errors
+        logger.log(
+            logging.DEBUG if aggregated else logging.ERROR,
+            "Host %r: task %r failed with traceback:\n%s",
+            self.host.name,
+            self.name,
+            tb,
+        )
+        if result is None:
+            result = tb
+        return Result(self.host, exception=exception, result=result, failed=True)
 
-        if self.parent_task is not None:
-            self.nornir.processors.subtask_instance_started(self, host)
-        else:
-            self.nornir.processors.task_instance_started(self, host)
-        try:
-            logger.debug("Host %r: running task %r", self.host.name, self.name)
-            r = self.task(self, **self.params)
-            if not isinstance(r, Result):
-                r = Result(host=host, result=r)
-
-        except NornirSubTaskError as e:
-            tb = traceback.format_exc()
-            logger.error(
-                "Host %r: task %r failed with traceback:\n%s",
-                self.host.name,
-                self.name,
-                tb,
-            )
-            r = Result(host, exception=e, result=str(e), failed=True)
-
-        except Exception as e:
-            tb = traceback.format_exc()
-            logger.error(
-                "Host %r: task %r failed with traceback:\n%s",
-                self.host.name,
-                self.name,
-                tb,
-            )
-            r = Result(host, exception=e, result=tb, failed=True)
-
+    def _retry_delay(self, r: "Result", attempt: int) -> Optional[float]:
+        """
+        Returns how long to wait before retrying after a failed attempt or ``None``
+        if the task isn't to be retried. Prepares the task for the next attempt.
+        """
+        if self.retry is None or not r.failed:
+            return None
+        if not self.retry.should_retry(r.exception, attempt):
+            return None
+        delay = self.retry.delay(attempt)
+        if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+            return None
+
+        logger.warning(
+            "Host %r: attempt %d of task %r failed, retrying in %.1fs",
+            self.host.name,
+            attempt,
+            self.name,
+            delay,
+        )
+        # subtasks of the failed attempt are discarded
+        self.results = MultiResult(self.name)
+        if self.retry.reset_connections:
+            for connection in list(self.host.connections):
+                try:
+                    self.host.close_connection(connection)
+                except Exception:
+                    logger.debug(
+                        "Host %r: failed to close connection %r",
+                        self.host.name,
+                        connection,
+                        exc_info=True,
+                    )
+        return delay
+
+    def _completed(
+        self, r: "Result", attempts: int = 1, cached: bool = False
+    ) -> "MultiResult":
+        if not r.failed and self.deadline is not None:
+            if time.monotonic() > self.deadline:
+                # runners can't always interrupt the task once it's due
+                exception = self._timeout_error(self.host)
+                logger.error("%s", exception)
+                r = Result(
+                    self.host, exception=exception, result=str(exception), failed=True
+                )
         r.name = self.name
+        r.attempts = attempts
         r.severity_level = logging.ERROR if r.failed else self.severity_level
 
         self.results.insert(0, r)
-
-        if self.parent_task is not None:
-            self.nornir.processors.subtask_instance_completed(self, host, self.results)
-        else:
-            self.nornir.processors.task_instance_completed(self, host, self.results)
+        with self._lock:
+            if self._given_up():
+                # its failure was already reported when it ran out of time
+                return self.results
+            self._done = True
+
+            if self.cache is not None and self._cache_key is not None:
+                self.cache.store(self._cache_key, self.results)
+
+            # cached results don't tell how long the task takes
+            if self.parent_task is None and not r.failed and not cached:
+                self.nornir.timings.record(
+                    self.name, self.host.name, time.monotonic() - self._start_time
+                )
+
+            if self.parent_task is not None:
+                self.nornir.processors.subtask_instance_completed(
+                    self, self.host, self.results
+                )
+            else:
+                self.nornir.processors.task_instance_completed(
+                    self, self.host, self.results
+                )
         return self.results
 
+    def _timeout_error(self, host: "Host") -> NornirTimeoutError:
+        return NornirTimeoutError(
+            "Host {!r}: task {!r} ran out of time".format(host.name, self.name)
+        )
+
+    def _abandon(self) -> bool:
+        """
+        Gives up on the task so it doesn't report its completion, nor cache or time
+        it, if it ever completes. Returns ``False`` if it had completed already.
+        """
+        with self._lock:
+            if self._done:
+                return False
+            self._abandoned = True
+            return True
+
+    def _timed_out(self, host: "Host", nornir: "Nornir") -> "MultiResult":
+        """
+        Gives up on the task once it ran out of time on ``host`` and completes it as
+        failed with a :obj:`nornir.core.exceptions.NornirTimeoutError`, unless it
+        completed in the meantime. Returns the results of the task.
+        """
+        with self._lock:
+            if self._done:
+                return self.results
+            self._abandoned = True
+            exception = self._timeout_error(host)
+            logger.error("%s", exception)
+            r = Result(host, exception=exception, result=str(exception), failed=True)
+            r.name = self.name
+            results = MultiResult(self.name)
+            results.append(r)
+            if not self._running:
+                nornir.processors.task_instance_started(self, host)
+            nornir.processors.task_instance_completed(self, host, results)
+            return results
+
+    def _given_up(self) -> bool:
+        task: Optional[Task] = self
+        while task is not None:
+            if task._abandoned:
+                return True
+            task = task.parent_task
+        return False
+
     def run(self, task: Callable[..., Any], **kwargs: Any) -> "MultiResult":
         """
         This is a utility method to call a task from within a task. For instance:
@@ -129,6 +396,26 @@ class Task(object):
 
         This method will ensure the subtask is run only for the host in the current thread.
         """
+        run_task = self._subtask(task, **kwargs)
+        r = run_task.start(self.host, self.nornir)
+        return self._subtask_completed(task, r)
+
+    async def run_async(self, task: Callable[..., Any], **kwargs: Any) -> "MultiResult":
+        """
+        Same as :meth:`run` but to be awaited from within a coroutine task. ``task`` can
+        be either a coroutine function or a regular function. For instance:
+
+            async def grouped_tasks(task):
+                await task.run_async(my_first_task)
+                await task.run_async(my_second_task)
+
+            nornir.run(grouped_tasks)
+        """
+        run_task = self._subtask(task, **kwargs)
+        r = await run_task.start_async(self.host, self.nornir)
+        return self._subtask_completed(task, r)
+
+    def _subtask(self, task: Callable[..., Any], **kwargs: Any) -> "Task":
         if not self.host or not self.nornir:
             msg = (
                 "You have to call this after setting host and nornir attributes. ",
@@ -136,10 +423,16 @@ class Task(object):
             )
             raise Exception(msg)
 
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise self._timeout_error(self.host)
+
         if "severity_level" not in kwargs:
             kwargs["severity_level"] = self.severity_level
-        run_task = Task(task, parent_task=self, **kwargs)
-        r = run_task.start(self.host, self.nornir)
+        return Task(task, parent_task=self, deadline=self.deadline, **kwargs)
+
+    def _subtask_completed(
+        self, task: Callable[..., Any], r: "MultiResult"
+    ) -> "MultiResult":
         self.results.append(r[0] if len(r) == 1 else r)
 
         if r.failed:
@@ -148,6 +441,15 @@ class Task(object):
 
         return r
 
+    def remaining_time(self) -> Optional[float]:
+        """
+        Returns the number of seconds left until the task's ``deadline`` or ``None`` if
+        the task doesn't have one. Useful to set the timeouts of blocking operations.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
     def is_dry_run(self, override: Optional[bool] = None) -> bool:
         """
         Returns whether current task is a dry_run or not.
@@ -155,10 +457,54 @@ class Task(object):
         return override if override is not None else self.nornir.data.dry_run
 
 
+# strings longer than this are unlikely to be repeated across hosts
+_INTERN_MAX_LENGTH = 256
+
+
+def _intern(value: Any) -> Any:
+    """
+    Interns ``value`` if it's a short string so identical payloads returned by many
+    hosts, like versions or models, share memory. Other payloads are returned as
+    they are, they belong to the task and aren't walked nor modified.
+    """
+    if type(value) is str and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+class LazyTraceback(object):
+    """
+    Traceback of ``exception``, formatted the first time it's converted to a string.
+    Failed tasks keep it as their result so hosts failing with expected errors don't
+    pay for formatting a traceback nobody reads.
+    """
+
+    __slots__ = ("exception", "_formatted")
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+        self._formatted: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            e = self.exception
+            self._formatted = "".join(
+                traceback.format_exception(type(e), e, e.__traceback__)
+            )
+        return self._formatted
+
+    def __reduce__(self) -> Any:
+        return (str, (str(self),))
+
+
 class Result(object):
     """
     Result of running individual tasks.
 
+    Results keep their attributes in slots and short strings in ``result`` are
+    interned, as there can be one per host and subtask. Extra attributes passed as
+    ``kwargs`` are still supported but stored in a per result dictionary.
+
     Arguments:
         changed (bool): ``True`` if the task is changing the system
         diff (obj): Diff between state of the system before/after running this task
@@ -176,8 +522,30 @@ class Result(object):
         failed (bool): Whether the execution failed or not
         severity_level (logging.LEVEL): Severity level associated to the result of the excecution
         exception (Exception): uncaught exception thrown during the exection of the task (if any)
+        attempts (int): number of times the task was run, more than one if it was retried
+        stdout (str): standard output of the task, if any
+        stderr (str): standard error of the task, if any
     """
 
+    __slots__ = (
+        "_result",
+        "host",
+        "changed",
+        "_diff",
+        "failed",
+        "exception",
+        "name",
+        "severity_level",
+        "attempts",
+        "stdout",
+        "stderr",
+        "__dict__",
+        "__weakref__",
+    )
+
+    _result: Any
+    _diff: Any
+
     def __init__(
         self,
         host: Union["Host", None],
@@ -187,22 +555,48 @@ class Result(object):
         failed: bool = False,
         exception: Optional[BaseException] = None,
         severity_level: int = logging.INFO,
+        stdout: Optional[str] = None,
+        stderr: Optional[str] = None,
         **kwargs: Any
     ):
-        self.result = result
+        self.result = _intern(result)
         self.host = host
         self.changed = changed
         self.diff = diff
         self.failed = failed
         self.exception = exception
-        self.name = None
+        self.name: Optional[str] = None
         self.severity_level = severity_level
+        self.attempts = 1
+        self.stdout = stdout
+        self.stderr = stderr
+
+        if kwargs:
+            self.__dict__.update(kwargs)
+
+    @property
+    def result(self) -> Any:
+        result = self._result
+        if isinstance(result, SpilledPayload):
+            return result.load()
+        if isinstance(result, LazyTraceback):
+            self._result = result = str(result)
+        return result
+
+    @result.setter
+    def result(self, value: Any) -> None:
+        self._result = value
 
-        self.stdout: Optional[str] = None
-        self.stderr: Optional[str] = None
+    @property
+    def diff(self) -> Any:
+        diff = self._diff
+        if isinstance(diff, SpilledPayload):
+            return diff.load()
+        return diff
 
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+    @diff.setter
+    def diff(self, value: Any) -> None:
+        self._diff = value
 
     def __repr__(self) -> str:
         return '{}: "{}"'.format(self.__class__.__name__, self.name)
@@ -219,26 +613,80 @@ class AggregatedResult(Dict[str, Any]):
     """
     It basically is a dict-like object that aggregates the results for all devices.
     You can access each individual result by doing ``my_aggr_result["hostname_of_device"]``.
+
+    Failed hosts are indexed as results are added so checking them doesn't need to go
+    through all the results. Results are expected to be complete by the time they
+    are added.
+
+    Arguments:
+        name: name of the task
+        store: if set, large payloads of the results are moved there as they are added,
+          see :obj:`nornir.core.result_store.ResultStore`
     """
 
-    def __init__(self, name: str, **kwargs: str):
+    def __init__(self, name: str, store: Optional[ResultStore] = None, **kwargs: Any):
         self.name = name
-        super().__init__(**kwargs)
+        self.store = store
+        self._failed_hosts: Dict[str, Any] = {}
+        super().__init__()
+        self.update(kwargs)
 
     def __repr__(self) -> str:
         return "{} ({}): {}".format(
             self.__class__.__name__, self.name, super().__repr__()
         )
 
+    def __reduce__(self) -> Any:
+        return (self.__class__, (self.name,), None, None, iter(self.items()))
+
+    def __setitem__(self, host: str, result: Any) -> None:
+        if self.store is not None:
+            self.store.spill(result)
+        super().__setitem__(host, result)
+        if result.failed:
+            self._failed_hosts[host] = result
+        else:
+            self._failed_hosts.pop(host, None)
+
+    def __delitem__(self, host: str) -> None:
+        super().__delitem__(host)
+        self._failed_hosts.pop(host, None)
+
+    def __ior__(self, other: Any) -> "AggregatedResult":  # type: ignore
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for host, result in dict(*args, **kwargs).items():
+            self[host] = result
+
+    def setdefault(self, host: str, default: Any = None) -> Any:
+        if host not in self:
+            self[host] = default
+        return self[host]
+
+    def pop(self, host: str, *args: Any) -> Any:
+        self._failed_hosts.pop(host, None)
+        return super().pop(host, *args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        host, result = super().popitem()
+        self._failed_hosts.pop(host, None)
+        return host, result
+
+    def clear(self) -> None:
+        super().clear()
+        self._failed_hosts.clear()
+
     @property
     def failed(self) -> bool:
         """If ``True`` at least a host failed."""
-        return any([h.failed for h in self.values()])
+        return bool(self._failed_hosts)
 
     @property
     def failed_hosts(self) -> Dict[str, "MultiResult"]:
         """Hosts that failed during the execution of the task."""
-        return {h: r for h, r in self.items() if r.failed}
+        return dict(self._failed_hosts)
 
     def raise_on_error(self) -> None:
         """
@@ -253,26 +701,99 @@ class MultiResult(List[Any]):
     """
     It is basically is a list-like object that gives you access to the results of all subtasks for
     a particular device/task.
+
+    It counts how many of its results failed or changed the system as they are added.
+    Results are expected to be complete by the time they are added.
     """
 
+    __slots__ = ("name", "_failed", "_changed")
+
     def __init__(self, name: str):
         self.name = name
+        self._failed = 0
+        self._changed = 0
 
     def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            # don't delegate protocol lookups (i.e. pickle's ``__setstate__``)
+            raise AttributeError(name)
         return getattr(self[0], name)
 
     def __repr__(self) -> str:
         return "{}: {}".format(self.__class__.__name__, super().__repr__())
 
+    def __reduce__(self) -> Any:
+        return (self.__class__, (self.name,), None, iter(self))
+
+    def _add(self, result: Any) -> None:
+        self._failed += bool(result.failed)
+        self._changed += bool(result.changed)
+
+    def _remove(self, result: Any) -> None:
+        self._failed -= bool(result.failed)
+        self._changed -= bool(result.changed)
+
+    def _recount(self) -> None:
+        self._failed = self._changed = 0
+        for result in self:
+            self._add(result)
+
+    def append(self, result: Any) -> None:
+        super().append(result)
+        self._add(result)
+
+    def insert(self, index: "SupportsIndex", result: Any) -> None:
+        super().insert(index, result)
+        self._add(result)
+
+    def extend(self, results: Iterable[Any]) -> None:
+        for result in results:
+            self.append(result)
+
+    def __iadd__(self, results: Iterable[Any]) -> "MultiResult":  # type: ignore
+        self.extend(results)
+        return self
+
+    def __imul__(self, n: "SupportsIndex") -> "MultiResult":
+        super().__imul__(n)
+        self._recount()
+        return self
+
+    def __setitem__(self, index: Any, result: Any) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, result)
+            self._recount()
+            return
+        self._remove(self[index])
+        super().__setitem__(index, result)
+        self._add(result)
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._recount()
+
+    def pop(self, index: "SupportsIndex" = -1) -> Any:
+        result = super().pop(index)
+        self._remove(result)
+        return result
+
+    def remove(self, result: Any) -> None:
+        super().remove(result)
+        self._remove(result)
+
+    def clear(self) -> None:
+        super().clear()
+        self._failed = self._changed = 0
+
     @property
     def failed(self) -> bool:
         """If ``True`` at least a task failed."""
-        return any([h.failed for h in self])
+        return self._failed > 0
 
     @property
     def changed(self) -> bool:
         """If ``True`` at least a task changed the system."""
-        return any([h.changed for h in self])
+        return self._changed > 0
 
     def raise_on_error(self) -> None:
         """
@@ -0,0 +1,98 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from nornir.core.inventory import Host
+
+logger = logging.getLogger(__name__)
+
+
+class TimingStore(object):
+    """
+    Keeps how long each task took to run on each host so hosts that are expected to
+    take longer can be started first. Durations are smoothed with an exponential
+    moving average so a single slow run doesn't reorder the whole fleet.
+
+    Arguments:
+        path: JSON file where the durations are loaded from and saved to. If not
+          given durations are only kept in memory
+        smoothing: weight given to the last duration recorded, between 0 and 1
+    """
+
+    def __init__(self, path: Optional[str] = None, smoothing: float = 0.5) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing has to be between 0 and 1")
+        self.path = path
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._durations: Dict[str, Dict[str, float]] = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            self.load()
+
+    def __repr__(self) -> str:
+        return "{}(path={!r})".format(self.__class__.__name__, self.path)
+
+    def record(self, task: str, host: str, duration: float) -> None:
+        """Records that running ``task`` on ``host`` took ``duration`` seconds"""
+        with self._lock:
+            durations = self._durations.setdefault(task, {})
+            previous = durations.get(host)
+            if previous is not None:
+                duration = self.smoothing * duration + (1 - self.smoothing) * previous
+            durations[host] = duration
+            self._dirty = True
+
+    def expected(self, task: str, host: str) -> Optional[float]:
+        """Returns how many seconds ``task`` is expected to take on ``host``, if known"""
+        return self._durations.get(task, {}).get(host)
+
+    def longest_first(self, task: str) -> Callable[[Host], Tuple[int, float]]:
+        """
+        Returns a key to sort hosts so the ones expected to take longer to run
+        ``task`` come first. Hosts without durations go before the rest as
+        there's no way to know how long they'll take.
+        """
+        durations = dict(self._durations.get(task, {}))
+
+        def key(host: Host) -> Tuple[int, float]:
+            duration = durations.get(host.name)
+            if duration is None:
+                return (0, 0.0)
+            return (1, -duration)
+
+        return key
+
+    def load(self) -> None:
+        """Loads the durations from ``path``"""
+        if not self.path:
+            return
+        with open(self.path, "r") as f:
+            data: Dict[str, Any] = json.load(f)
+        with self._lock:
+            self._durations = {
+                task: {host: float(d) for host, d in durations.items()}
+                for task, durations in data.items()
+            }
+            self._dirty = False
+
+    def save(self) -> None:
+        """Saves the durations to ``path`` if they changed since they were loaded"""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps(self._durations, indent=2, sort_keys=True)
+            self._dirty = False
+        # written to a temporary file first so readers never see a partial file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".nornir-timings")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except Exception:
+            os.unlink(tmp)
+            raise
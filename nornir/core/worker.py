@@ -0,0 +1,234 @@
+"""
+Helpers to run tasks outside of the process that holds the inventory.
+
+Hosts are shipped to workers as flat snapshots: their attributes, data and
+connection options are resolved in the parent so no group or defaults objects
+need to travel. Results travel back without their ``host`` reference and are
+reattached to the original hosts with :func:`attach_host`.
+"""
+
+import io
+import multiprocessing
+import pickle
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from nornir.core.configuration import Config
+from nornir.core.inventory import (
+    ConnectionOptions,
+    Defaults,
+    Host,
+    Hosts,
+    Inventory,
+    ParentGroups,
+)
+from nornir.core.state import GlobalState
+from nornir.core.task import MultiResult, Result, Task
+from nornir.core.timing import TimingStore
+
+if TYPE_CHECKING:
+    from nornir.core import Nornir  # noqa
+
+
+def _connection_names(host: Host) -> Set[str]:
+    names = set(host.connection_options.keys())
+    names.update(host.defaults.connection_options.keys())
+    pending = list(host.groups.refs)
+    while pending:
+        g = pending.pop()
+        names.update(g.connection_options.keys())
+        pending.extend(g.groups.refs)
+    return names
+
+
+def host_snapshot(host: Host) -> Host:
+    """
+    Returns a copy of ``host`` that doesn't depend on any other inventory object.
+
+    Attributes, data and connection options inherited from groups and defaults are
+    resolved into the copy. ``groups`` only contains the names of the direct parents
+    so :meth:`nornir.core.inventory.Host.has_parent_group` is not available.
+    """
+    connection_options: Dict[str, ConnectionOptions] = {}
+    for name in _connection_names(host):
+        options = host._get_connection_options_recursively(name)
+        if options is not None:
+            connection_options[name] = options
+    return Host(
+        name=host.name,
+        hostname=host.hostname,
+        port=host.port,
+        username=host.username,
+        password=host.password,
+        platform=host.platform,
+        groups=ParentGroups(host.groups),
+        data=dict(host.items()),
+        connection_options=connection_options,
+        defaults=Defaults(),
+    )
+
+
+def _results(result: Union[Result, MultiResult]) -> Iterator[Result]:
+    if isinstance(result, MultiResult):
+        for r in result:
+            yield from _results(r)
+    else:
+        yield result
+
+
+def detach_host(result: MultiResult) -> MultiResult:
+    """
+    Removes the references to the host from ``result`` and its subresults.
+    Exceptions that can't be pickled are replaced by their string representation.
+    """
+    for r in _results(result):
+        r.host = None
+        if r.exception is not None:
+            try:
+                pickle.loads(pickle.dumps(r.exception))
+            except Exception:
+                r.exception = Exception(repr(r.exception))
+    return result
+
+
+class _ResultPickler(pickle.Pickler):
+    # hosts are pickled by name and taken from the inventory when loading results
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if isinstance(obj, Host):
+            return obj.name
+        return None
+
+
+class _ResultUnpickler(pickle.Unpickler):
+    def __init__(self, data: bytes, hosts: Dict[str, Host]) -> None:
+        super().__init__(io.BytesIO(data))
+        self.hosts = hosts
+
+    def persistent_load(self, pid: str) -> Optional[Host]:
+        return self.hosts.get(pid)
+
+
+def dumps_result(result: MultiResult) -> bytes:
+    """
+    Pickles ``result`` keeping only the names of the hosts it references, unlike
+    :func:`detach_host` ``result`` isn't modified
+    """
+    buf = io.BytesIO()
+    _ResultPickler(buf, pickle.HIGHEST_PROTOCOL).dump(result)
+    return buf.getvalue()
+
+
+def loads_result(data: bytes, hosts: Dict[str, Host]) -> MultiResult:
+    """Loads a result pickled with :func:`dumps_result` taking its hosts from ``hosts``"""
+    return cast(MultiResult, _ResultUnpickler(data, hosts).load())
+
+
+def attach_host(result: MultiResult, host: Host) -> MultiResult:
+    """Sets ``host`` as the host of ``result`` and its subresults."""
+    for r in _results(result):
+        r.host = host
+    return result
+
+
+def worker_nornir(config: Config, data: GlobalState, hosts: List[Host]) -> "Nornir":
+    """Returns a Nornir object to run tasks inside a worker with the given ``hosts``"""
+    from nornir.core import Nornir
+
+    # hosts are added after creating the inventory as their groups aren't shipped
+    inventory = Inventory(hosts=Hosts())
+    inventory.hosts.update({h.name: h for h in hosts})
+    nornir = Nornir(
+        inventory=inventory, config=config, data=data, timings=TimingStore()
+    )
+    # results are moved to disk by the parent once they are shipped back, the
+    # store of the worker would share its file
+    nornir.result_store = None
+    return nornir
+
+
+def failed_result(task: Task, host: Host, exception: BaseException) -> MultiResult:
+    """Returns the result of a host that couldn't be run in a worker"""
+    result = MultiResult(task.name)
+    r = Result(host, exception=exception, result=str(exception), failed=True)
+    r.name = task.name
+    result.append(r)
+    return result
+
+
+def run_chunk(payload: bytes) -> bytes:
+    """
+    Runs a pickled ``(task, hosts, config, data)`` tuple and returns the pickled
+    list of ``(host_name, result)`` tuples.
+    """
+    return run_hosts(*pickle.loads(payload))
+
+
+def run_hosts(
+    task: Task,
+    hosts: List[Host],
+    config: Config,
+    data: GlobalState,
+    num_workers: int = 1,
+) -> bytes:
+    """
+    Runs ``task`` over ``hosts``, up to ``num_workers`` at the same time, and returns
+    the pickled list of ``(host_name, result)`` tuples.
+    """
+    nornir = worker_nornir(config, data, hosts)
+    results: List[Tuple[str, Any]] = []
+    if num_workers > 1 and len(hosts) > 1:
+        try:
+            for host, r in nornir._iter_parallel(task, hosts, num_workers):
+                results.append((host.name, detach_host(r)))
+        finally:
+            nornir.pool.shutdown()
+    else:
+        for host in hosts:
+            try:
+                r = task.copy().start(host, nornir)
+                results.append((host.name, detach_host(r)))
+            except Exception as e:
+                results.append((host.name, e))
+    try:
+        return pickle.dumps(results)
+    except Exception:
+        safe_results = []
+        for name, value in results:
+            try:
+                pickle.dumps(value)
+            except Exception as e:
+                value = e
+            safe_results.append((name, value))
+        return pickle.dumps(safe_results)
+
+
+def mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Returns the multiprocessing context to start workers with, ``fork`` if the platform
+    supports it so workers don't have to import the task's module again.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def chunks(
+    hosts: List[Host], num_workers: int, size: Optional[int] = None
+) -> Iterator[List[Host]]:
+    """
+    Splits ``hosts`` in chunks so each worker gets a few of them and the cost of
+    shipping the task and the configuration is paid once per chunk.
+    """
+    size = size or max(1, min(100, len(hosts) // (num_workers * 4)))
+    for i in range(0, len(hosts), size):
+        yield hosts[i : i + size]
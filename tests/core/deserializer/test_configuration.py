@@ -5,6 +5,7 @@ from nornir.core.configuration import Config
 from nornir.plugins.inventory.simple import SimpleInventory
 from nornir.plugins.inventory.ansible import AnsibleInventory
 from nornir.core.deserializer.configuration import Config as ConfigDeserializer
+from nornir._vendor.pydantic import ValidationError
 
 from tests.core.deserializer import my_jinja_filters
 
@@ -24,7 +25,22 @@ class Test(object):
     def test_config_defaults(self):
         c = ConfigDeserializer()
         assert c.dict() == {
-            "core": {"num_workers": 20, "raise_on_error": False},
+            "core": {
+                "num_workers": 20,
+                "raise_on_error": False,
+                "worker_affinity": False,
+                "concurrency_limits": {},
+                "connection_rate": 0,
+                "connection_burst": 1,
+                "connection_rate_by_plugin": {},
+                "timing_file": "",
+                "longest_first": False,
+                "distributed_workers": [],
+                "distributed_authkey": "",
+                "result_store_threshold": 0,
+                "result_store_file": "",
+                "aggregate_errors": False,
+            },
             "inventory": {
                 "plugin": "nornir.plugins.inventory.simple.SimpleInventory",
                 "options": {},
@@ -67,7 +83,22 @@ class Test(object):
                 "loggers": ["nornir"],
             },
             "jinja2": {"filters": ""},
-            "core": {"num_workers": 30, "raise_on_error": False},
+            "core": {
+                "num_workers": 30,
+                "raise_on_error": False,
+                "worker_affinity": False,
+                "concurrency_limits": {},
+                "connection_rate": 0,
+                "connection_burst": 1,
+                "connection_rate_by_plugin": {},
+                "timing_file": "",
+                "longest_first": False,
+                "distributed_workers": [],
+                "distributed_authkey": "",
+                "result_store_threshold": 0,
+                "result_store_file": "",
+                "aggregate_errors": False,
+            },
             "user_defined": {"my_opt": True},
         }
 
@@ -129,6 +160,38 @@ class Test(object):
         with pytest.raises(ModuleNotFoundError):
             ConfigDeserializer.deserialize(jinja2={"filters": "asdasd.asdasd"})
 
+    def test_connection_rate(self):
+        c = ConfigDeserializer.deserialize(
+            core={
+                "connection_rate": 2,
+                "connection_burst": 5,
+                "connection_rate_by_plugin": {"netmiko": {"rate": 0.5}},
+            }
+        )
+        assert (c.core.connection_rate, c.core.connection_burst) == (2, 5)
+        assert c.core.connection_rate_by_plugin == {
+            "netmiko": {"rate": 0.5, "burst": 1}
+        }
+
+    @pytest.mark.parametrize(
+        "core",
+        [
+            {"connection_rate": -1},
+            {"connection_burst": 0},
+            {"connection_rate_by_plugin": {"netmiko": {"burst": 2}}},
+            {"connection_rate_by_plugin": {"netmiko": {"rate": 0}}},
+            {"connection_rate_by_plugin": {"netmiko": {"rate": 1, "burst": 0}}},
+            {"connection_rate_by_plugin": {"netmiko": {"rate": 1, "brust": 2}}},
+        ],
+    )
+    def test_connection_rate_invalid(self, core):
+        with pytest.raises(ValidationError):
+            ConfigDeserializer.deserialize(core=core)
+
+    def test_result_store_threshold_invalid(self):
+        with pytest.raises(ValidationError):
+            ConfigDeserializer.deserialize(core={"result_store_threshold": -1})
+
     def test_configuration_file_empty(self):
         config = ConfigDeserializer.load_from_file(
             os.path.join(dir_path, "empty.yaml"), user_defined={"asd": "qwe"}
@@ -0,0 +1,114 @@
+import asyncio
+import datetime
+import threading
+
+from nornir.core import Nornir
+from nornir.core.exceptions import NornirExecutionError, NornirSubTaskError
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.task import Result
+
+import pytest
+
+
+async def async_blocking_task(task, wait):
+    await asyncio.sleep(wait)
+    return threading.get_ident()
+
+
+async def async_failing_task(task):
+    raise Exception(task.host.name)
+
+
+def sync_subtask(task):
+    return task.host.name
+
+
+async def async_subtask(task):
+    await asyncio.sleep(0)
+    return Result(host=task.host, result=task.host.name, changed=True)
+
+
+async def async_grouped_task(task):
+    await task.run_async(sync_subtask)
+    await task.run_async(async_subtask)
+    return "done"
+
+
+async def async_failing_grouped_task(task):
+    await task.run_async(async_failing_task)
+
+
+def many_hosts(nornir, num_hosts):
+    hosts = Hosts({f"h{i}": Host(name=f"h{i}") for i in range(num_hosts)})
+    return Nornir(inventory=Inventory(hosts=hosts), config=nornir.config)
+
+
+class Test(object):
+    def test_coroutine_task_selects_asyncio(self, nornir):
+        result = nornir.run(async_blocking_task, wait=0)
+        assert set(result.keys()) == set(nornir.inventory.hosts.keys())
+        assert {r.result for r in result.values()} == {threading.get_ident()}
+
+    def test_blocking_task_asyncio(self, nornir):
+        nr = many_hosts(nornir, 1000)
+        t1 = datetime.datetime.now()
+        result = nr.run(async_blocking_task, wait=1, num_workers=1000)
+        t2 = datetime.datetime.now()
+        delta = t2 - t1
+        assert delta.seconds == 1, delta
+        assert len(result) == 1000
+        assert not result.failed
+
+    def test_num_workers_asyncio(self, nornir):
+        nr = many_hosts(nornir, 10)
+        t1 = datetime.datetime.now()
+        nr.run(async_blocking_task, wait=0.5, num_workers=5)
+        t2 = datetime.datetime.now()
+        delta = t2 - t1
+        assert delta.seconds == 1, delta
+
+    def test_sync_task_asyncio_runner(self, nornir):
+        result = nornir.run(sync_subtask, runner="asyncio")
+        for h, r in result.items():
+            assert r.result == h
+
+    def test_subtasks_asyncio(self, nornir):
+        result = nornir.run(async_grouped_task)
+        for h, r in result.items():
+            assert r.result == "done"
+            assert r[1].result == h
+            assert r[2].result == h
+            assert r.changed
+            assert not r.failed
+
+    def test_failing_task_asyncio(self, nornir):
+        result = nornir.run(async_failing_task)
+        assert set(result.failed_hosts.keys()) == set(nornir.inventory.hosts.keys())
+        assert nornir.data.failed_hosts == set(nornir.inventory.hosts.keys())
+        for h, r in result.items():
+            assert str(r.exception) == h
+
+    def test_failing_subtask_asyncio(self, nornir):
+        result = nornir.run(async_failing_grouped_task)
+        for h, r in result.items():
+            assert r[0].exception.__class__ is NornirSubTaskError
+            assert str(r[1].exception) == h
+
+    def test_raise_on_error_asyncio(self, nornir):
+        with pytest.raises(NornirExecutionError):
+            nornir.run(async_failing_task, raise_on_error=True)
+
+    def test_run_async(self, nornir):
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(
+                nornir.run_async(async_grouped_task, name="my_async_task")
+            )
+        finally:
+            loop.close()
+        assert result.name == "my_async_task"
+        assert set(result.keys()) == set(nornir.inventory.hosts.keys())
+
+    def test_unknown_runner(self, nornir):
+        with pytest.raises(ValueError):
+            nornir.run(sync_subtask, runner="nope")
@@ -0,0 +1,112 @@
+import os
+
+from nornir.core.cache import DiskCache, MemoryCache
+from nornir.core.timing import TimingStore
+
+import pytest
+
+# hosts the tasks run on, parameters are part of the key so it can't be one
+calls = []
+
+
+def render(task, template="{}"):
+    calls.append(task.host.name)
+    task.run(sub_render)
+    return template.format(task.host["my_var"])
+
+
+def sub_render(task):
+    return "sub"
+
+
+def fail(task):
+    calls.append(task.host.name)
+    raise Exception()
+
+
+class Test(object):
+    @pytest.mark.parametrize("cache", ["memory", "disk"])
+    def test_cache(self, nornir, tmp_path, cache):
+        calls.clear()
+        cache = MemoryCache() if cache == "memory" else DiskCache(str(tmp_path))
+        first = nornir.run(render, cache=cache)
+        assert len(calls) == len(nornir.inventory.hosts)
+
+        calls.clear()
+        second = nornir.run(render, cache=cache)
+        assert calls == []
+        for host, r in second.items():
+            assert r.result == first[host].result
+            assert r[1].result == "sub"
+            assert r.host is nornir.inventory.hosts[host]
+            assert not r.failed
+
+    def test_cache_hits_not_timed(self, nornir):
+        nr = nornir.with_processors([])
+        nr.timings = TimingStore()
+        cache = MemoryCache()
+        nr.run(render, cache=cache, template="timed {}")
+        expected = {h: nr.timings.expected("render", h) for h in nr.inventory.hosts}
+        assert all(t is not None for t in expected.values())
+        nr.run(render, cache=cache, template="timed {}")
+        assert {
+            h: nr.timings.expected("render", h) for h in nr.inventory.hosts
+        } == expected
+
+    def test_cache_key(self, nornir):
+        calls.clear()
+        cache = MemoryCache()
+        nornir.run(render, cache=cache)
+
+        # different parameters
+        calls.clear()
+        nornir.run(render, template="x{}", cache=cache)
+        assert len(calls) == len(nornir.inventory.hosts)
+
+        # different host data, own or inherited
+        calls.clear()
+        dev3 = nornir.inventory.hosts["dev3.group_2"]
+        group_1 = nornir.inventory.groups["group_1"]
+        dev3["my_var"] = "changed"
+        group_1["site"] = "changed"
+        try:
+            result = nornir.run(render, cache=cache)
+        finally:
+            del dev3.data["my_var"]
+            group_1["site"] = "site1"
+        assert sorted(calls) == ["dev1.group_1", "dev2.group_1", "dev3.group_2"]
+        assert result["dev3.group_2"].result == "changed"
+
+    def test_failed_not_cached(self, nornir):
+        calls.clear()
+        cache = MemoryCache()
+        nornir.run(fail, cache=cache)
+        nornir.data.reset_failed_hosts()
+        calls.clear()
+        nornir.run(fail, cache=cache)
+        assert len(calls) == len(nornir.inventory.hosts)
+        assert len(cache) == 0
+
+    def test_memory_cache_eviction(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", b"a")
+        cache.set("b", b"b")
+        assert cache.get("a") == b"a"
+        cache.set("c", b"c")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"a"
+        assert len(cache) == 2
+
+    def test_disk_cache_eviction(self, tmp_path):
+        cache = DiskCache(str(tmp_path), maxsize=2)
+        cache.set("a", b"a")
+        cache.set("b", b"b")
+        os.utime(cache._file("a"), (1, 1))
+        os.utime(cache._file("b"), (2, 2))
+        assert cache.get("a") == b"a"
+        cache.set("c", b"c")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"a"
+        assert DiskCache(str(tmp_path)).get("c") == b"c"
+        cache.clear()
+        assert len(cache) == 0
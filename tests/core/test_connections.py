@@ -1,7 +1,9 @@
+import time
 from typing import Any, Dict, Optional
 
 from nornir.core.configuration import Config
-from nornir.core.connections import ConnectionPlugin, Connections
+from nornir.core.connections import ConnectionPlugin, Connections, TokenBucket
+from nornir.core.deserializer.configuration import Config as ConfigDeserializer
 from nornir.core.exceptions import (
     ConnectionAlreadyOpen,
     ConnectionNotOpen,
@@ -197,6 +199,59 @@ class Test(object):
         assert not r.failed
 
 
+def open_and_close_all(nornir, connection, config):
+    for host in nornir.inventory.hosts.values():
+        host.close_connections()
+    t1 = time.monotonic()
+    for host in nornir.inventory.hosts.values():
+        host.open_connection(connection, config)
+        host.close_connection(connection)
+    return time.monotonic() - t1
+
+
+class TestRateLimit(object):
+    @classmethod
+    def setup_class(cls):
+        Connections.deregister_all()
+        Connections.register("dummy", DummyConnectionPlugin)
+        Connections.register("dummy2", DummyConnectionPlugin)
+
+    @classmethod
+    def teardown_class(cls):
+        Connections.deregister_all()
+        register_default_connection_plugins()
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=20, burst=2)
+        t1 = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        assert 0.2 - 0.02 < time.monotonic() - t1 < 0.4
+
+    def test_token_bucket_validation(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+    def test_no_rate_limit(self, nornir):
+        assert open_and_close_all(nornir, "dummy", nornir.config) < 0.1
+
+    def test_connection_rate(self, nornir):
+        config = ConfigDeserializer.deserialize(
+            core={"connection_rate": 20, "connection_burst": 2}
+        )
+        # 5 hosts, the first 2 connections use the burst
+        assert 0.15 - 0.02 < open_and_close_all(nornir, "dummy", config) < 0.4
+
+    def test_connection_rate_by_plugin(self, nornir):
+        config = ConfigDeserializer.deserialize(
+            core={"connection_rate_by_plugin": {"dummy2": {"rate": 20}}}
+        )
+        assert open_and_close_all(nornir, "dummy", config) < 0.1
+        assert 0.2 - 0.02 < open_and_close_all(nornir, "dummy2", config) < 0.4
+
+
 class TestConnectionPluginsRegistration(object):
     def setup_method(self, method):
         Connections.deregister_all()
@@ -0,0 +1,116 @@
+import os
+
+from nornir.core import Nornir
+from nornir.core.deserializer.configuration import Config as ConfigDeserializer
+from nornir.core.distributed import Coordinator, Worker, parse_address
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.worker import mp_context
+
+import pytest
+
+AUTHKEY = "secret"
+
+
+def render(task):
+    return "{} {}".format(task.host.name, task.host["my_var"])
+
+
+def pid_task(task):
+    return os.getpid()
+
+
+def failing_task(task):
+    raise Exception(task.host.name)
+
+
+def serve(address, conn):
+    w = Worker(address, AUTHKEY, num_workers=4)
+    conn.send(w.address)
+    w.serve_forever()
+
+
+def start_worker(address):
+    parent, child = mp_context().Pipe()
+    p = mp_context().Process(target=serve, args=(address, child), daemon=True)
+    p.start()
+    return parent.recv(), p
+
+
+def as_string(address):
+    return address if isinstance(address, str) else "{}:{}".format(*address)
+
+
+@pytest.fixture(scope="module")
+def workers(tmp_path_factory):
+    sock = str(tmp_path_factory.mktemp("distributed") / "worker.sock")
+    started = [start_worker(("127.0.0.1", 0)), start_worker(sock)]
+    yield [as_string(address) for address, _ in started]
+    for _, p in started:
+        p.terminate()
+        p.join()
+
+
+def distributed_nornir(nornir, addresses, authkey=AUTHKEY):
+    config = ConfigDeserializer.deserialize(
+        core={"distributed_workers": addresses, "distributed_authkey": authkey}
+    )
+    return Nornir(inventory=nornir.inventory, config=config, data=nornir.data)
+
+
+class Test(object):
+    def test_parse_address(self):
+        assert parse_address("10.0.0.1:6000") == ("10.0.0.1", 6000)
+        assert parse_address("unix:/tmp/w.sock") == "/tmp/w.sock"
+        assert parse_address("/tmp/w.sock") == "/tmp/w.sock"
+        with pytest.raises(ValueError):
+            parse_address("10.0.0.1")
+        with pytest.raises(ValueError):
+            Coordinator(["/tmp/w.sock"], "")
+
+    def test_distributed_runner(self, nornir, workers):
+        nr = distributed_nornir(nornir, workers)
+        result = nr.run(render, runner="distributed")
+        assert list(result) == list(nornir.inventory.hosts)
+        for h, r in result.items():
+            host = nornir.inventory.hosts[h]
+            assert r.host is host
+            assert r.result == "{} {}".format(h, host["my_var"])
+
+    def test_distributed_runner_uses_all_workers(self, nornir, workers):
+        hosts = Hosts({f"h{i}": Host(name=f"h{i}") for i in range(100)})
+        nr = distributed_nornir(nornir, workers)
+        nr.inventory = Inventory(hosts=hosts)
+        result = nr.run(pid_task, runner="distributed")
+        pids = {r.result for r in result.values()}
+        assert len(pids) == 2
+        assert os.getpid() not in pids
+
+    def test_distributed_runner_failures(self, nornir, workers):
+        nr = distributed_nornir(nornir, workers)
+        result = nr.run(failing_task, runner="distributed")
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+        assert nornir.data.failed_hosts == set(nornir.inventory.hosts)
+        for h, r in result.items():
+            assert str(r.exception) == h
+
+    def test_distributed_runner_lost_worker(self, nornir, workers, tmp_path):
+        # chunks for the node that isn't there are run by the others
+        nr = distributed_nornir(nornir, workers + [str(tmp_path / "missing.sock")])
+        result = nr.run(render, runner="distributed")
+        assert not result.failed
+
+    def test_distributed_runner_no_workers(self, nornir, tmp_path):
+        nr = distributed_nornir(nornir, [str(tmp_path / "missing.sock")])
+        result = nr.run(render, runner="distributed")
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+
+    def test_distributed_runner_wrong_authkey(self, nornir, workers):
+        nr = distributed_nornir(nornir, workers, authkey="wrong")
+        result = nr.run(render, runner="distributed")
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+
+    def test_coordinator_chunk_error(self, workers):
+        coordinator = Coordinator(workers[:1], AUTHKEY)
+        results = list(coordinator.imap_unordered([b"not a pickle"]))
+        assert len(results) == 1
+        assert isinstance(results[0], Exception)
@@ -1,5 +1,9 @@
+import pickle
+
 from nornir.core.filter import F
 
+import pytest
+
 
 class Test(object):
     def test_simple(self, nornir):
@@ -107,6 +111,111 @@ class Test(object):
 
         assert filtered == ["dev1.group_1", "dev2.group_1", "dev4.group_2"]
 
+    def test_group_candidates(self, nornir):
+        f = F(has_parent_group="parent_group") & F(groups__contains="group_2")
+        assert f._candidates(nornir.inventory) == ({"dev4.group_2"}, False)
+        filtered = sorted(list((nornir.inventory.filter(f).hosts.keys())))
+        assert filtered == ["dev4.group_2"]
+
+        f = F(groups__contains="parent_group") | F(groups__contains="group_2")
+        assert f._candidates(nornir.inventory) == (
+            {"dev1.group_1", "dev2.group_1", "dev3.group_2", "dev4.group_2"},
+            False,
+        )
+        filtered = sorted(list((nornir.inventory.filter(f).hosts.keys())))
+        assert filtered == ["dev3.group_2", "dev4.group_2"]
+
+        f = ~F(has_parent_group="group_1")
+        assert f._candidates(nornir.inventory) == (
+            {"dev3.group_2", "dev4.group_2", "dev5.no_group"},
+            True,
+        )
+        f = F(groups__contains="group_1") | F(site="site2")
+        assert f._candidates(nornir.inventory) is None
+        assert (~F(groups__contains="group_1"))._candidates(nornir.inventory) is None
+
+    def test_indexes(self, nornir):
+        filters = [
+            F(platform="linux"),
+            F(platform__in=["eos", "junos"]),
+            F(role="www") & F(port__gt=65020),
+            F(port__ge=65021) & ~F(role="db"),
+            F(port__lt=65022) | F(site="site2"),
+            F(port__le=65022),
+            F(role__in=["db", {}]),
+            ~F(role="www", platform="linux"),
+            F(site=None),
+        ]
+        expected = [sorted(nornir.inventory.filter(f).hosts) for f in filters]
+        nornir.inventory.create_index("platform")
+        nornir.inventory.create_index("role")
+        nornir.inventory.create_index("site")
+        nornir.inventory.create_index("port", sorted=True)
+        try:
+            assert F(platform="linux")._candidates(nornir.inventory) == (
+                {"dev3.group_2", "dev4.group_2", "dev5.no_group"},
+                True,
+            )
+            assert F(port__gt=65022)._candidates(nornir.inventory) == (
+                {"dev4.group_2", "dev5.no_group"},
+                True,
+            )
+            for f, e in zip(filters, expected):
+                assert sorted(nornir.inventory.filter(f).hosts) == e, f
+
+            assert sorted(nornir.inventory.filter(platform="junos").hosts) == [
+                "dev2.group_1"
+            ]
+            filtered = nornir.filter(platform="linux")
+            assert sorted(filtered.inventory.filter(role="db").hosts) == [
+                "dev4.group_2"
+            ]
+
+            host = nornir.inventory.hosts["dev5.no_group"]
+            host.platform = "ios"
+            try:
+                assert sorted(nornir.inventory.filter(platform="ios").hosts) == [
+                    "dev5.no_group"
+                ]
+            finally:
+                host.platform = "linux"
+        finally:
+            for key in ("platform", "role", "site", "port"):
+                nornir.inventory.drop_index(key)
+
+        with pytest.raises(ValueError):
+            nornir.inventory.create_index("nested_data__a_dict")
+        with pytest.raises(ValueError):
+            nornir.inventory.create_index("has_parent_group")
+
+    def test_compiled_rules(self, nornir):
+        rules = [
+            ("platform", "linux"),
+            ("name", "dev1.group_1"),
+            ("site", "site1"),
+            ("missing", None),
+            ("has_parent_group", "parent_group"),
+            ("groups__contains", "group_1"),
+            ("platform__in", ["eos", "linux"]),
+            ("platform__startswith", "jun"),
+            ("port__eq", 65021),
+            ("role__any", ["w", "x"]),
+            ("role__all", ["d", "b"]),
+            ("nested_data__a_string__contains", "asd"),
+            ("nested_data__a_dict__b", 2),
+            ("nested_data__a_list__contains", 2),
+            ("nested_data__a_string__missing", None),
+            ("missing__a_dict__a", None),
+        ]
+        for k, v in rules:
+            f = F(**{k: v})
+            for host in nornir.inventory.hosts.values():
+                expected = F._verify_rules(host, k.split("__"), v)
+                assert f(host) is expected, (k, host)
+                assert f(host) is expected, (k, host)
+                assert (~f)(host) is not expected, (k, host)
+                assert pickle.loads(pickle.dumps(f))(host) is expected
+
     def test_filtering_by_attribute_name(self, nornir):
         f = F(name="dev1.group_1")
         filtered = sorted(list((nornir.inventory.filter(f).hosts.keys())))
@@ -9,7 +9,6 @@ import pytest
 
 import ruamel.yaml
 
-
 yaml = ruamel.yaml.YAML(typ="safe")
 dir_path = os.path.dirname(os.path.realpath(__file__))
 with open(f"{dir_path}/../inventory_data/hosts.yaml") as f:
@@ -366,3 +365,159 @@ class Test(object):
         assert "group_1" in dev1_groups
         assert dev2_paramiko_opts["username"] == "root"
         assert "dev3.group_2" in hosts_dict
+
+    def test_resolved_data_cache(self):
+        inv = deserializer.Inventory.deserialize(**inv_dict)
+        dev2 = inv.hosts["dev2.group_1"]
+        resolved = dict(dev2.items())
+        assert dev2._resolve_data() is dev2._resolve_data()
+        assert resolved["my_var"] == "comes_from_group_1"
+
+        inv.groups["group_1"]["my_var"] = "changed_in_group"
+        assert dict(dev2.items())["my_var"] == "changed_in_group"
+        inv.groups["parent_group"].data.update({"new_var": 1})
+        assert "new_var" in dev2.keys()
+        inv.defaults.data["from_defaults"] = 2
+        assert dict(dev2.items())["from_defaults"] == 2
+        assert len(dev2) == len(resolved) + 2
+
+        dev2.data["my_var"] = "changed_in_host"
+        assert dict(dev2.items())["my_var"] == "changed_in_host"
+        del dev2.data["my_var"]
+        dev2.data = {"replaced": True}
+        assert dict(dev2.items())["replaced"]
+        assert isinstance(dev2.data, inventory.ElementData)
+
+        dev2.groups.refs = []
+        assert "site" not in dev2.keys()
+
+    def test_ancestors(self):
+        defaults = inventory.Defaults(password="from_defaults", data={"d": 1})
+        base = inventory.Group(
+            "base", platform="base", data={"v": "base"}, defaults=defaults
+        )
+        left = inventory.Group("left", data={"v": "left"}, defaults=defaults)
+        right = inventory.Group(
+            "right", port=22, data={"v": "right", "r": None}, defaults=defaults
+        )
+        host = inventory.Host("host", defaults=defaults)
+        left.groups.refs = [base]
+        right.groups.refs = [base]
+        host.groups.refs = [left, right]
+        assert host._ancestors() == (left, base, defaults, right)
+        assert host._ancestors() is host._ancestors()
+
+        assert host["v"] == "left"
+        assert host["r"] is None
+        assert host["d"] == 1
+        assert host.platform == "base"
+        assert host.port == 22
+        assert host.password == "from_defaults"
+        assert host.username is None
+        assert host.has_parent_group("base")
+        assert host.has_parent_group(right)
+        assert not host.has_parent_group(defaults)
+        with pytest.raises(KeyError):
+            host["missing"]
+
+        host.platform = "own"
+        assert host.platform == "own"
+        assert deserializer.InventoryElement.serialize(host).port is None
+
+        host.groups.refs = [right]
+        assert host._ancestors() == (right, base, defaults)
+        assert host["v"] == "right"
+        assert not host.has_parent_group("left")
+
+        host.defaults = inventory.Defaults()
+        assert host._ancestors()[-1] is host.defaults
+        assert host.password == "from_defaults"
+
+        host.groups.refs.insert(0, left)
+        assert host._ancestors() == (left, base, defaults, right, host.defaults)
+        assert host["v"] == "left"
+        host.groups.refs.remove(left)
+        assert host["v"] == "right"
+        right.groups.refs.clear()
+        assert host._ancestors() == (right, defaults, host.defaults)
+        right.groups.refs.append(base)
+        assert host._ancestors() == (right, base, defaults, host.defaults)
+
+    def test_parent_groups_names(self):
+        inv = deserializer.Inventory.deserialize(**inv_dict)
+        dev1 = inv.hosts["dev1.group_1"]
+        token = inventory._structure.value
+        dev1.groups.append("group_2")
+        assert inventory._structure.value is not token
+        token = inventory._structure.value
+        dev1.groups.remove("group_2")
+        assert inventory._structure.value is not token
+        token = inventory._structure.value
+        dev1.groups.data.extend(["group_2"])
+        assert inventory._structure.value is not token
+
+    def test_data_is_copied(self):
+        data = {"a": 1}
+        host = inventory.Host("host", data=data)
+        data["b"] = 2
+        assert "b" not in host.data
+        assert host.data == {"a": 1}
+
+    def test_group_members_index(self):
+        inv = deserializer.Inventory.deserialize(**inv_dict)
+        assert inv._group_members("parent_group") == {
+            "dev1.group_1",
+            "dev2.group_1",
+            "dev4.group_2",
+        }
+        assert inv._group_members(inv.groups["group_2"]) == {
+            "dev3.group_2",
+            "dev4.group_2",
+        }
+        inv.add_group("new_group", groups=["parent_group"])
+        inv.add_host("h1", groups=["new_group"])
+        assert inv._valid_members() is not None
+        assert "h1" in inv._group_members("parent_group")
+        assert inv.children_of_group("new_group") == {inv.hosts["h1"]}
+        assert inv._group_members(inventory.Group("group_2")) is None
+
+        inv.hosts["dev3.group_2"].groups.refs = [inv.groups["group_1"]]
+        assert inv._valid_members() is None
+        assert "dev3.group_2" in inv._group_members("parent_group")
+        assert "dev3.group_2" not in inv._group_members("group_2")
+
+    def test_filtered_views(self):
+        inv = deserializer.Inventory.deserialize(**inv_dict)
+        group_1 = inv.filter(filter_func=lambda h: h.has_parent_group("group_1"))
+        group_2 = inv.filter(filter_func=lambda h: h.has_parent_group("group_2"))
+        parent = group_1.filter(
+            filter_func=lambda h: h.has_parent_group("parent_group")
+        )
+        assert parent._root is inv
+        assert parent.groups is inv.groups
+        assert parent.hosts["dev1.group_1"] is inv.hosts["dev1.group_1"]
+
+        assert list((group_1 | group_2).hosts) == [
+            "dev1.group_1",
+            "dev2.group_1",
+            "dev3.group_2",
+            "dev4.group_2",
+        ]
+        assert list((group_1 & parent).hosts) == ["dev1.group_1", "dev2.group_1"]
+        assert list((inv - group_1 - group_2).hosts) == ["dev5.no_group"]
+        assert (group_1 & group_2).hosts == {}
+        assert (inv - group_2).children_of_group("parent_group") == {
+            inv.hosts["dev1.group_1"],
+            inv.hosts["dev2.group_1"],
+        }
+
+        other = deserializer.Inventory.deserialize(**inv_dict)
+        with pytest.raises(ValueError):
+            group_1 | other
+        with pytest.raises(TypeError):
+            group_1 & {}
+
+        group_1.add_host("h1", groups=["group_1"])
+        assert group_1.hosts["h1"] is inv.hosts["h1"]
+        assert "h1" not in group_2.hosts
+        assert inv.hosts["h1"] in inv.children_of_group("group_1")
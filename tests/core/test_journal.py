@@ -0,0 +1,80 @@
+from nornir.core.journal import RunJournal
+
+import pytest
+
+
+class Crash(BaseException):
+    pass
+
+
+def record_host(task, ran, crash_on=None, fail_on=None):
+    ran.append(task.host.name)
+    if task.host.name == crash_on:
+        raise Crash()
+    if task.host.name == fail_on:
+        raise Exception("failed")
+    return "{} {}".format(task.host.name, task.host["my_var"])
+
+
+class Test(object):
+    def test_resume_after_crash(self, nornir, tmp_path):
+        path = str(tmp_path / "journal.db")
+        ran = []
+        with pytest.raises(Crash):
+            nornir.run(
+                record_host,
+                ran=ran,
+                crash_on="dev3.group_2",
+                runner="serial",
+                resume=path,
+            )
+        assert ran == ["dev1.group_1", "dev2.group_1", "dev3.group_2"]
+
+        ran.clear()
+        result = nornir.run(record_host, ran=ran, runner="serial", resume=path)
+        assert ran == ["dev3.group_2", "dev4.group_2", "dev5.no_group"]
+        assert list(result) == list(nornir.inventory.hosts)
+        assert not result.failed
+        r = result["dev1.group_1"]
+        assert r.result == "dev1.group_1 comes_from_dev1.group_1"
+        assert r.host is nornir.inventory.hosts["dev1.group_1"]
+
+    def test_failed_hosts_run_again(self, nornir, tmp_path):
+        journal = RunJournal(str(tmp_path / "journal.db"))
+        ran = []
+        result = nornir.run(
+            record_host, ran=ran, fail_on="dev4.group_2", resume=journal
+        )
+        assert set(result.failed_hosts) == {"dev4.group_2"}
+
+        nornir.data.reset_failed_hosts()
+        ran.clear()
+        result = nornir.run(record_host, ran=ran, resume=journal)
+        assert ran == ["dev4.group_2"]
+        assert not result.failed
+        assert list(result) == list(nornir.inventory.hosts)
+
+        # other tasks aren't affected and clearing the journal starts over
+        ran.clear()
+        nornir.run(record_host, ran=ran, name="other", resume=journal)
+        assert len(ran) == len(nornir.inventory.hosts)
+        journal.clear("record_host")
+        ran.clear()
+        nornir.run(record_host, ran=ran, resume=journal)
+        assert len(ran) == len(nornir.inventory.hosts)
+        journal.close()
+
+    @pytest.mark.parametrize("runner", ["threaded", "process"])
+    def test_resume_runners(self, nornir, tmp_path, runner):
+        path = str(tmp_path / "journal.db")
+        nornir.filter(name="dev1.group_1").run(
+            record_host, ran=[], runner=runner, resume=path
+        )
+        ran = []
+        result = nornir.run(record_host, ran=ran, runner=runner, resume=path)
+        assert "dev1.group_1" in result
+        assert result["dev1.group_1"].result == "dev1.group_1 comes_from_dev1.group_1"
+        if runner != "process":
+            assert "dev1.group_1" not in ran
+            assert len(ran) == len(nornir.inventory.hosts) - 1
+        assert len(RunJournal(path).load("record_host", nornir.inventory.hosts)) == 5
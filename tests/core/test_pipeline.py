@@ -0,0 +1,131 @@
+import threading
+import time
+
+from nornir.core.exceptions import NornirExecutionError
+from nornir.core.task import AggregatedResult
+
+import pytest
+
+SLOW_HOST = "dev1.group_1"
+
+
+class Recorder(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+
+    def record(self, *event):
+        with self.lock:
+            self.events.append(event)
+
+    def task_started(self, task):
+        self.record("task_started", task.name)
+
+    def task_completed(self, task, result):
+        self.record("task_completed", task.name, result)
+
+    def task_instance_started(self, task, host):
+        self.record("task_instance_started", task.name, host.name)
+
+    def task_instance_completed(self, task, host, result):
+        self.record("task_instance_completed", task.name, host.name)
+
+    def subtask_instance_started(self, task, host):
+        pass
+
+    def subtask_instance_completed(self, task, host, result):
+        pass
+
+
+def render(task, log):
+    if task.host.name == SLOW_HOST:
+        time.sleep(0.5)
+    log.append(("render", task.host.name))
+    return "render {}".format(task.host.name)
+
+
+def push(task, log):
+    log.append(("push", task.host.name))
+    if task.host.name == "dev3.group_2":
+        raise Exception("push failed")
+    return "push {}".format(task.host.name)
+
+
+def verify(task, log, expected):
+    log.append(("verify", task.host.name))
+    return expected
+
+
+class Test(object):
+    def test_pipeline(self, nornir):
+        log = []
+        results = nornir.run_pipeline(
+            [
+                (render, {"log": log}),
+                (push, {"log": log}),
+                (verify, {"log": log, "expected": "ok"}),
+            ]
+        )
+        assert [r.name for r in results] == ["render", "push", "verify"]
+        assert all(isinstance(r, AggregatedResult) for r in results)
+        hosts = list(nornir.inventory.hosts)
+        assert list(results[0]) == hosts
+        assert list(results[1]) == hosts
+        # the host that failed to push isn't verified
+        assert list(results[2]) == [h for h in hosts if h != "dev3.group_2"]
+        assert results[0]["dev2.group_1"].result == "render dev2.group_1"
+        assert results[2]["dev2.group_1"].result == "ok"
+        assert set(results[1].failed_hosts) == {"dev3.group_2"}
+        assert nornir.data.failed_hosts == {"dev3.group_2"}
+
+    def test_pipeline_no_barrier(self, nornir):
+        log = []
+        nornir.run_pipeline([(render, {"log": log}), (push, {"log": log})])
+        # other hosts pushed while the slow host was still rendering
+        assert log.index(("render", SLOW_HOST)) > log.index(("push", "dev2.group_1"))
+        assert log[-1] == ("push", SLOW_HOST)
+
+    def test_pipeline_processors(self, nornir):
+        recorder = Recorder()
+        nr = nornir.with_processors([recorder])
+        log = []
+        nr.run_pipeline([(render, {"log": log}), (push, {"log": log})])
+        events = recorder.events
+        assert events[:2] == [("task_started", "render"), ("task_started", "push")]
+        completed = [i for i, e in enumerate(events) if e[0] == "task_completed"]
+        assert [events[i][1] for i in completed] == ["render", "push"]
+        for name, completed_at in zip(("render", "push"), completed):
+            instances = [
+                i
+                for i, e in enumerate(events)
+                if e[0] == "task_instance_completed" and e[1] == name
+            ]
+            assert len(instances) == len(nornir.inventory.hosts)
+            assert instances[-1] < completed_at
+
+    def test_pipeline_raise_on_error(self, nornir):
+        log = []
+        with pytest.raises(NornirExecutionError) as e:
+            nornir.run_pipeline(
+                [(render, {"log": log}), (push, {"log": log})], raise_on_error=True
+            )
+        assert e.value.result.name == "push"
+
+    def test_pipeline_names(self, nornir):
+        log = []
+        results = nornir.run_pipeline(
+            [(render, {"log": log, "name": "first"}), (render, {"log": log})],
+            num_workers=2,
+        )
+        assert [r.name for r in results] == ["first", "render"]
+
+    def test_pipeline_run_timeout(self, nornir):
+        log = []
+        results = nornir.run_pipeline(
+            [(render, {"log": log}), (push, {"log": log})], run_timeout=0.2
+        )
+        assert SLOW_HOST in results[0].failed_hosts
+        assert SLOW_HOST not in results[1]
+
+    def test_empty_pipeline(self, nornir):
+        assert nornir.run_pipeline([]) == []
@@ -0,0 +1,100 @@
+import threading
+
+from nornir.core.pool import WorkerPool
+
+
+def thread_id(task):
+    return threading.get_ident()
+
+
+def nested_run(task):
+    r = task.nornir.filter(name=task.host.name).run(thread_id)
+    return r[task.host.name].result
+
+
+def by_thread(result):
+    hosts = {}
+    for h, r in result.items():
+        hosts.setdefault(r.result, set()).add(h)
+    return {frozenset(h) for h in hosts.values()}
+
+
+class Test(object):
+    def test_pool_is_reused(self, nornir):
+        assert nornir.pool.num_workers == nornir.config.core.num_workers
+        r1 = nornir.run(thread_id)
+        threads = {r.result for r in r1.values()}
+        assert threading.get_ident() not in threads
+        r2 = nornir.run(thread_id)
+        assert {r.result for r in r2.values()} <= set(
+            t.ident for t in nornir.pool._threads
+        )
+        assert threads <= set(t.ident for t in nornir.pool._threads)
+
+    def test_pool_is_shared(self, nornir):
+        assert nornir.filter(name="dev1.group_1").pool is nornir.pool
+        assert nornir.with_processors([]).pool is nornir.pool
+
+    def test_pool_other_num_workers(self, nornir):
+        r = nornir.run(thread_id, num_workers=2)
+        assert {x.result for x in r.values()}.isdisjoint(
+            t.ident for t in nornir.pool._threads
+        )
+
+    def test_nested_run(self, nornir):
+        r = nornir.run(nested_run)
+        assert not r.failed
+
+    def test_exit_shuts_down_pool(self, nornir):
+        pool = WorkerPool(2)
+        with nornir.filter(name="dev1.group_1") as nr:
+            nr.pool = pool
+            nr.run(thread_id, num_workers=2)
+            assert pool.running
+        assert not pool.running
+        # the pool is started again if needed
+        nr.run(thread_id, num_workers=2)
+        assert pool.running
+        pool.shutdown()
+
+    def test_affinity(self, nornir):
+        nr = nornir.filter()
+        nr.pool = WorkerPool(3, affinity=True)
+        try:
+            r1 = nr.run(thread_id, num_workers=3)
+            r2 = nr.run(thread_id, num_workers=3)
+            nr.pool.shutdown()
+            r3 = nr.run(thread_id, num_workers=3)
+        finally:
+            nr.pool.shutdown()
+        assert by_thread(r1) == by_thread(r2)
+        assert len(by_thread(r1)) == 3
+        # threads are new but hosts are still grouped the same way
+        assert by_thread(r1) == by_thread(r3)
+
+    def test_submit(self):
+        pool = WorkerPool(2)
+        assert pool.submit(lambda x: x * 2, 2).result() == 4
+        futures = [pool.submit(pow, 2, i) for i in range(5)]
+        assert [f.result() for f in futures] == [1, 2, 4, 8, 16]
+        pool.shutdown()
+        assert not pool.running
+
+    def test_shutdown_cancel_futures(self):
+        pool = WorkerPool(1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+            return 1
+
+        running = pool.submit(block)
+        started.wait()
+        pending = [pool.submit(pow, 2, i) for i in range(3)]
+        pool.shutdown(wait=False, cancel_futures=True)
+        release.set()
+        assert running.result() == 1
+        assert all(f.cancelled() for f in pending)
+        assert not pool.running
@@ -0,0 +1,116 @@
+import os
+import threading
+
+from nornir.core import Nornir
+from nornir.core.exceptions import NornirExecutionError, NornirSubTaskError
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.task import Result
+from nornir.core.worker import host_snapshot
+
+import pytest
+
+
+def render(task):
+    return "{} {} {}".format(task.host.name, task.host.hostname, task.host["my_var"])
+
+
+def pid_task(task):
+    return os.getpid()
+
+
+def failing_task(task):
+    raise Exception(task.host.name)
+
+
+def failing_grouped_task(task):
+    task.run(failing_task)
+
+
+def grouped_task(task):
+    task.run(render)
+    return Result(host=task.host, result="done", changed=True)
+
+
+def unpicklable_result_task(task):
+    return threading.Lock()
+
+
+def dry_run_task(task):
+    return task.is_dry_run()
+
+
+class Test(object):
+    def test_host_snapshot(self, nornir):
+        host = nornir.inventory.hosts["dev1.group_1"]
+        snapshot = host_snapshot(host)
+        assert snapshot is not host
+        assert snapshot.hostname == host.hostname
+        assert snapshot.port == host.port
+        assert snapshot.username == host.username
+        assert snapshot.password == host.password
+        assert snapshot.platform == host.platform
+        assert dict(snapshot.items()) == dict(host.items())
+        assert list(snapshot.groups) == list(host.groups)
+        assert not snapshot.groups.refs
+        for name in ("dummy", "dummy2", "paramiko"):
+            expected = host.get_connection_parameters(name)
+            got = snapshot.get_connection_parameters(name)
+            assert got.hostname == expected.hostname
+            assert got.port == expected.port
+            assert got.extras == expected.extras
+
+    def test_process_runner(self, nornir):
+        result = nornir.run(render, runner="process", num_workers=2)
+        assert list(result.keys()) == list(nornir.inventory.hosts.keys())
+        for h, r in result.items():
+            host = nornir.inventory.hosts[h]
+            assert r.host is host
+            assert r[0].host is host
+            assert r.result == "{} {} {}".format(h, host.hostname, host["my_var"])
+
+    def test_process_runner_runs_in_other_processes(self, nornir):
+        result = nornir.run(pid_task, runner="process", num_workers=2)
+        assert os.getpid() not in {r.result for r in result.values()}
+
+    def test_process_runner_subtasks(self, nornir):
+        result = nornir.run(grouped_task, runner="process", num_workers=2)
+        for h, r in result.items():
+            assert r.result == "done"
+            assert r.changed
+            assert r[1].name == "render"
+            assert r[1].host is nornir.inventory.hosts[h]
+
+    def test_process_runner_failures(self, nornir):
+        result = nornir.run(failing_grouped_task, runner="process", num_workers=2)
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+        assert nornir.data.failed_hosts == set(nornir.inventory.hosts)
+        for h, r in result.items():
+            assert r[0].exception.__class__ is NornirSubTaskError
+            assert str(r[1].exception) == h
+
+    def test_process_runner_raise_on_error(self, nornir):
+        with pytest.raises(NornirExecutionError) as e:
+            nornir.run(failing_task, runner="process", raise_on_error=True)
+        assert set(e.value.failed_hosts) == set(nornir.inventory.hosts)
+
+    def test_process_runner_unpicklable(self, nornir):
+        result = nornir.run(lambda task: None, runner="process", num_workers=2)
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+
+        nornir.data.reset_failed_hosts()
+        result = nornir.run(unpicklable_result_task, runner="process", num_workers=2)
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+
+    def test_process_runner_dry_run(self, nornir):
+        result = nornir.run(dry_run_task, runner="process", num_workers=2)
+        assert all(r.result is True for r in result.values())
+
+    def test_process_runner_many_hosts(self, nornir):
+        hosts = Hosts(
+            {f"h{i}": Host(name=f"h{i}", data={"my_var": i}) for i in range(1000)}
+        )
+        nr = Nornir(inventory=Inventory(hosts=hosts), config=nornir.config)
+        result = nr.run(render, runner="process", num_workers=4)
+        assert len(result) == 1000
+        for h, r in result.items():
+            assert r.result == "{} None {}".format(h, h[1:])
@@ -1,7 +1,10 @@
+import threading
+import time
 from typing import Any, Dict
 
 from nornir.core import Nornir
 from nornir.core.inventory import Host
+from nornir.core.processor import QueuedProcessors
 from nornir.core.task import AggregatedResult, MultiResult, Result, Task
 
 
@@ -234,3 +237,63 @@ class Test:
                 "completed": True,
             }
         }
+
+    def test_background_processor(self, nornir: Nornir) -> None:
+        expected: Dict[str, Any] = {}
+        nornir.with_processors([MockProcessor(expected)]).run(task=mock_subtask)
+        nornir.data.reset_failed_hosts()
+        data: Dict[str, Any] = {}
+        nr = nornir.with_processors([MockProcessor(data)], background=True)
+        assert isinstance(nr.processors, QueuedProcessors)
+        nr.run(task=mock_subtask)
+        assert data == expected
+
+    def test_background_processor_order(self, nornir: Nornir) -> None:
+        events = []
+
+        class SlowProcessor(MockProcessor):
+            def task_instance_started(self, task: Task, host: Host) -> None:
+                time.sleep(0.05)
+                events.append(("started", host.name, threading.current_thread()))
+
+            def task_instance_completed(
+                self, task: Task, host: Host, result: MultiResult
+            ) -> None:
+                events.append(("completed", host.name, threading.current_thread()))
+
+        nr = nornir.with_processors([SlowProcessor({})], background=True)
+        start = time.monotonic()
+        nr.run(task=mock_task, num_workers=1)
+        # the processor was done with all the events by the end of the run
+        assert len(events) == 2 * len(nornir.inventory.hosts)
+        assert time.monotonic() - start >= 0.05 * len(nornir.inventory.hosts)
+        for host in nornir.inventory.hosts:
+            started = events.index(("started", host, events[0][2]))
+            assert events[started + 1] == ("completed", host, events[0][2])
+        assert events[0][2] is not threading.current_thread()
+
+    def test_background_processor_thread(self, nornir: Nornir) -> None:
+        def threads() -> int:
+            return sum(t.name == "nornir-processors" for t in threading.enumerate())
+
+        nr = nornir.with_processors([MockProcessor({})], background=True)
+        for _ in range(3):
+            nr.run(task=mock_task)
+            assert threads() == 0
+        nr.processors.task_started(Task(mock_task))
+        assert threads() == 1
+        with nr:
+            pass
+        assert threads() == 0
+
+    def test_background_processor_errors(self, nornir: Nornir, caplog) -> None:
+        class FailingProcessor(MockProcessor):
+            def task_instance_started(self, task: Task, host: Host) -> None:
+                raise Exception("processor failed")
+
+        data: Dict[str, Any] = {}
+        nr = nornir.with_processors([FailingProcessor(data)], background=True)
+        result = nr.run(task=mock_task)
+        assert set(result.failed_hosts) == {"dev3.group_2"}
+        assert data["mock_task"]["completed"]
+        assert "processor failed" in caplog.text
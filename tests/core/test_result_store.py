@@ -0,0 +1,148 @@
+import pickle
+
+from nornir.core import Nornir
+from nornir.core.deserializer.configuration import Config as ConfigDeserializer
+from nornir.core.result_store import ResultStore, SpilledPayload
+from nornir.core.task import AggregatedResult, MultiResult, Result
+
+import pytest
+
+
+def backup(task):
+    return "{}\n".format(task.host.name) * 1000
+
+
+def small(task):
+    return "ok"
+
+
+async def async_backup(task):
+    return backup(task)
+
+
+def multi_result(*results):
+    m = MultiResult("t")
+    for r in results:
+        m.append(r)
+    return m
+
+
+class Test(object):
+    def test_put_and_get(self, tmp_path):
+        store = ResultStore(str(tmp_path / "results"), threshold=10)
+        text = store.put("a" * 1000)
+        data = store.put(b"\x00" * 1000)
+        assert store.size < 1000
+        assert text.load() == "a" * 1000
+        assert data.load() == b"\x00" * 1000
+        with pytest.raises(ValueError):
+            ResultStore(threshold=0)
+
+    def test_spill(self):
+        store = ResultStore(threshold=10)
+        large = Result(host=None, result="a" * 100, diff="b" * 100)
+        nested = Result(host=None, result="c" * 100)
+        short = Result(host=None, result="short")
+        agg = AggregatedResult("t", store=store)
+        agg["h"] = multi_result(large, short, multi_result(nested))
+        assert isinstance(large._result, SpilledPayload)
+        assert isinstance(large._diff, SpilledPayload)
+        assert isinstance(nested._result, SpilledPayload)
+        assert short._result == "short"
+        assert large.result == "a" * 100
+        assert large.diff == "b" * 100
+        assert agg["h"][2][0].result == "c" * 100
+
+        # payloads are loaded when pickled
+        agg = pickle.loads(pickle.dumps(agg))
+        assert agg["h"][0]._result == "a" * 100
+
+    @pytest.mark.parametrize(
+        "task,runner",
+        [
+            (backup, "serial"),
+            (backup, "threaded"),
+            (async_backup, "asyncio"),
+            (backup, "process"),
+        ],
+    )
+    def test_run(self, nornir, task, runner):
+        config = ConfigDeserializer.deserialize(core={"result_store_threshold": 1000})
+        nr = Nornir(inventory=nornir.inventory, config=config, data=nornir.data)
+        assert nr.result_store is not None
+        result = nr.run(task, runner=runner)
+        for host, r in result.items():
+            assert isinstance(r[0]._result, SpilledPayload)
+            assert r.result == "{}\n".format(host) * 1000
+
+        result = nr.run(small)
+        assert result["dev1.group_1"][0]._result == "ok"
+
+    def test_run_pipeline(self, nornir):
+        nr = Nornir(
+            inventory=nornir.inventory,
+            config=nornir.config,
+            data=nornir.data,
+            result_store=ResultStore(threshold=1000),
+        )
+        results = nr.run_pipeline([backup, small])
+        r = results[0]["dev1.group_1"]
+        assert isinstance(r[0]._result, SpilledPayload)
+        assert r.result == "dev1.group_1\n" * 1000
+        assert results[1]["dev1.group_1"].result == "ok"
+
+    def test_run_process_file(self, nornir, tmp_path):
+        path = tmp_path / "results"
+        config = ConfigDeserializer.deserialize(
+            core={"result_store_threshold": 1000, "result_store_file": str(path)}
+        )
+        with Nornir(inventory=nornir.inventory, config=config, data=nornir.data) as nr:
+            first = nr.run(backup, runner="process")
+            second = nr.run(backup, runner="process")
+            for result in (first, second):
+                for host, r in result.items():
+                    assert isinstance(r[0]._result, SpilledPayload)
+                    assert r.result == "{}\n".format(host) * 1000
+
+    def test_file_opened_on_put(self, tmp_path):
+        path = tmp_path / "results"
+        path.write_bytes(b"owned by another store")
+        store = ResultStore(str(path), threshold=10)
+        assert path.read_bytes() == b"owned by another store"
+        store.close()
+        assert path.exists()
+
+    def test_disabled(self, nornir):
+        assert nornir.result_store is None
+        result = nornir.run(backup)
+        assert isinstance(result["dev1.group_1"][0]._result, str)
+
+    def test_space_is_reused(self, tmp_path):
+        store = ResultStore(str(tmp_path / "results"), threshold=10)
+        payloads = [store.put(str(i) * 10000) for i in range(10)]
+        size = store.size
+        del payloads[2:5]
+        for _ in range(3):
+            payloads.append(store.put("x" * 10000))
+        assert store.size == size
+        assert [p.load()[0] for p in payloads] == list("0156789xxx")
+
+        del payloads[:]
+        store.put("y" * 10000)
+        assert store.size < size
+
+    def test_close(self, nornir, tmp_path):
+        path = tmp_path / "results"
+        config = ConfigDeserializer.deserialize(
+            core={"result_store_threshold": 1000, "result_store_file": str(path)}
+        )
+        with Nornir(inventory=nornir.inventory, config=config, data=nornir.data) as nr:
+            result = nr.run(backup)
+            assert path.exists()
+        assert not path.exists()
+        with pytest.raises(ValueError):
+            result["dev1.group_1"].result
+
+        result = nr.run(backup)
+        assert result["dev1.group_1"].result == "dev1.group_1\n" * 1000
+        nr.result_store.close()
@@ -0,0 +1,113 @@
+import pickle
+
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, MultiResult, Result
+
+
+def version(task):
+    return "".join(["15.2", "(4)M7"])
+
+
+class Test(object):
+    def test_result_slots(self):
+        r = Result(host=None, result="ok")
+        assert r.__dict__ == {}
+        assert r.stdout is None and r.stderr is None
+        assert r.attempts == 1
+        assert not hasattr(MultiResult("t"), "__dict__")
+
+    def test_result_extra_attributes(self):
+        r = Result(host=None, result="ok", stdout="out", response="response")
+        assert r.stdout == "out"
+        assert r.response == "response"
+        r.other = 1
+        assert r.other == 1
+
+    def test_result_payloads_interned(self, nornir):
+        result = nornir.run(version)
+        payloads = [r.result for r in result.values()]
+        assert all(p is payloads[0] for p in payloads)
+
+        a = Result(host=None, result="".join(["a", "b"]))
+        b = Result(host=None, result="".join(["a", "b"]))
+        assert a.result is b.result
+
+        facts = ["".join(["a", "b"])]
+        payload = {"facts": facts}
+        assert Result(host=None, result=payload).result is payload
+        assert payload["facts"] is facts
+        assert facts[0] is not a.result
+
+    def test_result_pickle(self):
+        r = Result(host=Host(name="h"), result="ok", changed=True, response="r")
+        r.name = "t"
+        m = MultiResult("t")
+        m.append(r)
+        m = pickle.loads(pickle.dumps(m))
+        assert m.name == "t"
+        assert m[0].host.name == "h"
+        assert (m[0].result, m[0].changed, m[0].response) == ("ok", True, "r")
+
+    def test_multi_result_counters(self):
+        ok = Result(host=None, result="ok")
+        failed = Result(host=None, failed=True)
+        changed = Result(host=None, changed=True)
+        m = MultiResult("t")
+        m.append(ok)
+        assert not m.failed and not m.changed
+        m.insert(0, failed)
+        m.extend([changed])
+        assert m.failed and m.changed
+        m.remove(failed)
+        assert not m.failed and m.changed
+        m[1] = ok
+        assert not m.changed
+        m += [failed]
+        assert m.failed
+        del m[-1]
+        assert not m.failed
+        m.append(failed)
+        assert m.pop() is failed
+        assert not m.failed
+
+        outer = MultiResult("outer")
+        outer.append(ok)
+        outer.append(m)
+        assert not outer.failed
+        m2 = MultiResult("failed")
+        m2.append(failed)
+        outer.append(m2)
+        assert outer.failed
+
+    def test_aggregated_result_failed_hosts(self):
+        ok = MultiResult("t")
+        ok.append(Result(host=None, result="ok"))
+        failed = MultiResult("t")
+        failed.append(Result(host=None, failed=True))
+        a = AggregatedResult("t")
+        a["h1"] = ok
+        assert not a.failed and a.failed_hosts == {}
+        a.update({"h2": failed, "h3": failed})
+        assert a.failed and list(a.failed_hosts) == ["h2", "h3"]
+        a["h2"] = ok
+        assert list(a.failed_hosts) == ["h3"]
+        a.pop("h3")
+        assert not a.failed
+        a.setdefault("h4", failed)
+        assert list(a.failed_hosts) == ["h4"]
+        a = pickle.loads(pickle.dumps(a))
+        assert a.name == "t" and list(a) == ["h1", "h2", "h4"]
+        assert list(a.failed_hosts) == ["h4"]
+        a.clear()
+        assert not a.failed
+
+    def test_run_failed_hosts(self, nornir):
+        def fail_dev1(task):
+            if task.host.name == "dev1.group_1":
+                raise Exception()
+
+        result = nornir.run(fail_dev1)
+        assert result.failed
+        assert list(result.failed_hosts) == ["dev1.group_1"]
+        assert result["dev1.group_1"].failed
+        assert not result["dev2.group_1"].failed
@@ -0,0 +1,146 @@
+import asyncio
+from collections import Counter
+
+from nornir.core.exceptions import NornirSubTaskError, NornirTimeoutError
+from nornir.core.retry import RetryPolicy
+
+import pytest
+
+NO_WAIT = dict(backoff=0, jitter=False)
+
+
+def flaky_task(failures, exception=ConnectionResetError):
+    """Returns a task that fails ``failures`` times on each host before succeeding"""
+    calls = Counter()
+
+    def flaky(task):
+        calls[task.host.name] += 1
+        if calls[task.host.name] <= failures:
+            raise exception(task.host.name)
+        return task.host.name
+
+    flaky.calls = calls
+    return flaky
+
+
+def grouped(task, flaky):
+    task.run(flaky)
+    return "done"
+
+
+class FakeConnection(object):
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def use_connection(task, connections):
+    conn = task.host.connections.get("fake")
+    if conn is None:
+        conn = task.host.connections["fake"] = FakeConnection()
+        connections.append(conn)
+    if len(connections) == 1:
+        raise ConnectionResetError("reset")
+    return len(connections)
+
+
+class Test(object):
+    def test_retry_recovers(self, nornir):
+        flaky = flaky_task(2)
+        result = nornir.run(flaky, retry=RetryPolicy(max_attempts=3, **NO_WAIT))
+        assert not result.failed
+        for host, r in result.items():
+            assert r.result == host
+            assert r[0].attempts == 3
+            assert len(r) == 1
+
+    def test_retry_gives_up(self, nornir):
+        flaky = flaky_task(5)
+        result = nornir.run(flaky, retry=RetryPolicy(max_attempts=2, **NO_WAIT))
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+        assert all(r[0].attempts == 2 for r in result.values())
+        assert all(c == 2 for c in flaky.calls.values())
+
+    def test_retry_on(self, nornir):
+        flaky = flaky_task(1, exception=ValueError)
+        retry = RetryPolicy(retry_on=(ConnectionError,), **NO_WAIT)
+        result = nornir.run(flaky, retry=retry)
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+        assert all(r[0].attempts == 1 for r in result.values())
+
+    def test_no_retry_by_default(self, nornir):
+        flaky = flaky_task(1)
+        result = nornir.run(flaky)
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+        assert all(r[0].attempts == 1 for r in result.values())
+
+    def test_retry_subtask_failures(self, nornir):
+        flaky = flaky_task(1)
+        retry = RetryPolicy(retry_on=(ConnectionResetError,), **NO_WAIT)
+        result = nornir.run(grouped, flaky=flaky, retry=retry)
+        assert not result.failed
+        for r in result.values():
+            # the subtasks of the failed attempt are discarded
+            assert len(r) == 2
+            assert r[0].attempts == 2
+            assert r[1].attempts == 1
+
+    def test_retry_subtask(self, nornir):
+        def grouped_with_retry(task):
+            task.run(flaky, retry=RetryPolicy(**NO_WAIT))
+
+        flaky = flaky_task(1)
+        result = nornir.run(grouped_with_retry)
+        assert not result.failed
+        assert all(r[1].attempts == 2 for r in result.values())
+
+    def test_retry_asyncio(self, nornir):
+        calls = Counter()
+
+        async def flaky(task):
+            await asyncio.sleep(0)
+            calls[task.host.name] += 1
+            if calls[task.host.name] == 1:
+                raise ConnectionResetError()
+
+        result = nornir.run(flaky, retry=RetryPolicy(**NO_WAIT))
+        assert not result.failed
+        assert all(r[0].attempts == 2 for r in result.values())
+
+    def test_retry_reset_connections(self, nornir):
+        nr = nornir.filter(name="dev1.group_1")
+        connections = []
+        retry = RetryPolicy(reset_connections=True, **NO_WAIT)
+        result = nr.run(use_connection, connections=connections, retry=retry)
+        # the connection was closed and opened again after the first attempt
+        assert result["dev1.group_1"].result == 2
+        assert connections[0].closed
+        assert not connections[1].closed
+        nr.inventory.hosts["dev1.group_1"].connections.pop("fake")
+
+    def test_retry_stops_at_deadline(self, nornir):
+        flaky = flaky_task(5)
+        retry = RetryPolicy(max_attempts=5, backoff=1, jitter=False)
+        result = nornir.run(flaky, retry=retry, task_timeout=0.5)
+        assert all(r[0].attempts == 1 for r in result.values())
+
+    def test_policy(self):
+        retry = RetryPolicy(backoff=1, multiplier=2, max_backoff=5, jitter=False)
+        assert [retry.delay(a) for a in range(1, 5)] == [1, 2, 4, 5]
+        retry = RetryPolicy(backoff=4, jitter=True)
+        assert all(2 <= retry.delay(1) <= 4 for _ in range(100))
+        assert not retry.should_retry(NornirTimeoutError(), 1)
+        assert not retry.should_retry(Exception(), 3)
+        assert retry.should_retry(Exception(), 2)
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_policy_subtask_error(self, nornir):
+        retry = RetryPolicy(retry_on=(ConnectionError,))
+        result = nornir.run(flaky_task(1))["dev1.group_1"]
+        assert retry.should_retry(NornirSubTaskError(task=None, result=result), 1)
+        nornir.data.reset_failed_hosts()
+        result = nornir.run(flaky_task(1, exception=ValueError))["dev1.group_1"]
+        assert not retry.should_retry(NornirSubTaskError(task=None, result=result), 1)
@@ -0,0 +1,91 @@
+import time
+
+from nornir.core.task import AggregatedResult
+
+SLOW_HOST = "dev1.group_1"
+
+
+def slow_for_one(task):
+    if task.host.name == SLOW_HOST:
+        time.sleep(1)
+    return task.host.name
+
+
+def failing_for_some(task):
+    if task.host.name == "dev3.group_2":
+        raise Exception("failed!")
+    return task.host.name
+
+
+class CompletedProcessor:
+    def __init__(self):
+        self.completed = None
+
+    def task_started(self, task):
+        pass
+
+    def task_completed(self, task, result):
+        self.completed = result
+
+    def task_instance_started(self, task, host):
+        pass
+
+    def task_instance_completed(self, task, host, result):
+        pass
+
+    def subtask_instance_started(self, task, host):
+        pass
+
+    def subtask_instance_completed(self, task, host, result):
+        pass
+
+
+class Test(object):
+    def test_run_iter_completion_order(self, nornir):
+        t1 = time.time()
+        order = []
+        for host, r in nornir.run_iter(slow_for_one, num_workers=5):
+            assert r.result == host.name
+            assert r.host is host
+            order.append((host.name, time.time() - t1))
+        assert len(order) == len(nornir.inventory.hosts)
+        assert order[-1][0] == SLOW_HOST
+        assert all(elapsed < 0.5 for _, elapsed in order[:-1])
+
+    def test_run_iter_serial(self, nornir):
+        names = [h.name for h, _ in nornir.run_iter(slow_for_one, num_workers=1)]
+        assert names == list(nornir.inventory.hosts)
+
+    def test_run_iter_bounded(self, nornir):
+        started = []
+
+        def record(task):
+            started.append(task.host.name)
+
+        results = nornir.run_iter(record, num_workers=2)
+        next(results)
+        results.close()
+        assert 2 <= len(started) < len(nornir.inventory.hosts)
+
+    def test_run_iter_failed(self, nornir):
+        processor = CompletedProcessor()
+        nr = nornir.with_processors([processor])
+        results = dict(nr.run_iter(failing_for_some))
+        assert len(results) == len(nornir.inventory.hosts)
+        assert nornir.data.failed_hosts == {"dev3.group_2"}
+        assert isinstance(processor.completed, AggregatedResult)
+        assert list(processor.completed) == ["dev3.group_2"]
+
+    def test_run_iter_stopped(self, nornir):
+        processor = CompletedProcessor()
+        nr = nornir.with_processors([processor])
+        results = nr.run_iter(failing_for_some, num_workers=1)
+        next(results)
+        assert processor.completed is None
+        results.close()
+        assert isinstance(processor.completed, AggregatedResult)
+
+        processor.completed = None
+        for host, r in nr.run_iter(slow_for_one, num_workers=5):
+            break
+        assert isinstance(processor.completed, AggregatedResult)
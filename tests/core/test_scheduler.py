@@ -0,0 +1,218 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+
+from nornir.core import Nornir
+from nornir.core.inventory import Group, Groups, Host, Hosts, Inventory, ParentGroups
+from nornir.core.scheduler import ConcurrencyLimits, Scheduler, batches
+
+import pytest
+
+
+class Tracker(object):
+    def __init__(self, attr):
+        self.attr = attr
+        self.lock = threading.Lock()
+        self.running = defaultdict(int)
+        self.max_running = defaultdict(int)
+
+    def start(self, host):
+        with self.lock:
+            value = host.get(self.attr)
+            self.running[value] += 1
+            self.max_running[value] = max(self.max_running[value], self.running[value])
+
+    def stop(self, host):
+        with self.lock:
+            self.running[host.get(self.attr)] -= 1
+
+
+def tracked_task(task, tracker):
+    tracker.start(task.host)
+    time.sleep(0.05)
+    tracker.stop(task.host)
+
+
+async def async_tracked_task(task, tracker):
+    tracker.start(task.host)
+    await asyncio.sleep(0.05)
+    tracker.stop(task.host)
+
+
+def build_nornir(nornir):
+    groups = Groups({"site1": Group(name="site1"), "site2": Group(name="site2")})
+    hosts = Hosts()
+    for i in range(40):
+        hosts[f"h{i}"] = Host(
+            name=f"h{i}",
+            platform="ios" if i % 4 else "junos",
+            groups=ParentGroups([f"site{i % 2 + 1}"]),
+            data={"site": f"site{i % 2 + 1}"},
+        )
+    inventory = Inventory(hosts=hosts, groups=groups)
+    return Nornir(inventory=inventory, config=nornir.config)
+
+
+class Test(object):
+    def test_limits_keys(self, nornir):
+        limits = ConcurrencyLimits({"platform": 2, "groups": 3, "site": {"site1": 1}})
+        host = nornir.inventory.hosts["dev1.group_1"]
+        assert limits.keys(host) == (
+            ("groups", "group_1"),
+            ("groups", "parent_group"),
+            ("platform", "eos"),
+            ("site", "site1"),
+        )
+        assert limits.limit(("platform", "eos")) == 2
+        assert limits.limit(("site", "site1")) == 1
+        host = nornir.inventory.hosts["dev3.group_2"]
+        assert ("site", "site2") not in limits.keys(host)
+
+    def test_limits_validation(self):
+        with pytest.raises(ValueError):
+            ConcurrencyLimits({"platform": 0})
+        with pytest.raises(ValueError):
+            ConcurrencyLimits({"platform": {"ios": 0}})
+
+    def test_scheduler(self, nornir):
+        nr = build_nornir(nornir)
+        hosts = list(nr.inventory.hosts.values())
+        scheduler = Scheduler(hosts, ConcurrencyLimits({"platform": {"junos": 1}}))
+        assert len(scheduler) == 40
+        assert scheduler.next().name == "h0"
+        assert scheduler.next().name == "h1"
+        # h4 is junos and h0 is still running
+        assert [scheduler.next().name for _ in range(3)] == ["h2", "h3", "h5"]
+        scheduler.done(hosts[0])
+        assert scheduler.next().name == "h4"
+
+    def test_scheduler_blocked(self, nornir):
+        nr = build_nornir(nornir)
+        hosts = [h for h in nr.inventory.hosts.values() if h.platform == "junos"]
+        scheduler = Scheduler(hosts, ConcurrencyLimits({"platform": 1}))
+        assert scheduler.next() is hosts[0]
+        assert scheduler.next() is None
+        scheduler.done(hosts[0])
+        assert scheduler.next() is hosts[1]
+
+    def test_scheduler_no_limits(self, nornir):
+        hosts = list(nornir.inventory.hosts.values())
+        scheduler = Scheduler(hosts)
+        assert [scheduler.next() for _ in hosts] == hosts
+        assert scheduler.next() is None
+
+    def test_run_concurrency_limits(self, nornir):
+        nr = build_nornir(nornir)
+        tracker = Tracker("platform")
+        r = nr.run(
+            tracked_task,
+            tracker=tracker,
+            num_workers=20,
+            concurrency_limits={"platform": {"junos": 2}},
+        )
+        assert len(r) == 40
+        assert not r.failed
+        assert tracker.max_running["junos"] == 2
+        assert tracker.max_running["ios"] > 2
+
+    def test_run_concurrency_limits_groups(self, nornir):
+        nr = build_nornir(nornir)
+        tracker = Tracker("site")
+        r = nr.run(
+            tracked_task,
+            tracker=tracker,
+            num_workers=20,
+            concurrency_limits={"groups": 3},
+        )
+        assert len(r) == 40
+        assert tracker.max_running == {"site1": 3, "site2": 3}
+
+    def test_run_concurrency_limits_asyncio(self, nornir):
+        nr = build_nornir(nornir)
+        tracker = Tracker("platform")
+        r = nr.run(
+            async_tracked_task,
+            tracker=tracker,
+            num_workers=20,
+            concurrency_limits={"platform": 3},
+        )
+        assert len(r) == 40
+        assert tracker.max_running == {"ios": 3, "junos": 3}
+
+    def test_run_iter_concurrency_limits(self, nornir):
+        nr = build_nornir(nornir)
+        tracker = Tracker("platform")
+        results = list(
+            nr.run_iter(
+                tracked_task, tracker=tracker, concurrency_limits={"platform": 1}
+            )
+        )
+        assert len(results) == 40
+        assert tracker.max_running == {"ios": 1, "junos": 1}
+
+
+def fail_on(task, failing):
+    if task.host.name in failing:
+        raise Exception("failed")
+    return task.host.name
+
+
+class TestBatches(object):
+    def test_batches(self):
+        hosts = [Host(name=f"h{i}") for i in range(10)]
+        assert [len(b) for b in batches(hosts, 3)] == [3, 3, 3, 1]
+        assert [len(b) for b in batches(hosts, "25%")] == [3, 3, 3, 1]
+        assert [len(b) for b in batches(hosts, [1, "20%", 5])] == [1, 2, 5, 2]
+        assert [h for b in batches(hosts, 4) for h in b] == hosts
+        with pytest.raises(ValueError):
+            list(batches(hosts, 0))
+        with pytest.raises(ValueError):
+            list(batches(hosts, []))
+        assert list(batches([], "25%")) == []
+        assert list(batches([], [1, "10%"])) == []
+
+    def test_run_in_batches(self, nornir):
+        # hosts don't have "role" so they are all tracked together
+        tracker = Tracker("role")
+        nr = build_nornir(nornir)
+        result = nr.run(tracked_task, tracker=tracker, batch_size=10, num_workers=20)
+        assert list(result) == list(nr.inventory.hosts)
+        assert tracker.max_running[None] == 10
+
+    def test_run_in_batches_no_hosts(self, nornir):
+        tracker = Tracker("role")
+        nr = build_nornir(nornir)
+        empty = nr.filter(filter_func=lambda h: False)
+        result = empty.run(tracked_task, tracker=tracker, batch_size="25%")
+        assert len(result) == 0
+
+        nr.data.failed_hosts.update(nr.inventory.hosts)
+        try:
+            result = nr.run(tracked_task, tracker=tracker, batch_size="25%")
+        finally:
+            nr.data.reset_failed_hosts()
+        assert len(result) == 0
+        assert not tracker.max_running
+
+    def test_max_fail_percentage(self, nornir):
+        nr = build_nornir(nornir)
+        hosts = list(nr.inventory.hosts)
+        failing = {hosts[1], hosts[12], hosts[15], hosts[16]}
+        result = nr.run(fail_on, failing=failing, batch_size=10, max_fail_percentage=20)
+        # the second batch has 3 failures out of 10 hosts, the rest aren't run
+        assert list(result) == hosts[:20]
+        assert set(result.failed_hosts) == failing
+        assert nr.data.failed_hosts == failing
+
+    def test_max_fail_percentage_healthy(self, nornir):
+        nr = build_nornir(nornir)
+        hosts = list(nr.inventory.hosts)
+        result = nr.run(
+            fail_on,
+            failing={hosts[10], hosts[11]},
+            batch_size=["10%", "50%"],
+            max_fail_percentage=20,
+        )
+        assert list(result) == hosts
+        assert len(result.failed_hosts) == 2
@@ -1,6 +1,7 @@
 import logging
 
 from nornir.core.exceptions import CommandError, NornirSubTaskError
+from nornir.core.task import LazyTraceback
 
 from nornir.plugins.tasks import commands
 
@@ -147,3 +148,39 @@ class Test(object):
         assert not r["dev1.group_1"][0].exception
         assert r["dev1.group_1"][0].result == "I captured this succcessfully"
         assert r["dev1.group_1"][1].exception.__class__ is CommandError
+
+    def test_failed_task_traceback_is_lazy(self, nornir):
+        def fail(task):
+            raise ValueError("boom")
+
+        r = nornir.filter(name="dev1.group_1").run(fail)["dev1.group_1"][0]
+        assert isinstance(r._result, LazyTraceback)
+        assert r.result.startswith("Traceback (most recent call last)")
+        assert r.result.endswith("ValueError: boom\n")
+        assert r._result is r.result
+
+    def test_aggregate_errors(self, nornir, caplog):
+        def refuse(task):
+            if task.host.name != "dev5.no_group":
+                raise ConnectionRefusedError("refused")
+            task.run(commands.command, command="sasdasdasd")
+
+        nornir.config.core.aggregate_errors = True
+        try:
+            with caplog.at_level(logging.DEBUG, logger="nornir"):
+                nornir.run(refuse)
+        finally:
+            nornir.config.core.aggregate_errors = False
+        errors = [r.getMessage() for r in caplog.records if r.levelno >= logging.ERROR]
+        assert len(errors) == 2
+        assert errors[0] == (
+            "Task 'refuse' failed on 4 hosts with ConnectionRefusedError: refused\n"
+            "Hosts: dev1.group_1, dev2.group_1, dev3.group_2, dev4.group_2"
+        )
+        assert errors[1].startswith(
+            "Task 'refuse' failed on 1 hosts with FileNotFoundError"
+        )
+        assert errors[1].endswith("Hosts: dev5.no_group")
+        # tracebacks of each host are still there when debugging
+        debug = [r for r in caplog.records if r.levelno == logging.DEBUG]
+        assert any("failed with traceback" in r.getMessage() for r in debug)
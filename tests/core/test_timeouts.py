@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+
+from nornir.core.exceptions import NornirSubTaskError, NornirTimeoutError
+from nornir.core.pool import WorkerPool
+from nornir.core.task import Task
+from nornir.core.timing import TimingStore
+
+SLOW_HOST = "dev1.group_1"
+
+
+def slow_for_one(task, duration=1):
+    if task.host.name == SLOW_HOST:
+        time.sleep(duration)
+    return task.host.name
+
+
+def sleep(task, duration):
+    time.sleep(duration)
+    return task.host.name
+
+
+async def async_slow_for_one(task):
+    if task.host.name == SLOW_HOST:
+        await asyncio.sleep(5)
+    return task.host.name
+
+
+def sleep_then_subtask(task):
+    time.sleep(0.3)
+    task.run(slow_for_one)
+
+
+def subtask_with_timeout(task):
+    task.run(sleep_then_subtask, task_timeout=0.1)
+
+
+def remaining_time(task):
+    return task.remaining_time()
+
+
+class Events(object):
+    def __init__(self):
+        self.events = []
+
+    def task_started(self, task):
+        pass
+
+    def task_completed(self, task, result):
+        pass
+
+    def task_instance_started(self, task, host):
+        self.events.append(("started", host.name))
+
+    def task_instance_completed(self, task, host, result):
+        self.events.append(("completed", host.name, result.failed))
+
+    def subtask_instance_started(self, task, host):
+        self.events.append(("subtask_started", host.name))
+
+    def subtask_instance_completed(self, task, host, result):
+        self.events.append(("subtask_completed", host.name, result.failed))
+
+
+class Test(object):
+    def test_task_timeout_threaded(self, nornir):
+        t1 = time.time()
+        result = nornir.run(slow_for_one, task_timeout=0.2, num_workers=2, duration=2)
+        assert time.time() - t1 < 1
+        assert list(result.failed_hosts) == [SLOW_HOST]
+        assert isinstance(result[SLOW_HOST].exception, NornirTimeoutError)
+        assert nornir.data.failed_hosts == {SLOW_HOST}
+        for host, r in result.items():
+            if host != SLOW_HOST:
+                assert r.result == host
+
+    def test_task_timeout_frees_worker(self, nornir):
+        nr = nornir.filter(filter_func=lambda h: h.name != "dev5.no_group")
+        t1 = time.time()
+        result = nr.run(
+            sleep, task_timeout=0.2, num_workers=1, runner="threaded", duration=1
+        )
+        # with one worker hosts would take 4s if the worker wasn't replaced
+        assert time.time() - t1 < 2
+        assert set(result.failed_hosts) == set(nr.inventory.hosts)
+
+    def test_run_timeout_partial_results(self, nornir):
+        t1 = time.time()
+        result = nornir.run(
+            sleep, run_timeout=0.45, num_workers=2, runner="threaded", duration=0.3
+        )
+        assert time.time() - t1 < 1
+        # the first two hosts complete, the next two time out and the last one
+        # isn't started
+        assert list(result) == list(nornir.inventory.hosts)[:4]
+        assert set(result.failed_hosts) == {"dev3.group_2", "dev4.group_2"}
+
+    def test_run_timeout_running_hosts(self, nornir):
+        result = nornir.run(slow_for_one, run_timeout=0.2, duration=2)
+        assert len(result) == len(nornir.inventory.hosts)
+        assert list(result.failed_hosts) == [SLOW_HOST]
+        assert isinstance(result[SLOW_HOST].exception, NornirTimeoutError)
+
+    def test_run_timeout_serial(self, nornir):
+        result = nornir.run(sleep, run_timeout=0.3, num_workers=1, duration=0.2)
+        assert len(result) == 2
+
+    def test_task_timeout_asyncio(self, nornir):
+        t1 = time.time()
+        result = nornir.run(async_slow_for_one, task_timeout=0.2)
+        assert time.time() - t1 < 1
+        assert list(result.failed_hosts) == [SLOW_HOST]
+        assert isinstance(result[SLOW_HOST].exception, NornirTimeoutError)
+
+    def test_timeout_events_threaded(self, nornir):
+        events = Events()
+        nr = nornir.with_processors([events])
+        nr.timings = TimingStore()
+        nr.run(slow_for_one, task_timeout=0.1, num_workers=2, duration=0.3)
+        # the abandoned thread completes the task after the run is done
+        time.sleep(0.4)
+        slow = [e for e in events.events if e[1] == SLOW_HOST]
+        assert slow == [("started", SLOW_HOST), ("completed", SLOW_HOST, True)]
+        assert nr.timings.expected(slow_for_one.__name__, SLOW_HOST) is None
+
+    def test_timeout_events_asyncio(self, nornir):
+        events = Events()
+        nornir.with_processors([events]).run(async_slow_for_one, task_timeout=0.1)
+        slow = [e for e in events.events if e[1] == SLOW_HOST]
+        assert slow == [("started", SLOW_HOST), ("completed", SLOW_HOST, True)]
+
+    def test_late_completion_serial(self, nornir):
+        events = Events()
+        nr = nornir.with_processors([events])
+        result = nr.run(slow_for_one, task_timeout=0.1, num_workers=1, duration=0.2)
+        assert list(result.failed_hosts) == [SLOW_HOST]
+        assert isinstance(result[SLOW_HOST].exception, NornirTimeoutError)
+        slow = [e for e in events.events if e[1] == SLOW_HOST]
+        assert slow == [("started", SLOW_HOST), ("completed", SLOW_HOST, True)]
+
+    def test_late_completion_process(self, nornir):
+        result = nornir.run(
+            slow_for_one, task_timeout=0.1, runner="process", duration=0.2
+        )
+        assert list(result.failed_hosts) == [SLOW_HOST]
+        assert isinstance(result[SLOW_HOST].exception, NornirTimeoutError)
+
+    def test_late_completion_sync_task_asyncio(self, nornir):
+        result = nornir.run(
+            slow_for_one, task_timeout=0.1, runner="asyncio", duration=0.2
+        )
+        assert list(result.failed_hosts) == [SLOW_HOST]
+        assert isinstance(result[SLOW_HOST].exception, NornirTimeoutError)
+
+    def test_timed_out_after_completion(self, nornir):
+        events = Events()
+        nr = nornir.with_processors([events])
+        host = nr.inventory.hosts[SLOW_HOST]
+        task = Task(slow_for_one, duration=0)
+        result = task.start(host, nr)
+        assert task._timed_out(host, nr) is result
+        assert not result.failed
+        assert events.events == [
+            ("started", SLOW_HOST),
+            ("completed", SLOW_HOST, False),
+        ]
+
+    def test_deadline_propagates_to_subtasks(self, nornir):
+        result = nornir.run(sleep_then_subtask, task_timeout=0.1, num_workers=1)
+        assert set(result.failed_hosts) == set(nornir.inventory.hosts)
+        for r in result.values():
+            assert isinstance(r.exception, NornirTimeoutError)
+
+    def test_subtask_timeout(self, nornir):
+        result = nornir.run(subtask_with_timeout, num_workers=1)
+        for r in result.values():
+            assert isinstance(r[0].exception, NornirSubTaskError)
+            assert isinstance(r[1].exception, NornirTimeoutError)
+
+    def test_remaining_time(self, nornir):
+        result = nornir.run(remaining_time, task_timeout=10)
+        assert all(0 < r.result <= 10 for r in result.values())
+        result = nornir.run(remaining_time)
+        assert all(r.result is None for r in result.values())
+
+    def test_pool_abandon(self):
+        pool = WorkerPool(1)
+        event = threading.Event()
+        stuck = pool.submit(event.wait)
+        time.sleep(0.1)
+        pool.abandon(stuck)
+        assert pool.submit(lambda: 1).result(timeout=1) == 1
+        event.set()
+        assert stuck.result(timeout=1) is True
+        pool.shutdown()
@@ -0,0 +1,105 @@
+import os
+import time
+
+from nornir.core import Nornir
+from nornir.core.exceptions import NornirExecutionError
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.timing import TimingStore
+
+import pytest
+
+DURATIONS = {"h0": 0.05, "h1": 0.3, "h2": 0.05, "h3": 0.1}
+
+
+def sleep_for_host(task, started):
+    started.append(task.host.name)
+    time.sleep(DURATIONS[task.host.name])
+    return task.host.name
+
+
+def build_nornir(nornir, timings):
+    hosts = Hosts({name: Host(name=name) for name in DURATIONS})
+    return Nornir(
+        inventory=Inventory(hosts=hosts), config=nornir.config, timings=timings
+    )
+
+
+class Test(object):
+    def test_record(self):
+        store = TimingStore(smoothing=0.5)
+        assert store.expected("t", "h") is None
+        store.record("t", "h", 2)
+        assert store.expected("t", "h") == 2
+        store.record("t", "h", 4)
+        assert store.expected("t", "h") == 3
+        with pytest.raises(ValueError):
+            TimingStore(smoothing=0)
+
+    def test_longest_first(self):
+        store = TimingStore()
+        store.record("t", "fast", 1)
+        store.record("t", "slow", 10)
+        hosts = [Host(name=n) for n in ("fast", "slow", "new")]
+        assert [h.name for h in sorted(hosts, key=store.longest_first("t"))] == [
+            "new",
+            "slow",
+            "fast",
+        ]
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "timings.json")
+        store = TimingStore(path)
+        store.record("t", "h", 1.5)
+        store.save()
+        assert TimingStore(path).expected("t", "h") == 1.5
+        assert os.listdir(str(tmp_path)) == ["timings.json"]
+
+    def test_run_records_timings(self, nornir):
+        nr = build_nornir(nornir, TimingStore())
+        nr.run(sleep_for_host, started=[])
+        for name, duration in DURATIONS.items():
+            assert (
+                duration <= nr.timings.expected("sleep_for_host", name) < 0.2 + duration
+            )
+
+    def test_failed_hosts_not_recorded(self, nornir):
+        def fail(task):
+            raise Exception()
+
+        nornir.run(fail)
+        assert nornir.timings.expected("fail", "dev1.group_1") is None
+
+    def test_longest_first_run(self, nornir):
+        nr = build_nornir(nornir, TimingStore())
+        started = []
+        nr.run(sleep_for_host, started=started, num_workers=2)
+        assert started[:2] == ["h0", "h1"]
+
+        started.clear()
+        result = nr.run(
+            sleep_for_host, started=started, num_workers=2, longest_first=True
+        )
+        assert started[:2] == ["h1", "h3"]
+        # results are still in inventory order
+        assert list(result) == list(DURATIONS)
+
+        started.clear()
+        nr.run(sleep_for_host, started=started, longest_first=True, runner="asyncio")
+        assert started[:2] == ["h1", "h3"]
+
+    def test_timing_file(self, nornir, tmp_path):
+        path = str(tmp_path / "timings.json")
+        nr = build_nornir(nornir, TimingStore(path))
+        nr.run(sleep_for_host, started=[])
+        assert TimingStore(path).expected("sleep_for_host", "h1") >= 0.3
+
+    def test_timing_file_raise_on_error(self, nornir, tmp_path):
+        def fail_h1(task):
+            if task.host.name == "h1":
+                raise Exception()
+
+        path = str(tmp_path / "timings.json")
+        nr = build_nornir(nornir, TimingStore(path))
+        with pytest.raises(NornirExecutionError):
+            nr.run(fail_h1, raise_on_error=True)
+        assert TimingStore(path).expected("fail_h1", "h0") is not None